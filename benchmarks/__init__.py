@@ -0,0 +1,38 @@
+"""
+Benchmarks; Top-Level Module contains shared benchmarking utilities.
+"""
+import timeit
+from typing import Any, Callable, Iterable
+
+# Input sizes used when checking how a parser scales with its input.
+SCALING_SIZES = (1 << 17, 1 << 18, 1 << 19, 1 << 20)
+
+
+def measure(label: str, func: Callable[[], Any], number: int = 1000) -> float:
+    """
+    Prints and returns the best per-call time of `func` in microseconds.
+    """
+    best = min(timeit.repeat(func, number=number, repeat=5)) / number
+    micros = best * 1e6
+    print(f"{label:<48} {micros:>12.3f} us")
+    return micros
+
+
+def scaling(
+    label: str,
+    build: Callable[[int], Callable[[], Any]],
+    sizes: Iterable[int] = SCALING_SIZES,
+):
+    """
+    Prints the time taken by the callable produced by `build` for each input
+    size, along with the time per input element. A linear parser keeps the
+    per-element time roughly constant as the size grows.
+    """
+    for size in sizes:
+        func = build(size)
+        best = min(timeit.repeat(func, number=1, repeat=3))
+        per_element = best * 1e9 / size
+        print(
+            f"{label:<32} n={size:<10} {best * 1e3:>10.2f} ms "
+            f"{per_element:>8.1f} ns/el"
+        )
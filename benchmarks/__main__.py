@@ -0,0 +1,11 @@
+"""
+Runs every benchmark module.
+"""
+import importlib
+import pkgutil
+import benchmarks
+
+for module in pkgutil.iter_modules(benchmarks.__path__):
+    if module.name.startswith("bench_"):
+        print(f"== {module.name} ==")
+        importlib.import_module(f"benchmarks.{module.name}").main()
@@ -0,0 +1,42 @@
+"""
+Benchmarks of the binary number parsers, against unpacking sliced fields.
+"""
+import struct
+from benchmarks import measure
+from chew.binary import be_u32, records, unpack, varint
+from chew.combine import map_res
+from chew.cursor import Cursor
+from chew.generic import take
+from chew.repeat import count
+
+RECORDS = 1 << 10
+
+
+def main():
+    data = Cursor(struct.pack(">I", 0xDEADBEEF) * RECORDS)
+    sliced = map_res(take(4), lambda field: struct.unpack(">I", field)[0])
+    measure("map_res(take(4), struct.unpack)", lambda: sliced(data))
+    measure("be_u32", lambda: be_u32(data))
+
+    header = unpack("<HHIQ")
+    measure("unpack('<HHIQ')", lambda: header(data))
+
+    for value in [1, 300, 1 << 63]:
+        encoded = bytearray()
+        while True:
+            (value, low) = (value >> 7, value & 0x7F)
+            encoded.append(low | (0x80 if value else 0))
+            if not value:
+                break
+        encoding = Cursor(bytes(encoded))
+        measure(f"varint ({len(encoded)} bytes)", lambda: varint(encoding))
+
+    rows = Cursor(struct.pack("<IHh", 1, 2, -3) * RECORDS)
+    per_record = count(unpack("<IHh"), RECORDS)
+    measure(f"count(unpack('<IHh'), {RECORDS})", lambda: per_record(rows), 20)
+    bulk = records("<IHh", RECORDS)
+    measure(f"records('<IHh', {RECORDS})", lambda: bulk(rows), 20)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Benchmarks of `alt` and `tags` over many keyword alternatives.
+"""
+import itertools
+import string
+from benchmarks import measure
+from chew.branch import alt
+from chew.generic import tag, tags
+from chew.string import alpha1, tag_no_case
+
+KEYWORDS = """
+abort alter analyze attach begin cast commit create cross delete desc detach
+distinct drop each else end escape except exists explain fail from full glob group
+having ignore insert join limit match natural offset order pragma raise select
+update where
+""".split()
+
+
+def main():
+    keywords = alt([tag(keyword) for keyword in KEYWORDS])
+    # identifiers have no known first element, so they are tried on any input
+    statement = alt([tag(keyword) for keyword in KEYWORDS] + [alpha1])
+
+    # with dispatch, the position of the keyword barely matters
+    for keyword in ["abort", "insert", "where"]:
+        measure(f"alt(40 keywords) {keyword!r}", lambda k=keyword: keywords(k))
+    measure("alt(40 keywords, alpha1) 'zzz'", lambda: statement("zzz"))
+
+    # several hundred header names sharing a handful of first letters
+    headers = [
+        f"X-{a}{b}-Header".upper()
+        for (a, b) in itertools.product(string.ascii_lowercase[:20], repeat=2)
+    ]
+    header = headers[-1].lower() + ": value"
+    no_case = alt([tag_no_case(name) for name in headers])
+    measure("alt(400 tag_no_case)", lambda: no_case(header))
+    by_name = tags(headers, case_insensitive=True)
+    measure("tags(400, case_insensitive)", lambda: by_name(header))
+    exact = tags(headers)
+    measure("tags(400)", lambda: exact(headers[-1]))
+
+
+if __name__ == "__main__":
+    main()
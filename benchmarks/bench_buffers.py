@@ -0,0 +1,40 @@
+"""
+Benchmarks of the generic parsers over bytes-like buffers.
+"""
+from benchmarks import measure, scaling
+from chew.cursor import Cursor
+from chew.generic import tag, take, take_until
+
+KEYWORD = b"Content-Security-Policy: "
+
+
+def _run(parser, data):
+    return lambda: parser(data)
+
+
+def main():
+    header = tag(KEYWORD)
+    data = KEYWORD + b"default-src 'self'\r\n" * 64
+    measure("tag(25 bytes) bytes", lambda: header(data))
+    measure("tag(25 bytes) memoryview", _run(header, memoryview(data)))
+    measure("tag(25 bytes) Cursor", _run(header, Cursor(data)))
+    measure("tag(25 bytes) Cursor memoryview", _run(header, Cursor(memoryview(data))))
+    measure("tag(25 bytes) str", _run(tag(KEYWORD.decode()), data.decode()))
+
+    payload = take(1 << 16)
+    measure("take(64KiB) bytes", _run(payload, b"x" * (1 << 17)))
+    measure("take(64KiB) memoryview", _run(payload, memoryview(b"x" * (1 << 17))))
+
+    line = take_until(b"\r\n")
+    scaling(
+        "take_until memoryview",
+        lambda n: _run(line, memoryview(b"a" * n + b"\r\n")),
+    )
+    scaling(
+        "take_until Cursor memoryview",
+        lambda n: _run(line, Cursor(memoryview(b"a" * n + b"\r\n"))),
+    )
+
+
+if __name__ == "__main__":
+    main()
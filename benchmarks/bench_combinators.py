@@ -0,0 +1,44 @@
+"""
+Benchmarks over the existing combinators.
+"""
+from benchmarks import measure
+from chew.branch import alt
+from chew.combine import map_res, optional, recognize
+from chew.generic import is_a, is_not, tag, take_while_bounded
+from chew.literal import int_literal
+from chew.repeat import length_value, many0, many1_count, separated_list0
+from chew.sequence import delimited, pair, preceded, separated_pair, terminated
+from chew.string import alpha1, char, digit1, one_of, satisfy, tag_no_case
+
+
+def main():
+    parsers = [
+        ("tag", tag("hello"), "hello world"),
+        ("tag_no_case", tag_no_case("hello"), "HeLLo world"),
+        ("char", char("a"), "abc"),
+        ("satisfy", satisfy(str.isalpha), "abc"),
+        ("one_of", one_of("abc"), "bcd"),
+        ("is_a", is_a("0123456789"), "12345;"),
+        ("is_not", is_not(";"), "12345;"),
+        ("take_while_bounded", take_while_bounded(1, 4, str.isdigit), "12345"),
+        ("alt", alt([digit1, alpha1]), "abc"),
+        ("pair", pair(alpha1, digit1), "abc123"),
+        ("delimited", delimited(char("("), alpha1, char(")")), "(abc)"),
+        ("preceded", preceded(char("-"), digit1), "-123"),
+        ("terminated", terminated(digit1, char(";")), "123;"),
+        ("separated_pair", separated_pair(alpha1, char("="), digit1), "a=1"),
+        ("optional", optional(char("-")), "123"),
+        ("map_res", map_res(digit1, int), "123"),
+        ("recognize", recognize(pair(alpha1, digit1)), "abc123"),
+        ("many0", many0(terminated(alpha1, char(","))), "a,b,c,d,"),
+        ("many1_count", many1_count(char("a")), "aaaab"),
+        ("separated_list0", separated_list0(char(","), digit1), "1,2,3,4"),
+        ("length_value", length_value(int_literal, alpha1), "3abcdef"),
+    ]
+
+    for label, parser, data in parsers:
+        measure(label, lambda parser=parser, data=data: parser(data))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+"""
+Benchmarks for grammars dominated by failing branches.
+"""
+from benchmarks import measure
+from chew.branch import alt
+from chew.combine import optional
+from chew.generic import tag
+from chew.repeat import many0
+from chew.string import alpha1, digit1
+
+KEYWORDS = [f"keyword{i}" for i in range(20)]
+
+
+def main():
+    keyword = alt([tag(k) for k in KEYWORDS])
+    maybe_digits = optional(digit1)
+    tokens = many0(alt([digit1, alpha1]))
+
+    measure("alt over 20 tags (last matches)", lambda: keyword("keyword19 rest"))
+    measure("optional(digit1) miss", lambda: maybe_digits("abc"))
+    measure("many0(alt([digit1, alpha1]))", lambda: tokens("a1" * 50))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Benchmarks for ErrorKind remapping.
+"""
+from benchmarks import measure
+from chew.error import Error, ErrorKind, map_kind, with_kind
+from chew.generic import take
+from chew.literal import int_literal
+from chew.string import char, digit1
+
+
+def _caught(parser, sequence):
+    try:
+        return parser(sequence)
+    except Error as error:
+        return error
+
+
+def main():
+    char_a = char("a")
+    measure("digit1 (match)", lambda: digit1("12345;"))
+    measure("digit1 (miss)", lambda: _caught(digit1, ";12345"))
+    measure("char (match)", lambda: char_a("abc"))
+    measure("char (miss)", lambda: _caught(char_a, "xbc"))
+    measure("int_literal (match)", lambda: int_literal("12345;"))
+
+    # the same remapping expressed per call with the map_kind context-manager,
+    # and once at construction time with with_kind
+    take_one = take(1)
+    remapped = with_kind(take_one, ErrorKind.CHAR)
+
+    def per_call(sequence):
+        with map_kind(ErrorKind.CHAR):
+            return take_one(sequence)
+
+    measure("map_kind context-manager (match)", lambda: per_call("abc"))
+    measure("with_kind wrapper (match)", lambda: remapped("abc"))
+    measure("map_kind context-manager (miss)", lambda: _caught(per_call, ""))
+    measure("with_kind wrapper (miss)", lambda: _caught(remapped, ""))
+
+
+if __name__ == "__main__":
+    main()
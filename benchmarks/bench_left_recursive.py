@@ -0,0 +1,46 @@
+"""
+Benchmarks of `left_recursive` rules on long left associative chains.
+"""
+from benchmarks import scaling
+from chew.branch import alt
+from chew.cursor import Cursor
+from chew.memo import left_recursive
+from chew.repeat import fold_many0
+from chew.sequence import pair, preceded, separated_pair
+from chew.string import char, digit1
+
+SIZES = (1 << 12, 1 << 13, 1 << 14, 1 << 15)
+
+
+def _run(build, size):
+    data = Cursor("-".join(["1"] * size))
+    # a fresh grammar per call, so that no outcome is memoized across calls
+    return lambda: build()(data)
+
+
+def _left_recursive():
+    # expr := expr "-" digit1 | digit1
+    def expr(sequence):
+        return rule(sequence)
+
+    rule = left_recursive(alt([separated_pair(expr, char("-"), digit1), digit1]))
+    return expr
+
+
+def _folded():
+    # the same grammar, rewritten into a loop by hand
+    return pair(digit1, fold_many0(preceded(char("-"), digit1), list, _gather))
+
+
+def main():
+    scaling("left_recursive chain", lambda n: _run(_left_recursive, n), SIZES)
+    scaling("fold_many0 chain", lambda n: _run(_folded, n), SIZES)
+
+
+def _gather(accumulator, value):
+    accumulator.append(value)
+    return accumulator
+
+
+if __name__ == "__main__":
+    main()
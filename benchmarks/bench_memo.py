@@ -0,0 +1,45 @@
+"""
+Benchmarks of `memo` on a grammar backtracking over the same input.
+"""
+from benchmarks import measure
+from chew.branch import alt
+from chew.memo import memo
+from chew.sequence import multiple
+from chew.string import char
+
+
+def grammar(memoized: bool):
+    """
+    Builds the nested parentheses grammar whose alternatives share a prefix,
+    which takes exponential time without memoization.
+    """
+
+    def nested(sequence):
+        return rule(sequence)
+
+    rule = alt(
+        [
+            multiple([char("("), nested, char(")"), char("a")]),
+            multiple([char("("), nested, char(")"), char("b")]),
+            char("x"),
+        ]
+    )
+    if memoized:
+        rule = memo(rule)
+    return nested
+
+
+def main():
+    plain = grammar(False)
+    for depth in [4, 8, 12]:
+        data = "(" * depth + "x" + ")b" * depth
+        measure(f"nested depth={depth}", lambda d=data: plain(d), number=10)
+
+    for depth in [4, 8, 12, 64]:
+        data = "(" * depth + "x" + ")b" * depth
+        # a fresh table per call, so that only backtracking is memoized
+        measure(f"memo nested depth={depth}", lambda d=data: grammar(True)(d))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""
+Benchmarks of grammars before and after `optimize`.
+"""
+from benchmarks import measure
+from chew.generic import tag
+from chew.optimize import optimize
+from chew.repeat import many0
+from chew.sequence import delimited, pair, preceded, separated_pair, terminated
+from chew.string import alpha1, char, digit1
+
+
+def main():
+    assignment = terminated(
+        separated_pair(alpha1, delimited(char(" "), char("="), char(" ")), digit1),
+        pair(char(";"), tag("\n")),
+    )
+    pairs = pair(pair(alpha1, digit1), pair(alpha1, digit1))
+    angled = preceded(tag("<"), terminated(alpha1, tag(">")))
+    grammars = [
+        ("nested pairs", pairs, "ab12cd34"),
+        ("preceded(terminated)", angled, "<a>"),
+        ("many0(assignment)", many0(assignment), "a = 1;\n" * 20),
+    ]
+
+    for label, grammar, data in grammars:
+        optimized = optimize(grammar)
+        assert optimized(data) == grammar(data)
+        for name, parser in [(label, grammar), (f"{label} (optimized)", optimized)]:
+            measure(name, lambda parser=parser, data=data: parser(data))
+
+
+if __name__ == "__main__":
+    main()
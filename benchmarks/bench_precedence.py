@@ -0,0 +1,69 @@
+"""
+Benchmarks of `precedence` against a grammar with one layer per level.
+"""
+import random
+from benchmarks import measure
+from chew.branch import alt
+from chew.cursor import Cursor
+from chew.generic import tag
+from chew.precedence import precedence
+from chew.repeat import many0
+from chew.sequence import pair
+from chew.string import digit1
+
+# operators of a C-like language, from the loosest to the tightest level
+LEVELS = [
+    ["||"],
+    ["&&"],
+    ["|"],
+    ["^"],
+    ["&"],
+    ["==", "!="],
+    ["<=", ">=", "<", ">"],
+    ["<<", ">>"],
+    ["+", "-"],
+    ["*", "/", "%"],
+    ["**"],
+    ["@"],
+]
+
+
+def _layered():
+    # level := next (op next)*, for each level
+    expression = digit1
+    for operators in reversed(LEVELS):
+        operator = alt([tag(op) for op in operators])
+        expression = pair(expression, many0(pair(operator, expression)))
+    return expression
+
+
+def _pratt():
+    powers = {
+        op: (2 * level + 1, 2 * level + 2)
+        for (level, operators) in enumerate(LEVELS)
+        for op in operators
+    }
+    # longer operators first, so that ">>" is not taken for ">"
+    ordered = sorted(powers, key=len, reverse=True)
+    return precedence(digit1, infix_ops=[(tag(op), *powers[op]) for op in ordered])
+
+
+def main():
+    rng = random.Random(0)
+    operators = [op for level in LEVELS for op in level]
+    data = "1" + "".join(
+        f"{rng.choice(operators)}{rng.randint(0, 99)}" for _ in range(99)
+    )
+    cursor = Cursor(data)
+
+    layered = _layered()
+    pratt = _pratt()
+    assert layered(cursor)[0] == pratt(cursor)[0] == ""
+    measure("12 levels, layered (100 operands)", lambda: layered(cursor), number=100)
+    measure("12 levels, precedence (100 operands)", lambda: pratt(cursor), number=100)
+    measure("12 levels, layered (1 operand)", lambda: layered("1"))
+    measure("12 levels, precedence (1 operand)", lambda: pratt("1"))
+
+
+if __name__ == "__main__":
+    main()
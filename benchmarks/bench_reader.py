@@ -0,0 +1,79 @@
+"""
+Benchmarks of `iterparse` and `aparse` over a file and a stream, and of
+`pariter` over a mapped file, against `pariter` over their contents.
+"""
+import asyncio
+import io
+import os
+import tempfile
+import time
+from chew import streaming
+from chew.combine import pariter
+from chew.cursor import Cursor
+from chew.generic import tag, take_until
+from chew.reader import aparse, iterparse, map_file
+from chew.sequence import terminated
+
+LINES = 1 << 17
+
+
+def main():
+    data = b"".join(b"%08d GET /index.html 200\n" % index for index in range(LINES))
+
+    line = terminated(streaming.take_until(b"\n"), streaming.tag(b"\n"))
+    for chunk_size in [1 << 12, 1 << 16]:
+        records = iterparse(io.BytesIO(data), line, chunk_size=chunk_size)
+        start = time.perf_counter()
+        largest = 0
+        for _ in records:
+            largest = max(largest, len(records.buffer))
+        elapsed = time.perf_counter() - start
+        print(
+            f"iterparse chunk={chunk_size:<6} {elapsed * 1e3:>10.2f} ms "
+            f"{elapsed * 1e9 / LINES:>8.1f} ns/line, buffer <= {largest} bytes"
+        )
+
+    async def stream():
+        reader = asyncio.StreamReader()
+        for start in range(0, len(data), 1 << 16):
+            reader.feed_data(data[start : start + (1 << 16)])
+        reader.feed_eof()
+        async for _ in aparse(reader, line):
+            pass
+
+    start = time.perf_counter()
+    asyncio.run(stream())
+    elapsed = time.perf_counter() - start
+    print(
+        f"aparse StreamReader          {elapsed * 1e3:>10.2f} ms "
+        f"{elapsed * 1e9 / LINES:>8.1f} ns/line"
+    )
+
+    complete = terminated(take_until(b"\n"), tag(b"\n"))
+    (handle, path) = tempfile.mkstemp()
+    try:
+        with os.fdopen(handle, "wb") as file:
+            file.write(data)
+        start = time.perf_counter()
+        for _ in pariter(map_file(path), complete):
+            pass
+        elapsed = time.perf_counter() - start
+    finally:
+        os.remove(path)
+    print(
+        f"pariter map_file             {elapsed * 1e3:>10.2f} ms "
+        f"{elapsed * 1e9 / LINES:>8.1f} ns/line"
+    )
+
+    start = time.perf_counter()
+    for _ in pariter(Cursor(data), complete):
+        pass
+    elapsed = time.perf_counter() - start
+    print(
+        f"pariter (whole file in memory) {elapsed * 1e3:>10.2f} ms "
+        f"{elapsed * 1e9 / LINES:>8.1f} ns/line, buffer == {len(data)} bytes"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Benchmarks of regular expression parsers against equivalent combinators.
+"""
+from benchmarks import measure
+from chew.combine import optional, recognize
+from chew.cursor import Cursor
+from chew.generic import take_while
+from chew.regex import compile_regular, regex, regex_captures
+from chew.repeat import separated_list1
+from chew.sequence import pair, preceded, separated_pair
+from chew.string import char, digit1, satisfy, space1
+
+
+def main():
+    identifier = recognize(pair(satisfy(str.isalpha), take_while(str.isalnum)))
+    timestamp = separated_pair(digit1, char(":"), digit1)
+    grammars = [
+        ("identifier", identifier, regex(r"[^\W\d_][^\W_]*"), "variable1 = 2"),
+        ("timestamp", timestamp, regex_captures(r"(\d+):(\d+)"), "12:34:56"),
+    ]
+
+    for label, combinator, expression, data in grammars:
+        assert combinator(data) == expression(data)
+        measure(f"{label} (combinators)", lambda c=combinator, d=data: c(d))
+        measure(f"{label} (regex)", lambda e=expression, d=data: e(d))
+
+    clock = separated_pair(digit1, char(":"), digit1)
+    fraction = optional(preceded(char("."), digit1))
+    grammars = [
+        ("address", recognize(separated_list1(char("."), digit1)), "192.168.0.1 x"),
+        ("time", separated_pair(clock, char(":"), pair(digit1, fraction)), "1:2:3.4"),
+    ]
+    for label, grammar, data in grammars:
+        compiled = compile_regular(grammar)
+        assert compiled(data) == grammar(data)
+        measure(f"{label}", lambda g=grammar, d=data: g(d))
+        measure(f"{label} (compile_regular)", lambda c=compiled, d=data: c(d))
+
+    measure("digit1", lambda: digit1("1234567890;"))
+    measure("digit1 on Cursor", lambda: digit1(Cursor("1234567890;")))
+    measure("space1", lambda: space1("    x"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Benchmarks for the element scanning parsers.
+"""
+import string as stdstring
+from benchmarks import measure, scaling
+from chew.charclass import CharClass
+from chew.cursor import Cursor
+from chew.generic import (
+    is_a,
+    is_not,
+    take_till,
+    take_until,
+    take_until_any,
+    take_while,
+)
+from chew.string import alpha0, alphanum0, digit1, not_line_ending, one_of
+
+BASE64 = stdstring.ascii_letters + stdstring.digits + "+/"
+
+
+def _run(parser, data):
+    return lambda: parser(data)
+
+
+def main():
+    alpha = take_while(str.isalpha)
+    till_semicolon = take_till(lambda c: c == ";")
+
+    scaling("take_while(str.isalpha)", lambda n: _run(alpha, "a" * n))
+    scaling("take_till(== ';')", lambda n: _run(till_semicolon, "a" * n))
+    scaling("take_while on Cursor", lambda n: _run(alpha, Cursor("a" * n)))
+    scaling("alpha0", lambda n: _run(alpha0, "a" * n))
+    scaling("alphanum0", lambda n: _run(alphanum0, "a1" * (n // 2)))
+    scaling("not_line_ending", lambda n: _run(not_line_ending, "a" * n + "\n"))
+    scaling("is_a(base64)", lambda n: _run(is_a(BASE64), "QUJD" * (n // 4)))
+    scaling("is_not(whitespace)", lambda n: _run(is_not(" \t\r\n"), "a" * n))
+    base64 = is_a(BASE64.encode())
+    scaling("is_a(bytes base64)", lambda n: _run(base64, b"QUJD" * (n // 4)))
+    scaling("digit1 on Cursor", lambda n: _run(digit1, Cursor("1" * n)))
+    letters = take_while(CharClass.range("a", "z"))
+    scaling("take_while(CharClass)", lambda n: _run(letters, "a" * n))
+
+    vowel = one_of("aeiouAEIOU")
+    measure("one_of(10 vowels) 'U'", lambda: vowel("U"))
+
+    until = take_until("\r\n")
+    until_any = take_until_any(["\r\n", "\n", ";"])
+    scaling("take_until", lambda n: _run(until, "a" * n + "\r\n"))
+    scaling("take_until_any", lambda n: _run(until_any, "a" * n + ";"))
+
+
+if __name__ == "__main__":
+    main()
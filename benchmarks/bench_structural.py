@@ -0,0 +1,53 @@
+"""
+Benchmarks of parsing delimiter-separated rows by jumping through a structural
+index, against scanning for the delimiters.
+"""
+import time
+from chew.charclass import CharClass
+from chew.cursor import Cursor
+from chew.generic import tag, take_till
+from chew.repeat import many0, separated_list0
+from chew.sequence import terminated
+from chew.structural import fields, structural_index
+
+ROWS = 1 << 15
+
+
+def _report(label: str, elapsed: float, size: int):
+    print(
+        f"{label:<36} {elapsed * 1e3:>10.2f} ms "
+        f"{elapsed * 1e9 / ROWS:>8.1f} ns/row {elapsed * 1e9 / size:>6.1f} ns/byte"
+    )
+
+
+def main():
+    data = b"".join(
+        b"%d,2023-10-%02d,user%d@example.com,GET /index.html,200,%d\n"
+        % (row, row % 28 + 1, row, row * 7)
+        for row in range(ROWS)
+    )
+
+    scanned = many0(
+        terminated(separated_list0(tag(b","), take_till(CharClass(b",\n"))), tag(b"\n"))
+    )
+    start = time.perf_counter()
+    (_, expected) = scanned(Cursor(data))
+    _report("separated_list0(take_till)", time.perf_counter() - start, len(data))
+
+    for quote in [None, b'"']:
+        start = time.perf_counter()
+        index = structural_index(data, b",\n", quote=quote)
+        indexed = time.perf_counter() - start
+        _report(f"structural_index(quote={quote!r})", indexed, len(data))
+
+        rows = many0(terminated(fields(index, b","), tag(b"\n")))
+        start = time.perf_counter()
+        (_, table) = rows(Cursor(data))
+        elapsed = time.perf_counter() - start
+        assert table == expected
+        _report("  fields through the index", elapsed, len(data))
+        _report("  index and fields", indexed + elapsed, len(data))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,309 @@
+"""
+Parsers for binary numbers: fixed-width integers and floats, and varints.
+"""
+from __future__ import annotations
+__all__ = [
+    "LEB128",
+    "Records",
+    "Unpack",
+    "ZigZag",
+    "be_f32",
+    "be_f64",
+    "be_i16",
+    "be_i32",
+    "be_i64",
+    "be_i8",
+    "be_u16",
+    "be_u32",
+    "be_u64",
+    "be_u8",
+    "i8",
+    "le_f32",
+    "le_f64",
+    "le_i16",
+    "le_i32",
+    "le_i64",
+    "le_i8",
+    "le_u16",
+    "le_u32",
+    "le_u64",
+    "le_u8",
+    "records",
+    "sleb128",
+    "u8",
+    "uleb128",
+    "unpack",
+    "varint",
+    "zigzag_varint",
+]
+import importlib
+import struct
+from typing import Any, Callable, Optional
+from chew.cursor import Cursor
+from chew.error import Error, ErrorKind, Outcome, Wrapper
+from chew.types import Node, Parser, S
+
+
+def _buffer(sequence: Any) -> tuple[Any, int]:
+    """
+    Gets the buffer underlying a sequence, and the offset of the sequence in it.
+    """
+    if isinstance(sequence, Cursor):
+        return (sequence.buffer, sequence.position)
+    return (sequence, 0)
+
+
+def _advance(sequence: Any, count: int) -> Any:
+    """
+    Gets the sequence past its first `count` elements, advancing a Cursor
+    directly rather than by slicing it.
+    """
+    if isinstance(sequence, Cursor):
+        return sequence.advance(count)
+    return sequence[count:]
+
+
+class Unpack(Node[S, Any]):
+    """
+    Node unpacking a `struct` format from the start of the input, reading the
+    fields straight out of the underlying buffer.
+
+    Yields the value of a format with a single field, and the tuple of the
+    values of a format with several fields.
+    """
+
+    __slots__ = ("fmt", "_struct", "_single")
+    __match_args__ = ("fmt",)
+
+    def __init__(self, fmt: str):
+        self.fmt = fmt
+        self._struct = struct.Struct(fmt)
+        self._single = len(self._struct.unpack(bytes(self._struct.size))) == 1
+
+    def parse(self, sequence: S) -> Outcome[S, Any]:
+        size = self._struct.size
+        if len(sequence) < size:
+            return Error(sequence, ErrorKind.EOF)
+
+        (buffer, start) = _buffer(sequence)
+        try:
+            values = self._struct.unpack_from(buffer, start)
+        except TypeError:
+            # sequences of byte values are not buffers, so they are copied
+            values = self._struct.unpack(bytes(sequence[:size]))  # type: ignore
+
+        return (_advance(sequence, size), values[0] if self._single else values)
+
+
+def unpack(fmt: str) -> Parser[S, Any]:
+    """
+    Unpacks a `struct` format (such as `"<HHI"`) from bytes-like input, with the
+    format compiled once.
+
+    Yields the value of a format with a single field, or the tuple of the values
+    of its fields. Fails with EOF if the input is shorter than the format.
+    """
+    return Unpack[S](fmt)
+
+
+# Parses an unsigned or a signed byte.
+u8: Parser[Any, int] = Unpack("B")
+i8: Parser[Any, int] = Unpack("b")
+
+# Parses a big endian unsigned integer.
+be_u8: Parser[Any, int] = Unpack(">B")
+be_u16: Parser[Any, int] = Unpack(">H")
+be_u32: Parser[Any, int] = Unpack(">I")
+be_u64: Parser[Any, int] = Unpack(">Q")
+
+# Parses a big endian signed integer.
+be_i8: Parser[Any, int] = Unpack(">b")
+be_i16: Parser[Any, int] = Unpack(">h")
+be_i32: Parser[Any, int] = Unpack(">i")
+be_i64: Parser[Any, int] = Unpack(">q")
+
+# Parses a big endian IEEE 754 float.
+be_f32: Parser[Any, float] = Unpack(">f")
+be_f64: Parser[Any, float] = Unpack(">d")
+
+# Parses a little endian unsigned integer.
+le_u8: Parser[Any, int] = Unpack("<B")
+le_u16: Parser[Any, int] = Unpack("<H")
+le_u32: Parser[Any, int] = Unpack("<I")
+le_u64: Parser[Any, int] = Unpack("<Q")
+
+# Parses a little endian signed integer.
+le_i8: Parser[Any, int] = Unpack("<b")
+le_i16: Parser[Any, int] = Unpack("<h")
+le_i32: Parser[Any, int] = Unpack("<i")
+le_i64: Parser[Any, int] = Unpack("<q")
+
+# Parses a little endian IEEE 754 float.
+le_f32: Parser[Any, float] = Unpack("<f")
+le_f64: Parser[Any, float] = Unpack("<d")
+
+
+def _iter_unpack(compiled: struct.Struct) -> Callable[[memoryview, int], Any]:
+    """
+    Builds the function decoding a run of records of a `struct` format from a
+    view of their bytes, into a list of values or of tuples of values.
+    """
+    single = len(compiled.unpack(bytes(compiled.size))) == 1
+
+    def _decode(view: memoryview, _: int) -> list[Any]:
+        fields = compiled.iter_unpack(view)
+        if single:
+            return [value for (value,) in fields]
+        return list(fields)
+
+    return _decode
+
+
+def _frombuffer(layout: Any) -> tuple[int, Callable[[memoryview, int], Any]]:
+    """
+    Builds the function decoding a run of records of a NumPy dtype from a view
+    of their bytes, into an array sharing the memory of the view, along with
+    the size of a record.
+    """
+    # SAFETY: NumPy is only needed by (and so installed for) dtype layouts
+    numpy = importlib.import_module("numpy")
+    dtype = numpy.dtype(layout)
+    return (dtype.itemsize, lambda view, count: numpy.frombuffer(view, dtype, count))
+
+
+class Records(Node[S, Any]):
+    """
+    Node decoding a run of fixed-size records with a single call, rather than
+    applying a Parser per record.
+
+    Records of a `struct` format are decoded by `struct.iter_unpack`, and
+    records of a NumPy dtype by `numpy.frombuffer`.
+    """
+
+    __slots__ = ("layout", "count", "_size", "_decode")
+    __match_args__ = ("layout", "count")
+
+    def __init__(self, layout: Any, count: Optional[int] = None):
+        self.layout = layout
+        self.count = count
+        if isinstance(layout, str):
+            compiled = struct.Struct(layout)
+            (self._size, self._decode) = (compiled.size, _iter_unpack(compiled))
+        else:
+            (self._size, self._decode) = _frombuffer(layout)
+
+        if self._size == 0:
+            raise ValueError(f"records of {layout!r} are empty")
+
+    def parse(self, sequence: S) -> Outcome[S, Any]:
+        available = len(sequence) // self._size
+        count = available if self.count is None else self.count
+        if count > available:
+            return Error(sequence, ErrorKind.EOF)
+
+        size = count * self._size
+        (buffer, start) = _buffer(sequence)
+        try:
+            view = memoryview(buffer)[start : start + size]
+        except TypeError:
+            # sequences of byte values are not buffers, so they are copied
+            view = memoryview(bytes(sequence[:size]))  # type: ignore
+
+        return (_advance(sequence, size), self._decode(view, count))
+
+
+def records(layout: Any, count: Optional[int] = None) -> Parser[S, Any]:
+    """
+    Decodes `count` fixed-size records, or as many whole records as the input
+    holds, in a single call.
+
+    With a `struct` format as the layout (such as `"<IHH"`), yields the list of
+    the records' tuples of values (or of their values, for a single field).
+    With a NumPy dtype, or anything `numpy.dtype` accepts other than a str
+    (such as `[("time", "<u8"), ("size", "<u4")]`), yields a structured array
+    sharing the memory of the input, as long as the input is a buffer.
+
+    Fails with EOF if the input holds fewer than `count` records.
+    """
+    return Records[S](layout, count)
+
+
+class LEB128(Node[S, int]):
+    """
+    Node parsing a LEB128 integer: groups of 7 bits, least significant first,
+    in bytes whose high bit is set on all but the last.
+
+    With a `width`, the integer is at most `width` bits wide, so it may only
+    take as many bytes as it needs to be encoded, and the bits beyond its width
+    are dropped.
+    """
+
+    __slots__ = ("signed", "width", "_limit", "_mask")
+    __match_args__ = ("signed", "width")
+
+    def __init__(self, signed: bool = False, width: Optional[int] = None):
+        self.signed = signed
+        self.width = width
+        self._limit: Optional[int] = None
+        self._mask: Optional[int] = None
+        if width is not None:
+            self._limit = -(-width // 7)
+            self._mask = (1 << width) - 1
+
+    def parse(self, sequence: S) -> Outcome[S, int]:
+        (buffer, start) = _buffer(sequence)
+        end = len(buffer)
+        if self._limit is not None:
+            end = min(end, start + self._limit)
+
+        value = 0
+        shift = 0
+        for index in range(start, end):
+            byte = buffer[index]
+            value |= (byte & 0x7F) << shift
+            shift += 7
+            if byte < 0x80:
+                break
+        else:
+            # either the integer is too wide, or the input ends within it
+            if self._limit is not None and end - start == self._limit:
+                return Error(sequence, ErrorKind.VARINT)
+            return Error(sequence, ErrorKind.EOF)
+
+        if self._mask is not None:
+            value &= self._mask
+            shift = min(shift, self._mask.bit_length())
+        if self.signed and value >> (shift - 1):
+            value -= 1 << shift
+
+        return (_advance(sequence, index + 1 - start), value)
+
+
+# Parses an unsigned or a signed LEB128 integer of any size.
+uleb128: Parser[Any, int] = LEB128()
+sleb128: Parser[Any, int] = LEB128(True)
+
+# Parses a protobuf varint, an unsigned LEB128 integer of at most 64 bits (10
+# bytes).
+varint: Parser[Any, int] = LEB128(False, 64)
+
+
+class ZigZag(Wrapper[S, int]):
+    """
+    Node decoding the zigzag encoding of the unsigned integer yielded by its
+    child, which encodes 0, -1, 1, -2, ... as 0, 1, 2, 3, ...
+    """
+
+    __slots__ = ()
+
+    def parse(self, sequence: S) -> Outcome[S, int]:
+        result = self._parse(sequence)
+        if isinstance(result, Error):
+            return result
+
+        (remaining, value) = result
+        return (remaining, (value >> 1) ^ -(value & 1))
+
+
+# Parses a zigzag encoded protobuf varint (sint32 and sint64 fields).
+zigzag_varint: Parser[Any, int] = ZigZag(varint)
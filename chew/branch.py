@@ -2,32 +2,110 @@
 Branch Combinators.
 """
 # pylint: disable=invalid-name
-__all__ = ["alt"]
-from typing import Iterable, Optional, TypeVar
-from chew.error import Error, ErrorKind
-from chew.types import Parser, Result, S
+from __future__ import annotations
+__all__ = ["Alt", "alt"]
+from typing import Any, Iterable, Optional, TypeVar
+from chew.error import Error, ErrorKind, Incomplete, Outcome, returning
+from chew.types import END, Node, Parser, S, first_of
 
 # Shared Alternative Parser Return Value
 #
 # Generic return type of any given Parser passed to alt.
 T = TypeVar("T")
 
+# Dispatched Item
+#
+# What is applied for each alternative, such as its parse function.
+C = TypeVar("C")
 
-def alt(parsers: Iterable[Parser[S, T]]) -> Parser[S, T]:
+
+def _dispatch(
+    parsers: tuple[Parser, ...], parses: list[C]
+) -> tuple[Optional[dict[Any, list[C]]], list[C]]:
     """
-    Tests a list of parsers one by one until one succeeds.
+    Builds a table from the first element of the input to the parse functions
+    (or other items) of the alternatives that may succeed on it, in order,
+    along with those to apply to any other input. There is no table if no first
+    element is known. Exhausted inputs are looked up as END.
+
+    The last alternative is always applied, so that the Error of a failure is
+    the same as if every alternative had been applied.
     """
+    firsts = [first_of(parser) for parser in parsers]
+    known = [first for first in firsts if first is not None]
+    if not known:
+        return (None, parses)
 
-    def _alt(sequence: S) -> Result[S, T]:
-        last_error: Optional[Error] = None
-        for parser in parsers:
+    def candidates(element: Any) -> list[C]:
+        indices = [
+            index
+            for (index, first) in enumerate(firsts)
+            if first is None or element in first
+        ]
+        if indices[-1:] != [len(parses) - 1]:
+            indices.append(len(parses) - 1)
+        return [parses[index] for index in indices]
+
+    # an object which is never equal to an element of the input
+    fallback = candidates(object())
+    table = {element: candidates(element) for element in frozenset().union(*known)}
+
+    return (table, fallback)
+
+
+class Alt(Node[S, T]):
+    """
+    Node applying its alternatives in order until one succeeds.
+
+    Alternatives whose first element is known (see `Node.first`) are skipped
+    when the input starts with any other element. An Incomplete failure is
+    returned as soon as it occurs, as the alternative may match once more
+    input is available.
+    """
+
+    __slots__ = ("parsers", "_parses", "_table", "_fallback")
+    __match_args__ = ("parsers",)
+    _child_params = ("parsers",)
+
+    def __init__(self, parsers: Iterable[Parser[S, T]]):
+        self.parsers = tuple(parsers)
+        self._parses = [returning(parser) for parser in self.parsers]
+        (self._table, self._fallback) = _dispatch(self.parsers, self._parses)
+
+    def parse(self, sequence: S) -> Outcome[S, T]:
+        parses = self._parses
+        if self._table is not None:
             try:
-                return parser(sequence)
-            except Error as error:
-                last_error = error
+                parses = self._table.get(sequence[0], self._fallback)
+            except IndexError:
+                parses = self._table.get(END, self._fallback)
+            except TypeError:
+                pass
+
+        last_error: Optional[Error] = None
+        for parse in parses:
+            result = parse(sequence)
+            if not isinstance(result, Error):
+                return result
+            if isinstance(result, Incomplete):
+                return result
+            last_error = result
 
         if last_error is not None:
-            raise last_error
-        raise Error(sequence, ErrorKind.ALT)  # pragma: no cover
+            return last_error
+        return Error(sequence, ErrorKind.ALT)  # pragma: no cover
+
+    def first(self) -> Optional[frozenset[Any]]:
+        firsts = [first_of(parser) for parser in self.parsers]
+        known = [first for first in firsts if first is not None]
+        if len(known) < len(firsts):
+            return None
 
-    return _alt
+        return frozenset().union(*known)
+
+
+def alt(parsers: Iterable[Parser[S, T]]) -> Parser[S, T]:
+    """
+    Tests a list of parsers one by one until one succeeds.
+    """
+    return Alt(parsers)
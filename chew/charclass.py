@@ -0,0 +1,158 @@
+"""
+Precompiled sets of elements.
+"""
+from __future__ import annotations
+
+__all__ = ["CharClass"]
+
+import itertools
+import mmap
+import operator
+import re
+from typing import Any, Iterable, Optional
+from chew.cursor import Cursor
+
+# buffers a bytes pattern can be matched against
+_BYTES_BUFFERS = (bytes, bytearray, memoryview, mmap.mmap)
+
+
+def _compile(members: frozenset[Any], negated: bool) -> Optional[re.Pattern]:
+    """
+    Compiles the pattern matching a (possibly empty) run of the elements of a
+    class of characters or of byte values, or None if the members are neither.
+    """
+    if all(isinstance(member, str) and len(member) == 1 for member in members):
+        if not members:
+            return re.compile("(?s:.)*" if negated else "")
+        escaped = "".join(re.escape(member) for member in sorted(members))
+        return re.compile(f"[{'^' if negated else ''}{escaped}]*")
+
+    if all(isinstance(member, int) and 0 <= member < 256 for member in members):
+        if not members:
+            return re.compile(b"(?s:.)*" if negated else b"")
+        raw = b"".join(re.escape(bytes([member])) for member in sorted(members))
+        return re.compile(b"[" + (b"^" if negated else b"") + raw + b"]*")
+
+    return None
+
+
+class CharClass:
+    """
+    A set of elements (characters, or byte values), compiled once so that
+    testing membership is O(1) and a run of the class is consumed by a single
+    regular expression match over str and bytes-like input.
+
+    A CharClass is a Matcher, so it may be used wherever a condition is
+    expected (`take_while`, `satisfy`, ...). A negated CharClass contains every
+    element but its members.
+    """
+
+    __slots__ = ("members", "negated", "_pattern", "_buffers")
+
+    # the elements of the class, or those not in the class if negated
+    members: frozenset[Any]
+
+    # whether the class contains every element but its members
+    negated: bool
+
+    def __init__(self, members: Iterable[Any] = (), negated: bool = False):
+        self.members = frozenset(members)
+        self.negated = negated
+        self._pattern = _compile(self.members, negated)
+        # buffers the pattern can be matched against
+        self._buffers: tuple[type, ...] = ()
+        if self._pattern is not None:
+            text = isinstance(self._pattern.pattern, str)
+            self._buffers = (str,) if text else _BYTES_BUFFERS
+
+    @classmethod
+    def of(cls, members: Iterable[Any] | CharClass) -> CharClass:
+        """
+        Gets the given CharClass, or creates the class of the given elements.
+        """
+        return members if isinstance(members, CharClass) else cls(members)
+
+    @classmethod
+    def range(cls, first: Any, last: Any) -> CharClass:
+        """
+        Creates the class of the characters (or byte values) from `first` to
+        `last` inclusive.
+        """
+        if isinstance(first, str):
+            return cls(map(chr, range(ord(first), ord(last) + 1)))
+        return cls(range(first, last + 1))
+
+    @property
+    def elements(self) -> Optional[frozenset[Any]]:
+        """
+        The elements of the class, or None if it is negated.
+        """
+        return None if self.negated else self.members
+
+    def union(self, other: CharClass) -> CharClass:
+        """
+        Creates the class of the elements in either class.
+        """
+        if self.negated and other.negated:
+            return CharClass(self.members & other.members, True)
+        if self.negated:
+            return CharClass(self.members - other.members, True)
+        if other.negated:
+            return CharClass(other.members - self.members, True)
+        return CharClass(self.members | other.members)
+
+    def negate(self) -> CharClass:
+        """
+        Creates the class of the elements not in this class.
+        """
+        return CharClass(self.members, not self.negated)
+
+    def run(self, sequence: Any) -> int:
+        """
+        Counts the leading elements of the sequence that are in the class.
+        """
+        (buffer, start) = (sequence, 0)
+        if isinstance(sequence, Cursor):
+            (buffer, start) = (sequence.buffer, sequence.position)
+
+        if self._pattern is not None and isinstance(buffer, self._buffers):
+            match = self._pattern.match(buffer, start)
+            # SAFETY: a pattern matching a possibly empty run always matches
+            assert match is not None
+            return match.end() - start
+
+        # the index of the first element not in the class is the length of the
+        # run, found without re-slicing the sequence
+        stops = map(operator.not_, map(self.__contains__, sequence))
+        return next(itertools.compress(itertools.count(), stops), len(sequence))
+
+    def __contains__(self, element: Any) -> bool:
+        return (element in self.members) != self.negated
+
+    __call__ = __contains__
+
+    def __or__(self, other: CharClass) -> CharClass:
+        return self.union(other)
+
+    def __invert__(self) -> CharClass:
+        return self.negate()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CharClass):
+            return NotImplemented
+
+        return (self.members, self.negated) == (other.members, other.negated)
+
+    def __hash__(self) -> int:
+        return hash((self.members, self.negated))
+
+    def __reduce__(self):
+        return (CharClass, (self.members, self.negated))
+
+    def __repr__(self) -> str:
+        members: Any = sorted(self.members, key=repr)
+        if all(isinstance(member, str) for member in members):
+            members = "".join(members)
+
+        negated = ", negated=True" if self.negated else ""
+        return f"CharClass({members!r}{negated})"
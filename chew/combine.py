@@ -2,7 +2,25 @@
 General purpose combinators.
 """
 # pylint: disable=invalid-name, raise-missing-from
+from __future__ import annotations
 __all__ = [
+    "AllConsuming",
+    "Conditional",
+    "Consumed",
+    "Eof",
+    "Fail",
+    "FlatMap",
+    "MapParser",
+    "MapRes",
+    "Negate",
+    "Opt",
+    "Peek",
+    "Recognize",
+    "Rest",
+    "RestLen",
+    "Success",
+    "Value",
+    "Verify",
     "all_consuming",
     "conditional",
     "consumed",
@@ -22,14 +40,24 @@ __all__ = [
     "noerr_value",
     "verify",
 ]
-from typing import TypeVar, NoReturn, Optional, Generic
+from typing import Any, TypeVar, NoReturn, Optional, Generic
 import dataclasses
-from chew.error import Error, ErrorKind, map_exception
+from chew.error import (
+    Error,
+    ErrorKind,
+    Incomplete,
+    Outcome,
+    ParseFn,
+    Wrapper,
+    returning,
+)
 from chew.types import (
+    Node,
     Parser,
     Result,
     Callable,
     S,
+    first_of,
 )
 from chew.primitive import eof as seq_eof, take
 
@@ -52,18 +80,23 @@ class ParserIterator(Generic[S, Y]):
 
     current: S
     parser: Parser[S, Y]
+    _parse: ParseFn[S, Y] = dataclasses.field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._parse = returning(self.parser)
 
     def __iter__(self):
         return self
 
     def __next__(self) -> Y:
-        try:
-            (new, value) = self.parser(self.current)
-            self.current = new
-            return value
-        except Error:
+        result = self._parse(self.current)
+        if isinstance(result, Error):
             raise StopIteration
 
+        (new, value) = result
+        self.current = new
+        return value
+
     def finish(self) -> Result[S, None]:
         """
         Get the remaining input after iteration has been exhausted.
@@ -71,31 +104,84 @@ class ParserIterator(Generic[S, Y]):
         return (self.current, None)
 
 
+class AllConsuming(Wrapper[S, Y]):
+    """
+    Node succeeding if its child consumes all of the input.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, child: Parser[S, Y]):
+        super().__init__(child)
+
+    def parse(self, sequence: S) -> Outcome[S, Y]:
+        result = self._parse(sequence)
+        if isinstance(result, Error):
+            return result
+
+        (current, value) = result
+        if not seq_eof(current):
+            return Error(current, ErrorKind.EOF)
+
+        return (current, value)
+
+
 def all_consuming(child: Parser[S, Y]) -> Parser[S, Y]:
     """
     Succeeds if all the input has been consumed by its child parser.
     """
+    return AllConsuming(child)
 
-    def _all_consuming(sequence: S) -> Result[S, Y]:
-        (current, value) = child(sequence)
-        eof(current)
-        return (current, value)
 
-    return _all_consuming
+class Conditional(Wrapper[S, Optional[Y]]):
+    """
+    Node applying its child only if the condition is set.
+    """
+
+    __slots__ = ("condition",)
+    __match_args__ = ("condition", "child")
+
+    def __init__(self, condition: bool, child: Parser[S, Y]):
+        self.condition = condition
+        super().__init__(child)
+
+    def parse(self, sequence: S) -> Outcome[S, Optional[Y]]:
+        if self.condition:
+            return self._parse(sequence)
+
+        return (sequence, None)
 
 
 def conditional(condition: bool, child: Parser[S, Y]) -> Parser[S, Optional[Y]]:
     """
     Conditionally run a child parser on the input.
     """
+    return Conditional(condition, child)
 
-    def _conditional(sequence: S) -> Result[S, Optional[Y]]:
-        if condition:
-            return child(sequence)
 
-        return (sequence, None)
+class Consumed(Wrapper[S, tuple[S, Y]]):
+    """
+    Node yielding the input consumed by its child along with its value.
+    """
 
-    return _conditional
+    __slots__ = ()
+
+    def __init__(self, child: Parser[S, Y]):
+        super().__init__(child)
+
+    def parse(self, sequence: S) -> Outcome[S, tuple[S, Y]]:
+        result = self._parse(sequence)
+        if isinstance(result, Error):
+            return result
+
+        (remaining, value) = result
+        taken = len(sequence) - len(remaining)
+
+        divided = take(sequence, taken)
+        assert divided is not None
+
+        (_, eaten) = divided
+        return (remaining, (eaten, value))
 
 
 def consumed(child: Parser[S, Y]) -> Parser[S, tuple[S, Y]]:
@@ -103,35 +189,61 @@ def consumed(child: Parser[S, Y]) -> Parser[S, tuple[S, Y]]:
     If the child parser was successful, return the consumed input with the
     output as a tuple.
     """
+    return Consumed(child)
 
-    def _consumed(original: S) -> Result[S, tuple[S, Y]]:
-        (remaining, value) = child(original)
-        taken = len(original) - len(remaining)
 
-        divided = take(original, taken)
-        assert divided is not None
+class Eof(Node[S, S]):
+    """
+    Node succeeding at the end of the input.
+    """
 
-        (_, eaten) = divided
-        return (remaining, (eaten, value))
+    __slots__ = ()
+
+    def parse(self, sequence: S) -> Outcome[S, S]:
+        if not seq_eof(sequence):
+            return Error(sequence, ErrorKind.EOF)
 
-    return _consumed
+        return (sequence, sequence[:0])  # type: ignore
 
 
-def eof(sequence: S) -> Result[S, S]:
+# Succeeds when we're at the end of the data.
+eof: Parser = Eof()
+
+
+class Fail(Node[S, NoReturn]):
     """
-    Succeeds when we're at the end of the data.
+    Node that always fails.
     """
-    if not seq_eof(sequence):
-        raise Error(sequence, ErrorKind.EOF)
 
-    return (sequence, sequence)
+    __slots__ = ()
+
+    def parse(self, sequence: S) -> Outcome[S, NoReturn]:
+        return Error(sequence, ErrorKind.FAIL)
+
+
+# Always fails.
+fail: Parser = Fail()
 
 
-def fail(sequence: S) -> Result[S, NoReturn]:
+class FlatMap(Wrapper[S, Y], Generic[S, T, Y]):
     """
-    Always fails.
+    Node applying the Parser built from the value of its child.
     """
-    raise Error(sequence, ErrorKind.FAIL)
+
+    __slots__ = ("applied",)
+    __match_args__ = ("child", "applied")
+
+    def __init__(self, child: Parser[S, T], applied: Callable[[T], Parser[S, Y]]):
+        super().__init__(child)
+        self.applied = applied
+
+    def parse(self, sequence: S) -> Outcome[S, Y]:
+        result = self._parse(sequence)
+        if isinstance(result, Error):
+            return result
+
+        (current, intermediate) = result
+        return returning(self.applied(intermediate))(current)
 
 
 def flat_map(
@@ -141,12 +253,7 @@ def flat_map(
     Creates a new parser from the output of the first parser, then apply that
     parser over the rest of the input.
     """
-
-    def _flat_map(sequence: S) -> Result[S, Y]:
-        (current, intermediate) = parser(sequence)
-        return applied(intermediate)(current)
-
-    return _flat_map
+    return FlatMap(parser, applied)
 
 
 def pariter(sequence: S, parser: Parser[S, Y]) -> ParserIterator[S, Y]:
@@ -156,86 +263,176 @@ def pariter(sequence: S, parser: Parser[S, Y]) -> ParserIterator[S, Y]:
     return ParserIterator(sequence, parser)
 
 
-def map_res(parser: Parser[S, T], mapper: Callable[[T], Y]) -> Parser[S, Y]:
+class MapRes(Wrapper[S, Y], Generic[S, T, Y]):
     """
-    Maps a function on the result of a parser.
+    Node mapping a function over the value of its child, failing if the
+    function raises.
     """
 
-    def _map_res(sequence: S) -> Result[S, Y]:
-        (current, to_convert) = parser(sequence)
+    __slots__ = ("mapper",)
+    __match_args__ = ("child", "mapper")
+
+    def __init__(self, child: Parser[S, T], mapper: Callable[[T], Y]):
+        super().__init__(child)
+        self.mapper = mapper
+
+    def parse(self, sequence: S) -> Outcome[S, Y]:
+        result = self._parse(sequence)
+        if isinstance(result, Error):
+            return result
+
+        (current, to_convert) = result
 
         # intercept any Exception raised by our conversion function, turning it
         # into an Error with the correct ErrorKind
-        with map_exception(Exception, current, ErrorKind.MAP_RES):
-            value: Y = mapper(to_convert)
+        try:
+            value: Y = self.mapper(to_convert)
+        except Exception:  # pylint: disable=broad-exception-caught
+            return Error(current, ErrorKind.MAP_RES)
 
         return (current, value)
 
-    return _map_res
+    def first(self) -> Optional[frozenset[Any]]:
+        return first_of(self.child)
+
+
+def map_res(parser: Parser[S, T], mapper: Callable[[T], Y]) -> Parser[S, Y]:
+    """
+    Maps a function on the result of a parser.
+    """
+    return MapRes(parser, mapper)
+
+
+class MapParser(Wrapper[S, Y]):
+    """
+    Node applying a Parser over the value of its child.
+    """
+
+    __slots__ = ("applied", "_applied_parse")
+    __match_args__ = ("child", "applied")
+    _child_params = ("child", "applied")
+
+    def __init__(self, child: Parser[S, S], applied: Parser[S, Y]):
+        super().__init__(child)
+        self.applied = applied
+        self._applied_parse = returning(applied)
+
+    def parse(self, sequence: S) -> Outcome[S, Y]:
+        result = self._parse(sequence)
+        if isinstance(result, Error):
+            return result
+
+        (current, yielded) = result
+        applied = self._applied_parse(yielded)
+        if isinstance(applied, Error):
+            return applied
+
+        (_, value) = applied
+        return (current, value)
 
 
 def map_parser(parser: Parser[S, S], applied_parser: Parser[S, Y]) -> Parser[S, Y]:
     """
     Applies a parser over the result of another one.
     """
+    return MapParser(parser, applied_parser)
 
-    def _map_parser(sequence: S) -> Result[S, Y]:
-        (current, yielded) = parser(sequence)
-        (_, value) = applied_parser(yielded)
-        return (current, value)
 
-    return _map_parser
+class Negate(Wrapper[S, None], Generic[S, T]):
+    """
+    Node succeeding, without consuming any input, if its child fails.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, child: Parser[S, T]):
+        super().__init__(child)
+
+    def parse(self, sequence: S) -> Outcome[S, None]:
+        result = self._parse(sequence)
+        if isinstance(result, Incomplete):
+            return result
+        if isinstance(result, Error):
+            return (sequence, None)
+        return Error(sequence, ErrorKind.NEGATE)
 
 
 def negate(parser: Parser[S, T]) -> Parser[S, None]:
     """
     Succeeds if the child parser returns an error.
     """
+    return Negate(parser)
 
-    def _negate(sequence: S) -> Result[S, None]:
-        try:
-            parser(sequence)
-        except Error:
+
+class Opt(Wrapper[S, Optional[T]]):
+    """
+    Node yielding None, without consuming any input, if its child fails.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, child: Parser[S, T]):
+        super().__init__(child)
+
+    def parse(self, sequence: S) -> Outcome[S, Optional[T]]:
+        result = self._parse(sequence)
+        if isinstance(result, Error):
+            if isinstance(result, Incomplete):
+                return result
             return (sequence, None)
-        raise Error(sequence, ErrorKind.NEGATE)
 
-    return _negate
+        return result
 
 
 def optional(parser: Parser[S, T]) -> Parser[S, Optional[T]]:
     """
     Optional parser, will return None on a ParseError.
     """
+    return Opt(parser)
 
-    def _optional(sequence: S) -> Result[S, Optional[T]]:
-        try:
-            return parser(sequence)
-        except Error:
-            return (sequence, None)
 
-    return _optional
+class Peek(Wrapper[S, T]):
+    """
+    Node applying its child without consuming any input.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, child: Parser[S, T]):
+        super().__init__(child)
+
+    def parse(self, sequence: S) -> Outcome[S, T]:
+        result = self._parse(sequence)
+        if isinstance(result, Error):
+            return result
+
+        (_, value) = result
+        return (sequence, value)
 
 
 def peek(parser: Parser[S, T]) -> Parser[S, T]:
     """
     Tries to apply its parser without consuming the input.
     """
+    return Peek(parser)
 
-    def _peek(sequence: S) -> Result[S, T]:
-        (_, value) = parser(sequence)
-        return (sequence, value)
-
-    return _peek
 
-
-def recognize(parser: Parser[S, T]) -> Parser[S, S]:
+class Recognize(Wrapper[S, S], Generic[S, T]):
     """
-    If the child parser was successful, return the consumed input as produced
-    value.
+    Node yielding the input consumed by its child.
     """
 
-    def _recognize(sequence: S) -> Result[S, S]:
-        (remaining, _) = parser(sequence)
+    __slots__ = ()
+
+    def __init__(self, child: Parser[S, T]):
+        super().__init__(child)
+
+    def parse(self, sequence: S) -> Outcome[S, S]:
+        result = self._parse(sequence)
+        if isinstance(result, Error):
+            return result
+
+        (remaining, _) = result
         num_consumed = len(sequence) - len(remaining)
 
         divided = take(sequence, num_consumed)
@@ -246,67 +443,138 @@ def recognize(parser: Parser[S, T]) -> Parser[S, S]:
         (_, eaten) = divided
         return (remaining, eaten)
 
-    return _recognize
+    def first(self) -> Optional[frozenset[Any]]:
+        return first_of(self.child)
+
+
+def recognize(parser: Parser[S, T]) -> Parser[S, S]:
+    """
+    If the child parser was successful, return the consumed input as produced
+    value.
+    """
+    return Recognize(parser)
+
+
+class Rest(Node[S, S]):
+    """
+    Node yielding all of the remaining input.
+    """
+
+    __slots__ = ()
+
+    def parse(self, sequence: S) -> Outcome[S, S]:
+        if len(sequence) == 0:
+            return (sequence, sequence[:0])  # type: ignore
+
+        # SAFETY: we should always be able to take from the stream.
+        divided = take(sequence, len(sequence))
+        assert divided is not None
+
+        return divided
+
 
+# Return the remaining input as output.
+rest: Parser = Rest()
 
-def rest(sequence: S) -> Result[S, S]:
+
+class RestLen(Node[S, int]):
     """
-    Return the remaining input as output.
+    Node yielding the length of the remaining input.
     """
-    if len(sequence) == 0:
-        return (sequence, sequence)
 
-    # SAFETY: we should always be able to take from the stream.
-    divided = take(sequence, len(sequence))
-    assert divided is not None
+    __slots__ = ()
+
+    def parse(self, sequence: S) -> Outcome[S, int]:
+        return (sequence, len(sequence))
 
-    return divided
 
+# Return the length of the remaining input.
+rest_len: Parser = RestLen()
 
-def rest_len(sequence: S) -> Result[S, int]:
+
+class Success(Node[S, T]):
     """
-    Return the length of the remaining input.
+    Node that always succeeds with a value.
     """
 
-    return (sequence, len(sequence))
+    __slots__ = ("value",)
+    __match_args__ = ("value",)
+
+    def __init__(self, value: T):
+        self.value = value
+
+    def parse(self, sequence: S) -> Outcome[S, T]:
+        return (sequence, self.value)
 
 
 def success(value: T) -> Parser[S, T]:
     """
     Always succeeds yielding the given value.
     """
+    return Success[S, T](value)
 
-    def _success(sequence: S) -> Result[S, T]:
-        return (sequence, value)
 
-    return _success
+class Value(Wrapper[S, T], Generic[S, T, Y]):
+    """
+    Node yielding a value in place of the value of its child.
+    """
+
+    __slots__ = ("value",)
+    __match_args__ = ("value", "child")
+
+    def __init__(self, value: T, child: Parser[S, Y]):
+        self.value = value
+        super().__init__(child)
+
+    def parse(self, sequence: S) -> Outcome[S, T]:
+        result = self._parse(sequence)
+        if isinstance(result, Error):
+            return result
+
+        (current, _) = result
+        return (current, self.value)
+
+    def first(self) -> Optional[frozenset[Any]]:
+        return first_of(self.child)
 
 
 def noerr_value(value: T, parser: Parser[S, Y]) -> Parser[S, T]:
     """
     Returns the provided value if the child parser succeeds.
     """
-
-    def _noerr_value(sequence: S) -> Result[S, T]:
-        (current, _) = parser(sequence)
-        return (current, value)
-
-    return _noerr_value
+    return Value(value, parser)
 
 
-def verify(parser: Parser[S, Y], verifier: Callable[[Y], bool]) -> Parser[S, Y]:
+class Verify(Wrapper[S, Y]):
     """
-    Returns the result of the child parser if it satisfies a verification
-    function.
+    Node failing if the value of its child does not satisfy the verifier.
     """
 
-    def _verify(sequence: S) -> Result[S, Y]:
-        result = parser(sequence)
-        (_, value) = result
+    __slots__ = ("verifier",)
+    __match_args__ = ("child", "verifier")
+
+    def __init__(self, child: Parser[S, Y], verifier: Callable[[Y], bool]):
+        super().__init__(child)
+        self.verifier = verifier
 
-        if not verifier(value):
-            raise Error(sequence, ErrorKind.VERIFY)
+    def parse(self, sequence: S) -> Outcome[S, Y]:
+        result = self._parse(sequence)
+        if isinstance(result, Error):
+            return result
+
+        (_, value) = result
+        if not self.verifier(value):
+            return Error(sequence, ErrorKind.VERIFY)
 
         return result
 
-    return _verify
+    def first(self) -> Optional[frozenset[Any]]:
+        return first_of(self.child)
+
+
+def verify(parser: Parser[S, Y], verifier: Callable[[Y], bool]) -> Parser[S, Y]:
+    """
+    Returns the result of the child parser if it satisfies a verification
+    function.
+    """
+    return Verify(parser, verifier)
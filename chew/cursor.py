@@ -0,0 +1,85 @@
+"""
+Offset-based view over a Parseable.
+"""
+from __future__ import annotations
+
+__all__ = ["Cursor"]
+
+import collections.abc
+from typing import Any, Iterator
+
+
+class Cursor(collections.abc.Sequence):
+    """
+    A position within an underlying buffer.
+
+    A Cursor behaves like the remaining input of the buffer from its position
+    onwards, so it may be handed to any Parser in place of a str, bytes, or
+    arbitrary sequence. Advancing a Cursor (slicing with an open end) is O(1)
+    and never copies the buffer; only bounded slices, which are yielded as
+    values, are materialized from the underlying buffer.
+    """
+
+    __slots__ = ("buffer", "position")
+
+    # the underlying buffer being parsed
+    buffer: Any
+
+    # offset of the remaining input within the buffer
+    position: int
+
+    def __init__(self, buffer: Any, position: int = 0):
+        if isinstance(buffer, Cursor):
+            position += buffer.position
+            buffer = buffer.buffer
+
+        self.buffer = buffer
+        self.position = min(max(position, 0), len(buffer))
+
+    def advance(self, count: int) -> Cursor:
+        """
+        Creates a new Cursor `count` elements further into the buffer.
+        """
+        return Cursor(self.buffer, self.position + count)
+
+    def materialize(self) -> Any:
+        """
+        Copies the remaining input out of the underlying buffer.
+        """
+        return self.buffer[self.position :]
+
+    def __len__(self) -> int:
+        return len(self.buffer) - self.position
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            (start, stop, step) = key.indices(len(self))
+            if key.stop is None and step == 1:
+                return Cursor(self.buffer, self.position + start)
+            if step == 1:
+                return self.buffer[self.position + start : self.position + stop]
+            return self.materialize()[key]
+
+        if key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("Cursor index out of range")
+
+        return self.buffer[self.position + key]
+
+    def __iter__(self) -> Iterator[Any]:
+        return map(self.buffer.__getitem__, range(self.position, len(self.buffer)))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Cursor):
+            if (other.buffer is self.buffer) and (other.position == self.position):
+                return True
+            other = other.materialize()
+
+        return self.materialize() == other
+
+    def __hash__(self) -> int:
+        return hash(self.materialize())
+
+    def __repr__(self) -> str:
+        return f"Cursor({self.buffer!r:.40}, {self.position})"
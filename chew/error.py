@@ -5,8 +5,15 @@ Error handling facilities.
 from __future__ import annotations
 import enum
 import contextlib
-import dataclasses
-from chew.types import Parseable
+import mmap
+from typing import Any, Callable, Optional, TypeVar
+from chew.cursor import Cursor
+from chew.types import Node, Parseable, Parser, Result, S, first_of
+
+# Generic Yielded Element
+#
+# Yielded element from a Parser that we care about.
+Y = TypeVar("Y")
 
 
 class ErrorKind(enum.Enum):
@@ -46,17 +53,114 @@ class ErrorKind(enum.Enum):
     MANY1_COUNT = 29
     MANY_BOUNDED = 30
     SEPARATED_LIST1 = 31
+    REGEX = 32
+    LEFT_RECURSION = 33
+    INCOMPLETE = 34
+    VARINT = 35
 
 
-@dataclasses.dataclass
 class Error(Exception):
     """
     An encountered error while Parsing.
+
+    The location of the error is recorded as a reference to the input it
+    occurred in and an offset into it, rather than a copy of the remaining
+    input. The remaining input, line, and column are computed on access.
+
+    Only errors on a Cursor know where they occurred within the whole input;
+    for plain inputs, which are sliced as they are parsed, the offset, line,
+    and column are None.
     """
 
-    remaining: Parseable
+    # the input the error occurred in; the buffer of a Cursor, or the plain
+    # remaining input otherwise
+    _source: Parseable
+
+    # offset into the buffer of a Cursor, or None for plain inputs
+    _offset: Optional[int]
+
     kind: ErrorKind
 
+    def __init__(self, remaining: Parseable, kind: ErrorKind):
+        super().__init__()
+        if isinstance(remaining, Cursor):
+            self._source = remaining.buffer
+            self._offset = remaining.position
+        else:
+            self._source = remaining
+            self._offset = None
+        self.kind = kind
+
+    @classmethod
+    def at(cls, source: Parseable, offset: int, kind: ErrorKind) -> Error:
+        """
+        Creates an Error at an offset into a buffer, as if it occurred on a
+        Cursor at that position, without creating the Cursor.
+        """
+        return cls._located(source, offset, kind)
+
+    @classmethod
+    def _located(
+        cls, source: Parseable, offset: Optional[int], kind: ErrorKind
+    ) -> Error:
+        """
+        Creates an Error from its recorded location, without inspecting it.
+        """
+        error = cls.__new__(cls)
+        error._source = source
+        error._offset = offset
+        error.kind = kind
+        return error
+
+    @property
+    def remaining(self) -> Parseable:
+        """
+        The input that remained to be parsed when the error occurred.
+        """
+        if self._offset is None:
+            return self._source
+        return Cursor(self._source, self._offset)
+
+    @property
+    def source(self) -> Parseable:
+        """
+        The input the error occurred in: the whole buffer for Cursor inputs,
+        or the remaining input otherwise.
+        """
+        return self._source
+
+    @property
+    def offset(self) -> Optional[int]:
+        """
+        The offset into the source at which the error occurred, or None if it
+        did not occur on a Cursor.
+        """
+        return self._offset
+
+    @property
+    def line(self) -> Optional[int]:
+        """
+        The line number (0-indexed) of the error within its source, or None if
+        it did not occur on a Cursor.
+        """
+        if self._offset is None:
+            return None
+
+        (line, _) = _locate(self._source, self._offset)
+        return line
+
+    @property
+    def column(self) -> Optional[int]:
+        """
+        The column (0-indexed) of the error within its line, or None if it did
+        not occur on a Cursor.
+        """
+        if self._offset is None:
+            return None
+
+        (_, start) = _locate(self._source, self._offset)
+        return self._offset - start
+
     def as_int(self) -> int:
         """Gets the kind as an int."""
         return self.kind.value
@@ -65,7 +169,76 @@ class Error(Exception):
         """
         Create a new Error with the same values but a different ErrorKind.
         """
-        return Error(self.remaining, kind)
+        return type(self)._located(self._source, self._offset, kind)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Error):
+            return NotImplemented
+        return (self.kind == other.kind) and (self.remaining == other.remaining)
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        name = self.__class__.__name__
+        return f"{name}(remaining={self.remaining!r}, kind={self.kind!r})"
+
+    def __str__(self) -> str:
+        return str((self.remaining, self.kind))
+
+    def __reduce__(self):
+        return (self.__class__, (self.remaining, self.kind))
+
+
+class Incomplete(Error):
+    """
+    An Error signalling that the input ended before a streaming Parser could
+    tell whether it matches, so that it should be applied again once more
+    input is available.
+
+    `needed` is the number of additional elements the Parser needs at least,
+    or None if it is unknown.
+    """
+
+    needed: Optional[int]
+
+    def __init__(self, remaining: Parseable, needed: Optional[int] = None):
+        super().__init__(remaining, ErrorKind.INCOMPLETE)
+        self.needed = needed
+
+    def map_kind(self, kind: ErrorKind) -> Error:
+        # more input is needed whatever the kind of failure it would be
+        return self
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Incomplete) and self.needed != other.needed:
+            return False
+        return super().__eq__(other)
+
+    def __repr__(self) -> str:
+        return f"Incomplete(remaining={self.remaining!r}, needed={self.needed!r})"
+
+    def __reduce__(self):
+        return (self.__class__, (self.remaining, self.needed))
+
+
+def _locate(source: Parseable, offset: int) -> tuple[int, int]:
+    """
+    Gets the number of newlines before an offset into a source, along with the
+    offset at which the line containing it starts.
+    """
+    if isinstance(source, (memoryview, mmap.mmap)):
+        source = bytes(source[:offset])
+
+    if isinstance(source, (str, bytes, bytearray)):
+        newline = "\n" if isinstance(source, str) else b"\n"
+        lines = source.count(newline, 0, offset)  # type: ignore
+        return (lines, source.rfind(newline, 0, offset) + 1)  # type: ignore
+
+    (lines, start) = (0, 0)
+    for index in range(min(offset, len(source))):
+        if source[index] == "\n":
+            (lines, start) = (lines + 1, index + 1)
+    return (lines, start)
 
 
 @contextlib.contextmanager
@@ -102,3 +275,147 @@ def ignore_kind(kind: ErrorKind):
     except Error as error:
         if error.kind != kind:
             raise error
+
+
+# Outcome of a Parse Function
+#
+# Either the Result of a successful parse, or the Error describing the failure.
+# Errors are returned rather than raised so that combinators which expect
+# their children to fail (alt, optional, many0, ...) never pay for raising and
+# catching an Exception.
+Outcome = Result[S, Y] | Error
+
+# Parse Function
+#
+# Non-raising counterpart of a Parser, returning an Outcome.
+ParseFn = Callable[[S], Outcome[S, Y]]
+
+
+def raising(parse: ParseFn[S, Y]) -> Parser[S, Y]:
+    """
+    Lifts a parse function, which returns its Error on failure, into a Parser
+    that raises it.
+
+    The parse function remains reachable through `returning`, so combinators
+    can apply the Parser without ever raising.
+    """
+
+    def _raising(sequence: S) -> Result[S, Y]:
+        result = parse(sequence)
+        if isinstance(result, Error):
+            raise result
+
+        return result
+
+    setattr(_raising, "_chew_parse", parse)
+    _raising.__name__ = parse.__name__
+    _raising.__qualname__ = parse.__qualname__
+    _raising.__module__ = parse.__module__
+    _raising.__doc__ = parse.__doc__
+    return _raising
+
+
+def returning(parser: Parser[S, Y]) -> ParseFn[S, Y]:
+    """
+    Gets the parse function of a Parser, which returns its Error on failure
+    instead of raising it.
+
+    Nodes and Parsers built with `raising` provide a parse function already;
+    any other Parsers (such as user-defined functions) are wrapped so that
+    their raised Errors are returned.
+    """
+    if isinstance(parser, Node):
+        return parser.parse
+
+    # user-defined Parsers may well have a `parse` attribute of their own, so
+    # `raising` marks its Parsers with a private one
+    parse = getattr(parser, "_chew_parse", None)
+    if parse is not None:
+        return parse
+
+    def _returning(sequence: S) -> Outcome[S, Y]:
+        try:
+            return parser(sequence)
+        except Error as error:
+            return error
+
+    return _returning
+
+
+class Wrapper(Node[S, Y]):  # pylint: disable=abstract-method
+    """
+    Node wrapping a single child Parser, applied through its parse function.
+    """
+
+    __slots__ = ("child", "_parse")
+    __match_args__: tuple[str, ...] = ("child",)
+    _child_params: tuple[str, ...] = ("child",)
+
+    def __init__(self, child: Parser[S, Any]):
+        self.child = child
+        self._parse: ParseFn[S, Any] = returning(child)
+
+
+class WithKind(Wrapper[S, Y]):
+    """
+    Node mapping the ErrorKind of the failures of its child.
+    """
+
+    __slots__ = ("kind",)
+    __match_args__ = ("child", "kind")
+
+    def __init__(self, child: Parser[S, Y], kind: ErrorKind):
+        super().__init__(child)
+        self.kind = kind
+
+    def parse(self, sequence: S) -> Outcome[S, Y]:
+        result = self._parse(sequence)
+        if isinstance(result, Error):
+            return result.map_kind(self.kind)
+
+        return result
+
+    def first(self) -> Optional[frozenset[Any]]:
+        return first_of(self.child)
+
+
+class IgnoringKind(Wrapper[S, Y]):
+    """
+    Node succeeding with a value, without consuming any input, when its child
+    fails with the given ErrorKind.
+    """
+
+    __slots__ = ("kind", "value")
+    __match_args__ = ("child", "kind", "value")
+
+    def __init__(self, child: Parser[S, Y], kind: ErrorKind, value: Y):
+        super().__init__(child)
+        self.kind = kind
+        self.value = value
+
+    def parse(self, sequence: S) -> Outcome[S, Y]:
+        result = self._parse(sequence)
+        if isinstance(result, Error) and result.kind == self.kind:
+            return (sequence, self.value)
+
+        return result
+
+
+def with_kind(parser: Parser[S, Y], kind: ErrorKind) -> Parser[S, Y]:
+    """
+    Wraps a Parser, mapping the ErrorKind of its failures.
+
+    Unlike the `map_kind` context-manager, the mapping is set up once when the
+    Parser is built and is only applied when a failure actually occurs.
+    """
+    return WithKind(parser, kind)
+
+
+def ignoring_kind(parser: Parser[S, Y], kind: ErrorKind, value: Y) -> Parser[S, Y]:
+    """
+    Wraps a Parser, succeeding with the given value without consuming any input
+    when it fails with the given ErrorKind.
+
+    The construction-time counterpart of the `ignore_kind` context-manager.
+    """
+    return IgnoringKind(parser, kind, value)
@@ -2,23 +2,43 @@
 Generic parser generators.
 """
 # pylint: disable=invalid-name
+from __future__ import annotations
 __all__ = [
+    "IsA",
+    "IsNot",
+    "MinOne",
+    "Tag",
+    "Take",
+    "TakeTill",
+    "TakeUntil",
+    "TakeUntilAny",
+    "TakeWhile",
+    "TakeWhileBounded",
     "take",
     "take_till",
     "take_till1",
     "take_until",
     "take_until1",
+    "take_until_any",
     "take_while",
     "take_while1",
     "take_while_bounded",
+    "Tags",
     "tag",
+    "tags",
     "is_a",
     "is_not",
 ]
-from typing import TypeVar, Sized
-from chew.error import Error, ErrorKind, map_kind
-from chew.types import Parser, Matcher, Result, S
-from chew.primitive import take as ptake, next_item, peek, eof
+from typing import Any, Callable, Iterable, Optional, Sequence, TypeVar, Sized
+import itertools
+import mmap
+import operator
+import re
+from chew.charclass import CharClass
+from chew.cursor import Cursor
+from chew.error import Error, ErrorKind, IgnoringKind, Outcome, Wrapper
+from chew.types import Matcher, Node, Parser, S, first_of
+from chew.primitive import take as ptake, eof, find, starts_with
 
 # Sized Yielded Element
 #
@@ -26,75 +46,185 @@ from chew.primitive import take as ptake, next_item, peek, eof
 I = TypeVar("I", bound=Sized)
 
 
-def _min_one(wrapped: Parser[S, I], error: ErrorKind) -> Parser[S, I]:
+def _elements(items: Iterable[Any]) -> Optional[frozenset[Any]]:
     """
-    Wraps the provided parser and raises an exception with the given kind if the
-    returned Parser result does not have at least one element.
+    Gets the set of the given elements, or None if they are not hashable.
     """
+    try:
+        return frozenset(items)
+    except TypeError:
+        return None
 
-    def __min_one(sequence: S) -> Result[S, I]:
-        result = wrapped(sequence)
-        (_, match) = result
 
+def _class_run(parser: Parser) -> Optional[CharClass]:
+    """
+    Gets the CharClass of which a Parser takes the longest run, if the run is
+    all it yields when it is not empty, or None.
+    """
+    match parser:
+        case TakeWhile(cond=CharClass() as cond):
+            return cond
+        case TakeTill(cond=CharClass() as cond):
+            return cond.negate()
+        case IgnoringKind(child=IsA(items=items), kind=ErrorKind.IS_A, value=""):
+            charclass = _charclass(items)
+        case IgnoringKind(child=IsNot(items=items), kind=ErrorKind.IS_NOT, value=""):
+            charclass = _charclass(items)
+            if isinstance(charclass, CharClass):
+                charclass = charclass.negate()
+        case _:
+            return None
+
+    return charclass if isinstance(charclass, CharClass) else None
+
+
+class MinOne(Wrapper[S, I]):
+    """
+    Node failing with the given kind if the value yielded by its child does not
+    have at least one element.
+
+    When the child takes a run of a CharClass (as `digit0` does), the run is
+    taken directly, with a single match of the compiled class.
+    """
+
+    __slots__ = ("kind", "_run")
+    __match_args__ = ("child", "kind")
+
+    def __init__(self, child: Parser[S, I], kind: ErrorKind):
+        self.kind = kind
+        super().__init__(child)
+        self._run = _class_run(child)
+
+    def parse(self, sequence: S) -> Outcome[S, I]:
+        if self._run is not None:
+            count = self._run.run(sequence)
+            if count == 0:
+                return Error(sequence, self.kind)
+            return ptake(sequence, count)  # type: ignore
+
+        result = self._parse(sequence)
+        if isinstance(result, Error):
+            return result
+
+        (_, match) = result
         if len(match) == 0:
-            raise Error(sequence, error)
+            return Error(sequence, self.kind)
 
         return result
 
-    return __min_one
+    def first(self) -> Optional[frozenset[Any]]:
+        # a non-empty run of a class starts with one of its elements
+        if self._run is not None:
+            return self._run.elements
 
+        child = self.child
+        # an empty value yielded in place of a failure never gets past this
+        # Node, so only the wrapped Parser may succeed
+        if isinstance(child, IgnoringKind) and isinstance(child.value, Sized):
+            if len(child.value) == 0:
+                child = child.child
 
-def take(count: int) -> Parser[S, S]:
+        return first_of(child)
+
+
+def _min_one(wrapped: Parser[S, I], error: ErrorKind) -> Parser[S, I]:
     """
-    Take count elements from the stream.
+    Wraps the provided parser and raises an exception with the given kind if the
+    returned Parser result does not have at least one element.
+    """
+    return MinOne(wrapped, error)
 
-    Returns an error if the stream was exhausted in the process.
+
+class Take(Node[S, S]):
+    """
+    Node taking a fixed number of elements.
     """
 
-    def _take(sequence: S) -> Result[S, S]:
-        divided = ptake(sequence, count)
+    __slots__ = ("count",)
+    __match_args__ = ("count",)
+
+    def __init__(self, count: int):
+        self.count = count
+
+    def parse(self, sequence: S) -> Outcome[S, S]:
+        divided = ptake(sequence, self.count)
         if divided is None:
-            raise Error(sequence, ErrorKind.EOF)
+            return Error(sequence, ErrorKind.EOF)
 
         return divided
 
-    return _take
 
+def take(count: int) -> Parser[S, S]:
+    """
+    Take count elements from the stream.
 
-def _count_till(sequence: S, cond: Matcher, value: bool) -> int:
+    Returns an error if the stream was exhausted in the process.
     """
-    Counts the number of contiguous elements for which the matcher is equal to
-    the desired value.
+    return Take[S](count)
+
+
+def _count_till(
+    sequence: S, cond: Matcher, value: bool, limit: Optional[int] = None
+) -> int:
     """
-    current = sequence
-    count = 0
-    element = peek(current)
+    Counts the number of contiguous elements (up to `limit`) for which the
+    truthiness of the matcher is equal to the desired value.
 
-    while (element is not None) and (cond(element) == value):
-        result = next_item(current)
-        assert result is not None
+    Runs in a single pass over the sequence without re-slicing it; the only
+    Python-level call made per element is the matcher itself.
+    """
+    size = len(sequence) if limit is None else min(len(sequence), limit)
+    elements = iter(sequence) if limit is None else itertools.islice(sequence, limit)
 
-        count += 1
-        (current, _) = result
-        element = peek(current)
+    # the index of the first element whose matcher result differs from the
+    # desired value is the length of the matching run
+    stops = map(cond, elements)
+    if value:
+        stops = map(operator.not_, stops)
 
-    return count
+    return next(itertools.compress(itertools.count(), stops), size)
 
 
-def take_till(cond: Matcher) -> Parser[S, S]:
+def _counter(cond: Matcher, value: bool) -> Callable[[Any], int]:
     """
-    Take from the state until the condition is true.
+    Builds the function counting the contiguous elements at the start of a
+    sequence for which the truthiness of the matcher is equal to the desired
+    value, consuming runs of a CharClass with a single match.
+    """
+    if isinstance(cond, CharClass):
+        return (cond if value else cond.negate()).run
+
+    return lambda sequence: _count_till(sequence, cond, value)
+
+
+class TakeTill(Node[S, S]):
+    """
+    Node taking elements until the condition is true.
     """
 
-    def _take_till(sequence: S) -> Result[S, S]:
+    __slots__ = ("cond", "_count")
+    __match_args__ = ("cond",)
+
+    def __init__(self, cond: Matcher):
+        self.cond = cond
+        self._count = _counter(cond, False)
+
+    def parse(self, sequence: S) -> Outcome[S, S]:
         if eof(sequence):
-            return (sequence, sequence)
+            return (sequence, sequence[:0])  # type: ignore
+
+        count = self._count(sequence)
+        divided = ptake(sequence, count)
+        assert divided is not None
+
+        return divided
 
-        count = _count_till(sequence, cond, False)
-        taker: Parser[S, S] = take(count)
-        return taker(sequence)
 
-    return _take_till
+def take_till(cond: Matcher) -> Parser[S, S]:
+    """
+    Take from the state until the condition is true.
+    """
+    return TakeTill[S](cond)
 
 
 def take_till1(cond: Matcher) -> Parser[S, S]:
@@ -104,40 +234,120 @@ def take_till1(cond: Matcher) -> Parser[S, S]:
     return _min_one(take_till(cond), ErrorKind.TAKE_TILL)
 
 
+class TakeUntil(Node[S, S]):
+    """
+    Node taking elements up to the first occurrence of a pattern.
+    """
+
+    __slots__ = ("pattern",)
+    __match_args__ = ("pattern",)
+
+    def __init__(self, pattern: S):
+        self.pattern = pattern
+
+    def parse(self, sequence: S) -> Outcome[S, S]:
+        if eof(sequence):
+            return Error(sequence, ErrorKind.TAKE_UNTIL)
+
+        index = find(sequence, self.pattern)
+        if index < 0:
+            return Error(sequence, ErrorKind.TAKE_UNTIL)
+
+        # SAFETY: a found index is always within the bounds of the sequence
+        result = ptake(sequence, index)
+        assert result is not None
+
+        return result
+
+
 def take_until(to_match: S) -> Parser[S, S]:
     """
     Returns the input slice up to the first occurrence of the pattern.
     """
+    return TakeUntil(to_match)
+
+
+def _search_any(patterns: Sequence[Any]) -> Callable[[Any, int], int]:
+    """
+    Builds a function finding the earliest index (at or after a starting
+    position) in a buffer at which any of the patterns occur, or -1.
+    """
+    regex: Optional[re.Pattern] = None
+    searchable: tuple[type, ...] = ()
+    if patterns and all(isinstance(p, str) for p in patterns):
+        regex = re.compile("|".join(re.escape(p) for p in patterns))
+        searchable = (str,)
+    elif patterns and all(isinstance(p, (bytes, bytearray)) for p in patterns):
+        regex = re.compile(b"|".join(re.escape(bytes(p)) for p in patterns))
+        searchable = (bytes, bytearray, memoryview, mmap.mmap)
+
+    # patterns grouped by their leading element, so that each position of the
+    # buffer is only compared against the patterns that could start there
+    by_first: dict[Any, list[Any]] = {}
+    for pattern in patterns:
+        if len(pattern) == 0:
+            return lambda buffer, start: start
+        by_first.setdefault(pattern[0], []).append(pattern)
+
+    def _search(buffer: Any, start: int) -> int:
+        if regex is not None and isinstance(buffer, searchable):
+            found = regex.search(buffer, start)
+            return -1 if found is None else found.start()
+
+        for index in range(start, len(buffer)):
+            for pattern in by_first.get(buffer[index], ()):
+                end = index + len(pattern)
+                if end <= len(buffer) and all(
+                    buffer[index + offset] == element
+                    for offset, element in enumerate(pattern)
+                ):
+                    return index
+
+        return -1
+
+    return _search
+
+
+class TakeUntilAny(Node[S, S]):
+    """
+    Node taking elements up to the earliest occurrence of any of the patterns.
+    """
+
+    __slots__ = ("patterns", "_search")
+    __match_args__ = ("patterns",)
 
-    def _take_until(sequence: S) -> Result[S, S]:
+    def __init__(self, patterns: Iterable[S]):
+        self.patterns = tuple(patterns)
+        self._search = _search_any(self.patterns)
+
+    def parse(self, sequence: S) -> Outcome[S, S]:
         if eof(sequence):
-            raise Error(sequence, ErrorKind.TAKE_UNTIL)
-
-        longest = 0
-        current: S = sequence[longest:]  # type: ignore
-        exhausted = True
-
-        while not eof(current):
-            try:
-                tag(to_match)(current)
-                exhausted = False
-                break
-            except Error:
-                pass
-            longest += 1
-            current: S = sequence[longest:]  # type: ignore
-
-        if exhausted:
-            raise Error(sequence, ErrorKind.TAKE_UNTIL)
-
-        # SAFETY: cannot be None if we made sure that we didn't exhaust the
-        # input, which we check above
-        result = ptake(sequence, longest)
+            return Error(sequence, ErrorKind.TAKE_UNTIL)
+
+        if isinstance(sequence, Cursor):
+            index = self._search(sequence.buffer, sequence.position)
+            index = index if index < 0 else index - sequence.position
+        else:
+            index = self._search(sequence, 0)
+
+        if index < 0:
+            return Error(sequence, ErrorKind.TAKE_UNTIL)
+
+        # SAFETY: a found index is always within the bounds of the sequence
+        result = ptake(sequence, index)
         assert result is not None
 
         return result
 
-    return _take_until
+
+def take_until_any(patterns: Iterable[S]) -> Parser[S, S]:
+    """
+    Returns the input slice up to the earliest occurrence of any of the
+    patterns.
+
+    All patterns are searched for in a single pass over the input.
+    """
+    return TakeUntilAny(patterns)
 
 
 def take_until1(to_match: S) -> Parser[S, S]:
@@ -147,20 +357,34 @@ def take_until1(to_match: S) -> Parser[S, S]:
     return _min_one(take_until(to_match), ErrorKind.TAKE_UNTIL)
 
 
-def take_while(cond: Matcher) -> Parser[S, S]:
+class TakeWhile(Node[S, S]):
     """
-    Returns the longest input slice that matches the condition.
+    Node taking elements while the condition is true.
     """
 
-    def _take_while(sequence: S) -> Result[S, S]:
+    __slots__ = ("cond", "_count")
+    __match_args__ = ("cond",)
+
+    def __init__(self, cond: Matcher):
+        self.cond = cond
+        self._count = _counter(cond, True)
+
+    def parse(self, sequence: S) -> Outcome[S, S]:
         if eof(sequence):
-            return (sequence, sequence)
+            return (sequence, sequence[:0])  # type: ignore
 
-        count = _count_till(sequence, cond, True)
-        taker: Parser[S, S] = take(count)
-        return taker(sequence)
+        count = self._count(sequence)
+        divided = ptake(sequence, count)
+        assert divided is not None
 
-    return _take_while
+        return divided
+
+
+def take_while(cond: Matcher) -> Parser[S, S]:
+    """
+    Returns the longest input slice that matches the condition.
+    """
+    return TakeWhile[S](cond)
 
 
 def take_while1(cond: Matcher) -> Parser[S, S]:
@@ -170,68 +394,246 @@ def take_while1(cond: Matcher) -> Parser[S, S]:
     return _min_one(take_while(cond), ErrorKind.TAKE_WHILE)
 
 
+class TakeWhileBounded(Node[S, S]):
+    """
+    Node taking between `lower` and `upper` elements while the condition is
+    true.
+    """
+
+    __slots__ = ("lower", "upper", "cond")
+    __match_args__ = ("lower", "upper", "cond")
+
+    def __init__(self, lower: int, upper: int, cond: Matcher):
+        self.lower = lower
+        self.upper = upper
+        self.cond = cond
+
+    def parse(self, sequence: S) -> Outcome[S, S]:
+        valid = _count_till(sequence, self.cond, True, self.upper)
+        if valid < self.lower:
+            return Error(sequence, ErrorKind.TAKE_WHILE_BOUNDED)
+
+        divided = ptake(sequence, valid)
+        if divided is None:
+            return Error(sequence, ErrorKind.EOF)
+
+        return divided
+
+
 def take_while_bounded(lower: int, upper: int, cond: Matcher) -> Parser[S, S]:
     """
     Returns the longest (lower <= len <= upper) input slice that matches the predicate.
     """
+    return TakeWhileBounded[S](lower, upper, cond)
+
+
+class Tag(Node[S, S]):
+    """
+    Node matching & consuming a fixed sequence of elements.
+    """
 
-    def _take_while_bounded(sequence: S) -> Result[S, S]:
-        valid = 0
-        maximum = min(len(sequence), upper)
+    __slots__ = ("pattern",)
+    __match_args__ = ("pattern",)
 
-        while (valid < maximum) and cond(sequence[valid]):
-            valid += 1
+    def __init__(self, pattern: S):
+        self.pattern = pattern
 
-        if valid < lower:
-            raise Error(sequence, ErrorKind.TAKE_WHILE_BOUNDED)
+    def parse(self, sequence: S) -> Outcome[S, S]:
+        if eof(sequence) or not starts_with(sequence, self.pattern):
+            return Error(sequence, ErrorKind.TAG)
 
-        taker: Parser[S, S] = take(valid)
-        return taker(sequence)
+        current: S = sequence[len(self.pattern) :]  # type: ignore
+        return (current, self.pattern)
 
-    return _take_while_bounded
+    def first(self) -> Optional[frozenset[Any]]:
+        if len(self.pattern) == 0:
+            return None
+
+        return _elements(self.pattern[:1])
 
 
 def tag(to_match: S) -> Parser[S, S]:
     """
     Matches & Consumes a sequence of elements.
     """
+    return Tag(to_match)
 
-    def _tag(sequence: S) -> Result[S, S]:
-        taker: Parser[S, S] = take(len(to_match))
-        with map_kind(ErrorKind.TAG):
-            (current, next_items) = taker(sequence)
 
-        for expected, existing in zip(to_match, next_items):
-            if existing != expected:
-                raise Error(sequence, ErrorKind.TAG)
+def _keyer(keywords: tuple[Any, ...], folded: bool) -> Callable[[Any], Any]:
+    """
+    Builds the function turning a slice of the input into the hashable key it
+    is looked up by, folding its case if asked to.
+    """
+    key: Callable[[Any], Any] = tuple
+    if all(isinstance(keyword, str) for keyword in keywords):
+        key = str
+    elif all(isinstance(keyword, (bytes, bytearray)) for keyword in keywords):
+        key = bytes
 
-        return (current, to_match)
+    if folded:
+        return lambda elements: key(elements).lower()
+    return key
 
-    return _tag
 
+class Tags(Node[S, S]):
+    """
+    Node matching one of a set of keywords, with a dict lookup per candidate
+    keyword length rather than a comparison per keyword.
+    """
 
-def is_a(items: S) -> Parser[S, S]:
+    __slots__ = (
+        "keywords",
+        "case_insensitive",
+        "longest",
+        "_key",
+        "_lengths",
+        "_default",
+        "_buckets",
+    )
+    __match_args__ = ("keywords", "case_insensitive", "longest")
+
+    def __init__(
+        self,
+        keywords: Iterable[S],
+        case_insensitive: bool = False,
+        longest: bool = True,
+    ):
+        self.keywords = tuple(keywords)
+        self.case_insensitive = case_insensitive
+        self.longest = longest
+        self._key = _keyer(self.keywords, case_insensitive)
+
+        # keywords by length, then by key, to their index in the keywords
+        self._buckets: dict[int, dict[Any, int]] = {}
+        # candidate keyword lengths by the key of the first element of a match
+        heads: dict[Any, set[int]] = {}
+        for (index, keyword) in enumerate(self.keywords):
+            size = len(keyword)
+            self._buckets.setdefault(size, {}).setdefault(self._key(keyword), index)
+            heads.setdefault(self._key(keyword[:1]), set()).add(size)
+
+        empty = heads.pop(self._key(self.keywords[0][:0]), set()) if heads else set()
+        self._default = tuple(empty)
+        self._lengths = {
+            head: tuple(sorted(sizes | empty, reverse=True))
+            for (head, sizes) in heads.items()
+        }
+
+    def parse(self, sequence: S) -> Outcome[S, S]:
+        key = self._key
+        size = len(sequence)
+        (found, matched) = (len(self.keywords), 0)
+        for length in self._lengths.get(key(sequence[:1]), self._default):
+            if length > size:
+                continue
+
+            index = self._buckets[length].get(key(sequence[:length]), found)
+            if index < found:
+                (found, matched) = (index, length)
+                if self.longest:
+                    break
+
+        if found == len(self.keywords):
+            return Error(sequence, ErrorKind.TAG)
+
+        if self.case_insensitive:
+            return (sequence[matched:], sequence[:matched])  # type: ignore
+        return (sequence[matched:], self.keywords[found])  # type: ignore
+
+    def first(self) -> Optional[frozenset[Any]]:
+        if self.case_insensitive or self._default:
+            return None
+
+        return _elements(keyword[0] for keyword in self.keywords)
+
+
+def tags(
+    keywords: Iterable[S], case_insensitive: bool = False, longest: bool = True
+) -> Parser[S, S]:
     """
-    Returns the longest slice whose elements are in the sequence of items.
+    Matches & Consumes one of the keywords.
+
+    The longest matching keyword is yielded, or the first one (in order) when
+    `longest` is False, as with an `alt` of tags. Case-insensitive keywords (str
+    or bytes) yield the matched input, as with `tag_no_case`. Matching costs a
+    lookup per distinct length of the keywords starting like the input,
+    regardless of the number of keywords.
     """
+    return Tags(keywords, case_insensitive, longest)
 
-    def _is_a(sequence: S) -> Result[S, S]:
-        with map_kind(ErrorKind.IS_A):
-            taker: Parser[S, S] = take_while1(lambda el: el in items)
-            return taker(sequence)
 
-    return _is_a
+def _charclass(items: Any) -> Matcher:
+    """
+    Compiles items into a CharClass, or gets their membership test if they are
+    not hashable.
+    """
+    if isinstance(items, CharClass):
+        return items
+    if _elements(items) is None:
+        return items.__contains__
+    return CharClass(items)
 
 
-def is_not(items: S) -> Parser[S, S]:
+class IsA(Node[S, S]):
     """
-    Returns the longest slice whose elements do not contain the sequence of
-    items.
+    Node taking the longest non-empty run of elements found in `items`, which
+    are compiled into a CharClass.
+    """
+
+    __slots__ = ("items", "_class", "_count")
+    __match_args__ = ("items",)
+
+    def __init__(self, items: S | CharClass):
+        self.items = items
+        self._class = _charclass(items)
+        self._count = _counter(self._class, True)
+
+    def parse(self, sequence: S) -> Outcome[S, S]:
+        count = self._count(sequence)
+        if count == 0:
+            return Error(sequence, ErrorKind.IS_A)
+
+        return ptake(sequence, count)  # type: ignore
+
+    def first(self) -> Optional[frozenset[Any]]:
+        # items which are not hashable are not compiled
+        if isinstance(self._class, CharClass):
+            return self._class.elements
+        return None
+
+
+def is_a(items: S | CharClass) -> Parser[S, S]:
     """
+    Returns the longest slice whose elements are in the sequence of items (or
+    in the CharClass).
+    """
+    return IsA(items)
+
 
-    def _is_not(sequence: S) -> Result[S, S]:
-        with map_kind(ErrorKind.IS_NOT):
-            taker: Parser[S, S] = take_while1(lambda el: el not in items)
-            return taker(sequence)
+class IsNot(Node[S, S]):
+    """
+    Node taking the longest non-empty run of elements not found in `items`,
+    which are compiled into a CharClass.
+    """
 
-    return _is_not
+    __slots__ = ("items", "_count")
+    __match_args__ = ("items",)
+
+    def __init__(self, items: S | CharClass):
+        self.items = items
+        self._count = _counter(_charclass(items), False)
+
+    def parse(self, sequence: S) -> Outcome[S, S]:
+        count = self._count(sequence)
+        if count == 0:
+            return Error(sequence, ErrorKind.IS_NOT)
+
+        return ptake(sequence, count)  # type: ignore
+
+
+def is_not(items: S | CharClass) -> Parser[S, S]:
+    """
+    Returns the longest slice whose elements do not contain the sequence of
+    items (or the CharClass).
+    """
+    return IsNot(items)
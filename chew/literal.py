@@ -1,32 +1,23 @@
 """
 Parser Wrappers for Python Literals.
 """
+from __future__ import annotations
 import string as stdstring
-from chew.combine import map_res
-from chew.generic import is_a
-from chew.error import ErrorKind, map_exception, map_kind
-from chew.types import Result
+from chew.combine import MapRes
+from chew.generic import IsA
+from chew.error import ErrorKind, WithKind
+from chew.types import Parser
 
 # Character Makeup of an Integer Literal
 INT_COMPONENTS = stdstring.digits + "_"
 FLOAT_COMPONENTS = stdstring.digits + "_.eE+-"
 
+# Parses a decimal integer literal.
+int_literal: Parser[str, int] = WithKind(
+    MapRes(IsA(INT_COMPONENTS), int), ErrorKind.INTEGER
+)
 
-def int_literal(sequence: str) -> Result[str, int]:
-    """
-    Parses a decimal integer literal.
-    """
-
-    with map_kind(ErrorKind.INTEGER):
-        with map_exception(ValueError, sequence, ErrorKind.INTEGER):
-            return map_res(is_a(INT_COMPONENTS), int)(sequence)
-
-
-def float_literal(sequence: str) -> Result[str, float]:
-    """
-    Parses a float literal.
-    """
-
-    with map_kind(ErrorKind.FLOAT):
-        with map_exception(ValueError, sequence, ErrorKind.INTEGER):
-            return map_res(is_a(FLOAT_COMPONENTS), float)(sequence)
+# Parses a float literal.
+float_literal: Parser[str, float] = WithKind(
+    MapRes(IsA(FLOAT_COMPONENTS), float), ErrorKind.FLOAT
+)
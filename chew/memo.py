@@ -0,0 +1,326 @@
+"""
+Packrat memoization of Parsers.
+"""
+from __future__ import annotations
+__all__ = ["LeftRecursive", "Memo", "MemoTable", "left_recursive", "memo", "memoize"]
+import collections
+import contextvars
+import heapq
+from typing import Any, Optional, TypeVar
+from chew.cursor import Cursor
+from chew.error import Error, ErrorKind, Incomplete, Outcome, Wrapper
+from chew.types import Node, Parser, S
+
+# Generic Yielded Element
+#
+# Yielded element from a Parser that we care about.
+Y = TypeVar("Y")
+
+
+# The tables of the rules growing in the current thread (or task)
+#
+# A rule may be reached (indirectly) from a rule memoized in another table, so
+# every table checks the locations at which the rules of these tables grow.
+_GROWING: contextvars.ContextVar[tuple[MemoTable, ...]] = contextvars.ContextVar(
+    "growing", default=()
+)
+
+
+def _locate(sequence: Any) -> tuple[int, Any, int]:
+    """
+    Gets the identity of the input a sequence is the remainder of, the input
+    itself, and the position of the sequence within it.
+
+    Input other than a Cursor is a new object every time it is sliced, so it
+    is identified by its content instead, and its position is minus its length
+    so that positions still grow as it is consumed.
+    """
+    if isinstance(sequence, Cursor):
+        return (id(sequence.buffer), sequence.buffer, sequence.position)
+    return (0, sequence, -len(sequence))
+
+
+class MemoTable:  # pylint: disable=too-many-instance-attributes
+    """
+    A bounded cache of the outcomes of Parsers at positions of their input,
+    along with the number of lookups which hit and missed it.
+
+    When full, the least recently used outcome is dropped. With a `window`,
+    the outcomes more than `window` elements behind the furthest position
+    parsed are also dropped, as a parse rarely backtracks that far.
+
+    Outcomes are stored along with their input. Input other than a Cursor is
+    a copy of the rest of the input, compared in full on every lookup, so
+    large inputs are best memoized as Cursors, whose buffer is shared.
+
+    The table also holds the seeds of its left-recursive rules growing at
+    positions of the input (see `LeftRecursive`). No table stores an outcome at
+    a position while any rule grows there (in the same thread), as it may
+    depend on a partial seed.
+    """
+
+    __slots__ = (
+        "size",
+        "window",
+        "hits",
+        "misses",
+        "_entries",
+        "_positions",
+        "_furthest",
+        "_seeds",
+        "_growing",
+    )
+
+    def __init__(self, size: int = 1 << 16, window: Optional[int] = None):
+        self.size = size
+        self.window = window
+        self.hits = 0
+        self.misses = 0
+        # (parser id, input identity, position) -> (input, position, outcome)
+        self._entries: collections.OrderedDict[
+            tuple[int, int, int], tuple[Any, int, Outcome]
+        ] = collections.OrderedDict()
+        # heap of the positions of the entries, to drop those behind the window
+        # (lookups reorder the entries, so they aren't ordered by position)
+        self._positions: list[tuple[int, tuple[int, int, int]]] = []
+        self._furthest: Optional[int] = None
+        # (parser id, input identity, position) -> (input, seed)
+        self._seeds: dict[tuple[int, int, int], tuple[Any, Outcome]] = {}
+        # (input identity, position) -> number of rules growing there
+        self._growing: dict[tuple[int, int], int] = {}
+
+    def lookup(self, key: tuple[int, int, int], source: Any) -> Optional[Outcome]:
+        """
+        Gets the outcome stored for a key, or None.
+        """
+        entry = self._entries.get(key)
+        # SAFETY: entries hold their input, so the id of a Cursor buffer can't
+        # have been reused; other input is compared, which costs no more than
+        # the slicing that produced it
+        if entry is None or not (entry[0] is source or entry[0] == source):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[2]
+
+    def store(
+        self, key: tuple[int, int, int], source: Any, position: int, outcome: Outcome
+    ):
+        """
+        Stores the outcome for a key, dropping the outcomes which no longer fit.
+        """
+        location = key[1:]
+        if any(table.growing(location) for table in _GROWING.get()):
+            return
+
+        entries = self._entries
+        entries[key] = (source, position, outcome)
+        if len(entries) > self.size:
+            entries.popitem(last=False)
+
+        if self.window is None:
+            return
+        if self._furthest is None or position > self._furthest:
+            self._furthest = position
+
+        positions = self._positions
+        heapq.heappush(positions, (position, key))
+        horizon = self._furthest - self.window
+        while positions[0][0] < horizon:
+            (_, oldest) = heapq.heappop(positions)
+            entries.pop(oldest, None)
+
+        if len(positions) > 2 * self.size:
+            # drop the positions of the entries which were dropped as unused
+            positions[:] = [(entry[1], stored) for (stored, entry) in entries.items()]
+            heapq.heapify(positions)
+
+    def growing(self, location: tuple[int, int]) -> bool:
+        """
+        Checks whether a rule of the table grows at an (input identity,
+        position) location.
+        """
+        return location in self._growing
+
+    def seed(self, key: tuple[int, int, int], source: Any) -> Optional[Outcome]:
+        """
+        Gets the seed of the rule growing for a key, or None.
+        """
+        entry = self._seeds.get(key)
+        if entry is None or not (entry[0] is source or entry[0] == source):
+            return None
+        return entry[1]
+
+    def plant(self, key: tuple[int, int, int], source: Any, seed: Outcome):
+        """
+        Sets the seed of a rule for a key, marking its position as growing.
+        """
+        if key not in self._seeds:
+            location = key[1:]
+            self._growing[location] = self._growing.get(location, 0) + 1
+        self._seeds[key] = (source, seed)
+
+    def uproot(self, key: tuple[int, int, int]):
+        """
+        Removes the seed of a rule for a key, once it has stopped growing.
+        """
+        del self._seeds[key]
+        location = key[1:]
+        self._growing[location] -= 1
+        if not self._growing[location]:
+            del self._growing[location]
+
+    def clear(self):
+        """
+        Drops every outcome and resets the counters, between parses.
+        """
+        self._entries.clear()
+        self._positions.clear()
+        self._furthest = None
+        self._seeds.clear()
+        self._growing.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __reduce__(self):
+        return (MemoTable, (self.size, self.window))
+
+    def __repr__(self) -> str:
+        return f"MemoTable({self.size}, {self.window})"
+
+
+class Memo(Wrapper[S, Y]):
+    """
+    Node storing the outcomes of its child in a MemoTable, so that it is only
+    applied once at each position of an input.
+    """
+
+    __slots__ = ("table",)
+    __match_args__ = ("child", "table")
+
+    def __init__(self, child: Parser[S, Y], table: Optional[MemoTable] = None):
+        super().__init__(child)
+        self.table = MemoTable() if table is None else table
+
+    def parse(self, sequence: S) -> Outcome[S, Y]:
+        (identity, source, position) = _locate(sequence)
+        key = (id(self), identity, position)
+        outcome = self.table.lookup(key, source)
+        if outcome is None:
+            outcome = self._parse(sequence)
+            self.table.store(key, source, position, outcome)
+
+        return outcome
+
+
+def memo(
+    parser: Parser[S, Y], size: int = 1 << 16, window: Optional[int] = None
+) -> Parser[S, Y]:
+    """
+    Memoizes the outcome (value or Error) of a Parser at each position of the
+    input, so that backtracking over it (as `alt` does) never parses the same
+    input with it twice.
+
+    At most `size` outcomes are kept, and with a `window` only those within
+    `window` elements of the furthest position parsed. The hits and misses are
+    counted by the `table` of the returned Memo.
+    """
+    return Memo(parser, MemoTable(size, window))
+
+
+class LeftRecursive(Memo[S, Y]):
+    """
+    Memo of a rule which may refer to itself (directly or through other rules)
+    at the start of its input, growing its outcome from a seed.
+
+    The left-recursive reference first fails, so that only the non-recursive
+    alternatives of the rule match; the rule is then re-applied with each
+    outcome as the value of the reference, until it stops consuming more of
+    the input.
+    """
+
+    __slots__ = ()
+
+    def parse(self, sequence: S) -> Outcome[S, Y]:
+        (identity, source, position) = _locate(sequence)
+        key = (id(self), identity, position)
+        table = self.table
+        outcome = table.seed(key, source)
+        if outcome is not None:
+            return outcome
+        outcome = table.lookup(key, source)
+        if outcome is not None:
+            return outcome
+
+        table.plant(key, source, Error(sequence, ErrorKind.LEFT_RECURSION))
+        token = _GROWING.set((*_GROWING.get(), table))
+        try:
+            outcome = self._parse(sequence)
+            while not isinstance(outcome, Error):
+                table.plant(key, source, outcome)
+                grown = self._parse(sequence)
+                if isinstance(grown, Incomplete):
+                    outcome = grown
+                    break
+                if isinstance(grown, Error) or len(grown[0]) >= len(outcome[0]):
+                    break
+                outcome = grown
+        finally:
+            _GROWING.reset(token)
+            table.uproot(key)
+
+        table.store(key, source, position, outcome)
+        return outcome
+
+
+def left_recursive(
+    parser: Parser[S, Y], size: int = 1 << 16, window: Optional[int] = None
+) -> Parser[S, Y]:
+    """
+    Allows a rule to refer to itself at the start of its input, so that left
+    associative grammars can be written as they are specified:
+
+        def expr(sequence):
+            return rule(sequence)
+
+        rule = left_recursive(alt([separated_pair(expr, char("+"), term), term]))
+
+    Each position is parsed once per growth of the rule, and the outcome is
+    memoized as with `memo`. Indirect left recursion is supported as long as
+    every cycle of rules goes through a `left_recursive` rule.
+    """
+    return LeftRecursive(parser, MemoTable(size, window))
+
+
+def _memoize(parser: Parser, table: MemoTable, seen: dict[int, Parser]) -> Parser:
+    """
+    Memoizes every Node with children of a grammar, bottom-up.
+    """
+    if not isinstance(parser, Node) or isinstance(parser, Memo):
+        return parser
+
+    key = id(parser)
+    if key not in seen:
+        node = parser.map_children(lambda child: _memoize(child, table, seen))
+        seen[key] = Memo(node, table) if node.children else node
+
+    return seen[key]
+
+
+def memoize(
+    grammar: Parser[S, Y], size: int = 1 << 16, window: Optional[int] = None
+) -> Parser[S, Y]:
+    """
+    Memoizes every combinator of a grammar (every Node with children) with a
+    single, shared, MemoTable.
+
+    Parsers which are not Nodes, such as the functions through which a grammar
+    refers to itself recursively, are kept as they are; they may be memoized
+    with `memo`, or with a `Memo` sharing the table of another Memo.
+    """
+    return _memoize(grammar, MemoTable(size, window), {})
@@ -0,0 +1,189 @@
+"""
+Optimization passes over grammars built from Nodes.
+"""
+from __future__ import annotations
+__all__ = ["FusedTag", "optimize"]
+from typing import Any, Optional, TypeVar
+from chew.combine import Conditional, Success
+from chew.error import Error, Outcome
+from chew.generic import Tag
+from chew.sequence import Keep, Sequence, _Const, _projector
+from chew.string import Char
+from chew.types import Node, Parser, S
+
+# Generic Yielded Element
+#
+# Yielded element from a Parser that we care about.
+Y = TypeVar("Y")
+
+
+class FusedTag(Node[S, S]):
+    """
+    Node matching a run of adjacent literals (Tag and Char nodes) with a single
+    comparison, yielding the joined pattern.
+
+    On failure, the literals are applied one after another so that the Error
+    is exactly the one the unfused run would have returned.
+    """
+
+    __slots__ = ("parts", "pattern", "_tag", "_fallback")
+    __match_args__ = ("parts",)
+    _child_params = ("parts",)
+
+    def __init__(self, parts: tuple[Parser, ...]):
+        self.parts = tuple(parts)
+        literals: list[Any] = [_literal(part) for part in self.parts]
+        self.pattern = literals[0][:0].join(literals)
+        self._tag = Tag(self.pattern)
+        self._fallback = Sequence(self.parts)
+
+    def parse(self, sequence: S) -> Outcome[S, S]:
+        result = self._tag.parse(sequence)
+        if isinstance(result, Error):
+            return self._fallback.parse(sequence)
+
+        return result
+
+    def first(self) -> Optional[frozenset[Any]]:
+        return self._tag.first()
+
+
+def _literal(parser: Parser) -> Optional[Any]:
+    """
+    Gets the non-empty str or bytes a Parser always matches and yields, or
+    None if it is not such a literal.
+    """
+    pattern: Any = None
+    if isinstance(parser, Tag):
+        pattern = parser.pattern
+    elif isinstance(parser, Char) and len(parser.character) == 1:
+        pattern = parser.character
+    elif isinstance(parser, FusedTag):
+        pattern = parser.pattern
+
+    if isinstance(pattern, (str, bytes)) and len(pattern) > 0:
+        return pattern
+    return None
+
+
+def _parts(parser: Parser) -> tuple[Parser, ...]:
+    """
+    Gets the literals a literal Parser is made of.
+    """
+    return parser.parts if isinstance(parser, FusedTag) else (parser,)
+
+
+def _shape(keep: Keep, size: int) -> Keep:
+    """
+    Normalizes the projection of a Sequence of `size` parsers, so that it never
+    relies on the None shorthand.
+    """
+    return tuple(range(size)) if keep is None else keep
+
+
+def _substitute(keep: Keep, shapes: list[Keep]) -> Keep:
+    """
+    Replaces every index of a (normalized) projection with the given shapes.
+    """
+    if isinstance(keep, int):
+        return shapes[keep]
+    if isinstance(keep, tuple):
+        return tuple(_substitute(part, shapes) for part in keep)
+    return keep
+
+
+def _flatten(node: Sequence) -> Parser:
+    """
+    Inlines the nested Sequence and Success nodes of a Sequence, then fuses its
+    runs of adjacent literals.
+
+    The values of inlined Success nodes and of fused literals are constant, so
+    they are yielded by the projection of the Sequence instead.
+    """
+    parsers: list[Parser] = []
+    shapes: list[Keep] = []
+    for child in node.parsers:
+        if isinstance(child, Sequence):
+            indices: list[Keep] = list(
+                range(len(parsers), len(parsers) + len(child.parsers))
+            )
+            shapes.append(_substitute(_shape(child.keep, len(indices)), indices))
+            parsers.extend(child.parsers)
+        elif isinstance(child, Success):
+            shapes.append(_Const(child.value))
+        else:
+            shapes.append(len(parsers))
+            parsers.append(child)
+
+    # literals always yield their own pattern
+    fused: list[Parser] = []
+    moved: list[Keep] = []
+    start = 0
+    while start < len(parsers):
+        literal = _literal(parsers[start])
+        end = start + 1
+        while literal is not None and end < len(parsers):
+            if type(_literal(parsers[end])) is not type(literal):
+                break
+            end += 1
+
+        if end - start == 1:
+            moved.append(len(fused))
+            fused.append(parsers[start])
+        else:
+            run = parsers[start:end]
+            moved.extend(_Const(_literal(parser)) for parser in run)
+            fused.append(FusedTag(tuple(p for parser in run for p in _parts(parser))))
+        start = end
+
+    keep = _substitute(_shape(node.keep, len(node.parsers)), shapes)
+    keep = _substitute(keep, moved)
+    if not fused:
+        return Success(_projector(keep)([]))
+    if keep == 0 and len(fused) == 1:
+        return fused[0]
+    if keep == tuple(range(len(fused))):
+        keep = None
+
+    return Sequence(fused, keep)
+
+
+def _rewrite(node: Node) -> Parser:
+    """
+    Applies the local rewrites of the optimizer to a Node whose children have
+    already been optimized.
+    """
+    match node:
+        case Conditional(condition=condition, child=child):
+            return child if condition else Success(None)
+        case Sequence():
+            return _flatten(node)
+
+    return node
+
+
+def _optimize(parser: Parser, seen: dict[int, Parser]) -> Parser:
+    """
+    Optimizes a Parser bottom-up, rewriting every shared Node only once.
+    """
+    if not isinstance(parser, Node):
+        return parser
+
+    key = id(parser)
+    if key not in seen:
+        seen[key] = _rewrite(parser.map_children(lambda c: _optimize(c, seen)))
+
+    return seen[key]
+
+
+def optimize(parser: Parser[S, Y]) -> Parser[S, Y]:
+    """
+    Rewrites a grammar into an equivalent one that makes fewer calls per token.
+
+    Nested sequences (`preceded`, `delimited`, `pair`, ...) are flattened into
+    a single Sequence projecting the kept values, adjacent `tag` and `char`
+    literals are matched with a single comparison, and trivial wrappers such as
+    `success` and `conditional` are inlined. Parsers which are not Nodes are
+    kept as they are.
+    """
+    return _optimize(parser, {})
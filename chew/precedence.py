@@ -0,0 +1,214 @@
+"""
+Operator precedence parsing.
+"""
+from __future__ import annotations
+__all__ = ["Precedence", "precedence"]
+from typing import Any, Callable, Iterable, Optional
+from chew.branch import _dispatch
+from chew.error import Error, Incomplete, Outcome, returning
+from chew.types import END, Node, Parser, S, first_of
+
+# Prefix or Postfix Operator
+#
+# The Parser of the operator, and its binding power.
+Unary = tuple[Parser, int]
+
+# Infix Operator
+#
+# The Parser of the operator, and its left and right binding powers.
+Binary = tuple[Parser, int, int]
+
+
+class _Operators:  # pylint: disable=too-few-public-methods
+    """
+    The operators of one position of an expression, dispatched on the first
+    element of the input as the alternatives of `alt` are.
+    """
+
+    __slots__ = ("_items", "_table", "_fallback")
+
+    def __init__(self, operators: tuple[tuple[Any, ...], ...]):
+        self._items = [(returning(op[0]), *op[1:]) for op in operators]
+        parsers = tuple(op[0] for op in operators)
+        (self._table, self._fallback) = _dispatch(parsers, self._items)
+
+    def match(
+        self, sequence: Any
+    ) -> Optional[tuple[Any, Any, tuple[int, ...]] | Incomplete]:
+        """
+        Applies the operators in order, returning the remaining input, the
+        value and the binding powers of the first that succeeds, the Incomplete
+        failure of a streaming operator, or None.
+
+        An operator matching without consuming any input doesn't match, as it
+        could otherwise be applied forever.
+        """
+        items = self._items
+        if self._table is not None:
+            # an expression usually ends the input, so it is checked for
+            # rather than raising an IndexError
+            key = sequence[0] if sequence else END
+            try:
+                items = self._table.get(key, self._fallback)
+            except TypeError:
+                pass
+
+        for (parse, *powers) in items:
+            result = parse(sequence)
+            if isinstance(result, Incomplete):
+                return result
+            if not isinstance(result, Error) and len(result[0]) < len(sequence):
+                return (*result, tuple(powers))
+
+        return None
+
+
+def _tuple(*parts: Any) -> tuple[Any, ...]:
+    return parts
+
+
+class Precedence(Node[S, Any]):  # pylint: disable=too-many-instance-attributes
+    """
+    Node parsing an expression of operands and operators with a single loop,
+    deciding how operators group from their binding powers (Pratt parsing).
+    """
+
+    __slots__ = (
+        "atom",
+        "prefix_ops",
+        "infix_ops",
+        "postfix_ops",
+        "fold",
+        "_atom",
+        "_prefix",
+        "_infix",
+        "_postfix",
+        "_fold",
+    )
+    __match_args__ = ("atom", "prefix_ops", "infix_ops", "postfix_ops", "fold")
+    _child_params = ("atom",)
+
+    def __init__(
+        self,
+        atom: Parser[S, Any],
+        prefix_ops: Iterable[Unary] = (),
+        infix_ops: Iterable[Binary] = (),
+        postfix_ops: Iterable[Unary] = (),
+        fold: Optional[Callable[..., Any]] = None,
+    ):
+        self.atom = atom
+        self.prefix_ops: tuple[tuple[Any, ...], ...] = tuple(map(tuple, prefix_ops))
+        self.infix_ops: tuple[tuple[Any, ...], ...] = tuple(map(tuple, infix_ops))
+        self.postfix_ops: tuple[tuple[Any, ...], ...] = tuple(map(tuple, postfix_ops))
+        self.fold = fold
+        self._atom = returning(atom)
+        self._prefix = _Operators(self.prefix_ops)
+        self._infix = _Operators(self.infix_ops)
+        self._postfix = _Operators(self.postfix_ops)
+        self._fold = _tuple if fold is None else fold
+
+    def parse(self, sequence: S) -> Outcome[S, Any]:
+        fold = self._fold
+        # operators waiting for their right operand, as (value, left operand or
+        # None if prefix, binding power of the enclosing expression)
+        pending: list[tuple[Any, Optional[tuple[Any]], int]] = []
+        minimum = 0
+        while True:
+            matched = self._prefix.match(sequence)
+            if isinstance(matched, Incomplete):
+                return matched
+            if matched is not None:
+                (sequence, operator, (power,)) = matched
+                pending.append((operator, None, minimum))
+                minimum = power
+                continue
+
+            result = self._atom(sequence)
+            if isinstance(result, Error):
+                return result
+            (sequence, operand) = result
+
+            while True:
+                matched = self._postfix.match(sequence)
+                if isinstance(matched, Incomplete):
+                    return matched
+                if matched is not None and matched[2][0] >= minimum:
+                    (sequence, operator, _) = matched
+                    operand = fold(operand, operator)
+                    continue
+
+                matched = self._infix.match(sequence)
+                if isinstance(matched, Incomplete):
+                    return matched
+                if matched is not None and matched[2][0] >= minimum:
+                    (sequence, operator, (_, power)) = matched
+                    pending.append((operator, (operand,), minimum))
+                    minimum = power
+                    break
+
+                # no operator binds to the operand this tightly, so it is the
+                # operand of the last pending operator
+                if not pending:
+                    return (sequence, operand)
+                (operator, left, minimum) = pending.pop()
+                if left is None:
+                    operand = fold(operator, operand)
+                else:
+                    operand = fold(left[0], operator, operand)
+
+    def first(self) -> Optional[frozenset[Any]]:
+        firsts = [first_of(self.atom)]
+        firsts.extend(first_of(op[0]) for op in self.prefix_ops)
+        known = [first for first in firsts if first is not None]
+        if len(known) < len(firsts):
+            return None
+
+        return frozenset().union(*known)
+
+    @property
+    def children(self) -> tuple[Parser, ...]:
+        operators = self.prefix_ops + self.infix_ops + self.postfix_ops
+        return (self.atom, *(op[0] for op in operators))
+
+    def map_children(self, func: Callable[[Parser], Parser]) -> Node[S, Any]:
+        def mapped(operators: tuple[tuple[Any, ...], ...]) -> tuple[Any, ...]:
+            return tuple((func(op[0]), *op[1:]) for op in operators)
+
+        node = self.replace(
+            atom=func(self.atom),
+            prefix_ops=mapped(self.prefix_ops),
+            infix_ops=mapped(self.infix_ops),
+            postfix_ops=mapped(self.postfix_ops),
+        )
+        if all(new is old for new, old in zip(node.children, self.children)):
+            return self
+        return node
+
+
+def precedence(
+    atom: Parser[S, Any],
+    prefix_ops: Iterable[Unary] = (),
+    infix_ops: Iterable[Binary] = (),
+    postfix_ops: Iterable[Unary] = (),
+    fold: Optional[Callable[..., Any]] = None,
+) -> Parser[S, Any]:
+    """
+    Parses an expression of `atom` operands and operators, given the binding
+    power of each operator: `(parser, power)` for prefix and postfix operators,
+    and `(parser, left_power, right_power)` for infix operators.
+
+    An operator takes the operand next to it when its binding power on that
+    side is higher than that of the operator on the other side of the operand.
+    Infix operators are left associative when their right power is higher than
+    their left power, as with `(char("-"), 1, 2)`, and right associative
+    otherwise, as with `(char("^"), 4, 3)`.
+
+    Operations are yielded as tuples in the order of the input, `(op, operand)`
+    for prefix operators, `(left, op, right)` for infix operators, and
+    `(operand, op)` for postfix operators, or passed as arguments to `fold`.
+
+    Once an operator is parsed its operand is expected, and the Error of the
+    `atom` is returned if it is missing. Operators only match when they consume
+    some input.
+    """
+    return Precedence(atom, prefix_ops, infix_ops, postfix_ops, fold)
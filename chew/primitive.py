@@ -1,8 +1,22 @@
 """
 Primitive Operations on Sequences.
 """
-__all__ = ["eof", "peek", "take", "next_item", "at_line", "at_pos"]
-from typing import Optional
+__all__ = [
+    "eof",
+    "peek",
+    "take",
+    "next_item",
+    "find",
+    "starts_with",
+    "at_line",
+    "at_pos",
+]
+import functools
+import mmap
+import operator
+import re
+from typing import Any, Optional
+from chew.cursor import Cursor
 from chew.types import S, E
 
 
@@ -55,6 +69,91 @@ def next_item(sequence: S) -> Optional[tuple[S, E]]:
     return (leftover, current)
 
 
+# bytes-like patterns, which may be compared against any bytes-like buffer
+_BYTES_LIKE = (bytes, bytearray, memoryview)
+
+
+@functools.lru_cache(maxsize=256)
+def _literal(pattern: bytes) -> re.Pattern:
+    """
+    Compiles the regular expression searching for a bytes pattern, for the
+    buffers which have no substring search of their own.
+    """
+    return re.compile(re.escape(pattern))
+
+
+def _find_in(buffer: Any, pattern: Any, start: int) -> int:
+    """
+    Finds the index of the first occurrence of pattern in the buffer at or
+    after `start`, or -1.
+    """
+    # str, bytes, bytearray, and mmap all provide a linear substring search
+    if isinstance(buffer, str):
+        if isinstance(pattern, str):
+            return buffer.find(pattern, start)
+    elif hasattr(buffer, "find") and isinstance(pattern, (bytes, bytearray)):
+        return buffer.find(pattern, start)
+    elif isinstance(buffer, memoryview) and isinstance(pattern, _BYTES_LIKE):
+        # searched in place, as copying the view to search it would defeat it
+        found = _literal(bytes(pattern)).search(buffer, start)
+        return -1 if found is None else found.start()
+
+    size = len(pattern)
+    if size == 0:
+        return start if start <= len(buffer) else -1
+
+    first = pattern[0]
+    for index in range(start, len(buffer) - size + 1):
+        if buffer[index] == first and all(
+            buffer[index + offset] == pattern[offset] for offset in range(1, size)
+        ):
+            return index
+
+    return -1
+
+
+def find(sequence: S, pattern: S) -> int:
+    """
+    Finds the index of the first occurrence of pattern in the sequence, or -1
+    if it does not occur.
+    """
+    if isinstance(sequence, Cursor):
+        index = _find_in(sequence.buffer, pattern, sequence.position)
+        return index if index < 0 else index - sequence.position
+
+    return _find_in(sequence, pattern, 0)
+
+
+def starts_with(sequence: S, pattern: Any) -> bool:
+    """
+    Whether or not the sequence starts with all of the elements of pattern.
+
+    Text and bytes-like input is compared with a single comparison of the
+    underlying buffer, without copying it.
+    """
+    (buffer, start) = (sequence, 0)
+    if isinstance(sequence, Cursor):
+        (buffer, start) = (sequence.buffer, sequence.position)
+
+    if isinstance(buffer, str):
+        if isinstance(pattern, str):
+            return buffer.startswith(pattern, start)
+    elif isinstance(buffer, (bytes, bytearray)):
+        if isinstance(pattern, _BYTES_LIKE):
+            return buffer.startswith(pattern, start)
+    elif isinstance(buffer, (memoryview, mmap.mmap)):
+        if isinstance(pattern, _BYTES_LIKE):
+            # SAFETY: slicing a view doesn't copy it, and slicing a map only
+            # copies as many bytes as the pattern has
+            end = start + len(pattern)
+            return end <= len(buffer) and buffer[start:end] == pattern
+
+    size = len(pattern)
+    if len(sequence) < size:
+        return False
+    return all(map(operator.eq, pattern, sequence[:size]))
+
+
 def _consumed(original: str, remaining: str) -> str:
     """
     Returns the input that has been consumed so far.
@@ -0,0 +1,292 @@
+"""
+Drivers applying parsers to files and streams.
+"""
+from __future__ import annotations
+__all__ = [
+    "AsyncChunkIterator",
+    "ChunkIterator",
+    "aparse",
+    "iterparse",
+    "map_file",
+    "parse_file",
+]
+import mmap
+import os
+from typing import IO, Any, AsyncIterable, Generic, Optional, TypeVar
+from chew.cursor import Cursor
+from chew.error import Error, Incomplete, returning
+from chew.types import Parser, Result
+
+# Generic Yielded Element
+#
+# Yielded element from a Parser that we care about.
+Y = TypeVar("Y")
+
+
+class _Chunks(Generic[Y]):
+    """
+    The buffer of the records being parsed from a source read in chunks.
+
+    Only the part of the source which is not parsed yet is buffered: whenever a
+    (streaming) Parser needs more input than is buffered, the parsed prefix of
+    the buffer is dropped and the next chunks are appended. The buffer is thus
+    bounded by the largest record, plus a chunk.
+    """
+
+    __slots__ = ("parser", "chunk_size", "_parse", "_buffer", "_base", "_at")
+
+    def __init__(self, parser: Parser[Any, Y], chunk_size: int):
+        self.parser = parser
+        self.chunk_size = chunk_size
+        self._parse = returning(parser)
+        # the unparsed part of the source read so far, the offset in the
+        # source at which it starts, and the position of the next record in it
+        self._buffer: Any = None
+        self._base = 0
+        self._at = 0
+
+    @property
+    def buffer(self) -> Any:
+        """
+        The part of the source currently buffered, or None before it is read.
+        """
+        return self._buffer
+
+    @property
+    def offset(self) -> int:
+        """
+        The offset in the source of the next record, in bytes for binary
+        sources and in characters for text sources.
+        """
+        return self._base + self._at
+
+    def _size(self, needed: int) -> int:
+        """
+        Gets the size of the next read, for a record needing `needed` more
+        elements.
+        """
+        # reading as much as is already buffered keeps refilling a large
+        # record linear in its size
+        unparsed = 0 if self._buffer is None else len(self._buffer) - self._at
+        return max(self.chunk_size, needed, unparsed)
+
+    def _extend(self, chunks: list[Any]):
+        """
+        Drops the parsed prefix of the buffer and appends the chunks read.
+        """
+        unparsed = chunks[0][:0] if self._buffer is None else self._buffer[self._at :]
+        self._buffer = unparsed[:0].join([unparsed, *chunks])
+        self._base += self._at
+        self._at = 0
+
+    def _record(self) -> Optional[tuple[int, Y] | Incomplete]:
+        """
+        Parses the next record, returning it with its offset, the Incomplete
+        failure of a record needing more input, or None if the buffer is
+        exhausted.
+
+        Raises the Error of a record which fails to parse, and StopIteration
+        if a record consumes no input, as it would be yielded forever.
+        """
+        if self._buffer is None or self._at == len(self._buffer):
+            return None
+
+        result = self._parse(Cursor(self._buffer, self._at))
+        if isinstance(result, Incomplete):
+            return result
+        if isinstance(result, Error):
+            raise result
+
+        (remaining, value) = result
+        if remaining.position == self._at:
+            raise StopIteration
+
+        offset = self.offset
+        self._at = remaining.position
+        return (offset, value)
+
+
+class ChunkIterator(_Chunks[Y]):
+    """
+    An Iterator applying a record Parser repeatedly to a file, read in chunks,
+    yielding each record along with its offset in the file.
+    """
+
+    __slots__ = ("file",)
+
+    def __init__(self, file: IO[Any], parser: Parser[Any, Y], chunk_size: int):
+        super().__init__(parser, chunk_size)
+        self.file = file
+
+    def _read(self, needed: int) -> list[Any]:
+        """
+        Reads chunks of the file until `needed` elements are read, or the file
+        is exhausted.
+        """
+        size = self._size(needed)
+        chunks = []
+        while needed > 0:
+            chunk = self.file.read(size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            needed -= len(chunk)
+
+        return chunks
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> tuple[int, Y]:
+        while True:
+            record = self._record()
+            if isinstance(record, tuple):
+                return record
+
+            chunks = self._read(1 if record is None else record.needed or 1)
+            if not chunks:
+                if record is None:
+                    raise StopIteration
+                # the file ends within the record
+                raise record
+
+            self._extend(chunks)
+
+
+def iterparse(
+    file: IO[Any], parser: Parser[Any, Y], chunk_size: int = 1 << 16
+) -> ChunkIterator[Y]:
+    """
+    Applies a record Parser repeatedly to a binary or text file, read in chunks
+    of `chunk_size`, yielding `(offset, record)` tuples until the file is
+    exhausted.
+
+    Unlike `pariter`, the whole file is never held in memory, only the records
+    being parsed. Records should be parsed by the streaming parsers (see
+    `chew.streaming`), so that a record split across chunks needs more input
+    rather than failing. The Parser is applied to a Cursor over the buffer.
+
+    Raises the Error of a record which fails to parse, or the Incomplete
+    failure of a record which the file ends within; either is located in the
+    buffer, at `offset` in the file.
+    """
+    return ChunkIterator(file, parser, chunk_size)
+
+
+class AsyncChunkIterator(_Chunks[Y]):
+    """
+    An asynchronous Iterator applying a record Parser repeatedly to an async
+    source of bytes (or str), yielding each record along with its offset in
+    the source as soon as it has been received.
+
+    The source is either a reader with a `read(size)` coroutine, such as an
+    `asyncio.StreamReader`, or an async iterable of chunks.
+    """
+
+    __slots__ = ("source", "_chunks")
+
+    def __init__(
+        self, source: Any | AsyncIterable[Any], parser: Parser[Any, Y], chunk_size: int
+    ):
+        super().__init__(parser, chunk_size)
+        self.source: Any = source
+        self._chunks: Optional[Any] = None
+        if not hasattr(source, "read"):
+            self._chunks = aiter(source)
+
+    async def _read(self, needed: int) -> list[Any]:
+        """
+        Reads chunks of the source until `needed` elements are read, or the
+        source is exhausted.
+        """
+        size = self._size(needed)
+        chunks = []
+        while needed > 0:
+            if self._chunks is None:
+                # readers return an empty chunk once exhausted
+                chunk = await self.source.read(size)
+                if not chunk:
+                    break
+            else:
+                chunk = await anext(self._chunks, None)
+                if chunk is None:
+                    break
+            chunks.append(chunk)
+            needed -= len(chunk)
+
+        return chunks
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> tuple[int, Y]:
+        while True:
+            try:
+                record = self._record()
+            except StopIteration as stop:
+                raise StopAsyncIteration from stop
+            if isinstance(record, tuple):
+                return record
+
+            chunks = await self._read(1 if record is None else record.needed or 1)
+            if not chunks:
+                if record is None:
+                    raise StopAsyncIteration
+                # the source ends within the record
+                raise record
+
+            self._extend(chunks)
+
+
+def aparse(
+    source: Any | AsyncIterable[Any], parser: Parser[Any, Y], chunk_size: int = 1 << 16
+) -> AsyncChunkIterator[Y]:
+    """
+    Applies a record Parser repeatedly to an async source, such as an
+    `asyncio.StreamReader` or an async iterable of chunks, yielding
+    `(offset, record)` tuples as the records are received:
+
+        async for (offset, record) in aparse(reader, frame):
+            ...
+
+    Records are parsed as `iterparse` parses them from a file, so they should
+    be parsed by streaming parsers; parsing resumes whenever the source has
+    received the input a record needs.
+    """
+    return AsyncChunkIterator(source, parser, chunk_size)
+
+
+def map_file(path: str | os.PathLike) -> Cursor:
+    """
+    Maps a file into memory, read-only, returning a Cursor over a memoryview
+    of its bytes.
+
+    Nothing is read until it is parsed: the pages of the file are loaded on
+    demand, and may be dropped again by the operating system once parsed, so
+    that memory usage stays near the part of the file being parsed. The map is
+    released once the Cursor, and every Cursor and view sliced from it, are.
+    """
+    with open(path, "rb") as file:
+        # SAFETY: an empty file can't be mapped, but there's nothing to parse
+        if os.fstat(file.fileno()).st_size == 0:
+            return Cursor(memoryview(b""))
+        # the map stays valid once the file is closed
+        return Cursor(memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)))
+
+
+def parse_file(path: str | os.PathLike, parser: Parser[Any, Y]) -> Result[Any, Y]:
+    """
+    Applies a bytes Parser to a file mapped into memory (see `map_file`),
+    returning the remaining input and the value as calling the Parser does.
+
+    The file is never copied: the remaining input is a Cursor over the map,
+    and the slices the Parser yields as values are read-only memoryviews of it,
+    copied only when asked to (with `bytes(value)`). Records may be iterated
+    without holding them all with `pariter`:
+
+        for record in pariter(map_file(path), packet):
+            ...
+
+    Raises the Error of the Parser, located in the map.
+    """
+    return parser(map_file(path))
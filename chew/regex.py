@@ -0,0 +1,571 @@
+"""
+Parsers backed by regular expressions.
+"""
+from __future__ import annotations
+__all__ = [
+    "Regex",
+    "RegexCaptures",
+    "RegexNamed",
+    "Regular",
+    "compile_regular",
+    "regex",
+    "regex_captures",
+    "regex_named",
+]
+import dataclasses
+import re
+import sys
+from typing import Any, AnyStr, Callable, Optional, TypeVar
+from chew.branch import Alt
+from chew.charclass import CharClass
+from chew.combine import Opt, Recognize, Success, Value
+from chew.cursor import Cursor
+from chew.error import Error, ErrorKind, IgnoringKind, Outcome, WithKind, Wrapper
+from chew.generic import IsA, IsNot, MinOne, Tag, TakeTill, TakeWhile, _class_run
+from chew.optimize import FusedTag
+from chew.repeat import (
+    Many0,
+    Many0Count,
+    Many1,
+    Many1Count,
+    SeparatedList0,
+    SeparatedList1,
+)
+from chew.sequence import Keep, Sequence, _projector
+from chew.string import Char, NoneOf, OneOf, Satisfy
+from chew.types import Node, Parser, S
+
+# Generic Yielded Element
+#
+# Yielded element from a Parser that we care about.
+Y = TypeVar("Y")
+
+# Whether `re` supports the atomic groups and possessive quantifiers which give
+# regular expressions the (non-backtracking) semantics of Parsers.
+_ATOMIC = sys.version_info >= (3, 11)
+
+
+class Regex(Node[S, Any]):
+    """
+    Node matching a compiled regular expression at the start of the input,
+    yielding the matched input.
+
+    The expression is matched in place, at the position of a Cursor, rather
+    than against a copy of the remaining input.
+    """
+
+    __slots__ = ("pattern",)
+    __match_args__ = ("pattern",)
+
+    def __init__(self, pattern: re.Pattern):
+        self.pattern = pattern
+
+    def _value(self, match: re.Match) -> Any:
+        """
+        Gets the value yielded for a match.
+        """
+        return match.group()
+
+    def parse(self, sequence: S) -> Outcome[S, Any]:
+        (buffer, start) = (sequence, 0)
+        if isinstance(sequence, Cursor):
+            (buffer, start) = (sequence.buffer, sequence.position)
+
+        match: Optional[re.Match] = self.pattern.match(buffer, start)
+        if match is None:
+            return Error(sequence, ErrorKind.REGEX)
+
+        return (sequence[match.end() - start :], self._value(match))  # type: ignore
+
+
+class RegexCaptures(Regex[S]):
+    """
+    Node matching a compiled regular expression at the start of the input,
+    yielding the tuple of its groups.
+    """
+
+    __slots__ = ()
+
+    def _value(self, match: re.Match) -> Any:
+        return match.groups()
+
+
+class RegexNamed(Regex[S]):
+    """
+    Node matching a compiled regular expression at the start of the input,
+    yielding the dict of its named groups.
+    """
+
+    __slots__ = ()
+
+    def _value(self, match: re.Match) -> Any:
+        return match.groupdict()
+
+
+def regex(pattern: AnyStr | re.Pattern[AnyStr], flags: int = 0) -> Parser[S, AnyStr]:
+    """
+    Matches a regular expression at the start of the input, yielding the
+    matched input.
+
+    The expression is compiled once, and matched at the position of a Cursor
+    without copying the remaining input.
+    """
+    return Regex[S](re.compile(pattern, flags))
+
+
+def regex_captures(
+    pattern: AnyStr | re.Pattern[AnyStr], flags: int = 0
+) -> Parser[S, tuple[Optional[AnyStr], ...]]:
+    """
+    Matches a regular expression at the start of the input, yielding the tuple
+    of its groups (None for groups which did not participate in the match).
+    """
+    return RegexCaptures[S](re.compile(pattern, flags))
+
+
+def regex_named(
+    pattern: AnyStr | re.Pattern[AnyStr], flags: int = 0
+) -> Parser[S, dict[str, Optional[AnyStr]]]:
+    """
+    Matches a regular expression at the start of the input, yielding the dict
+    of its named groups.
+    """
+    return RegexNamed[S](re.compile(pattern, flags))
+
+
+@dataclasses.dataclass(frozen=True)
+class _Fragment:
+    """
+    The regular expression equivalent to a Parser.
+
+    Expressions over bytes are built as str, with each byte as the character of
+    the same code point, and only encoded once complete.
+    """
+
+    # regular expression matching exactly what the Parser consumes
+    source: str
+
+    # whether the input is a str (True), bytes (False), or either (None)
+    text: Optional[bool]
+
+    # whether the expression may match without consuming any input
+    nullable: bool
+
+    # number of capturing groups in the expression
+    groups: int
+
+    # rebuilds the value yielded by the Parser from a match, given the number
+    # of groups before those of the expression, or None if it cannot
+    build: Optional[Callable[[re.Match, int], Any]]
+
+    # size & value of the fixed-size matches of the expression, for repetitions
+    unit: Optional[tuple[int, Callable[[Any], Any]]] = None
+
+
+def _kind(*fragments: _Fragment) -> tuple[bool, Optional[bool]]:
+    """
+    Gets whether fragments may be combined, and the input they combine over.
+    """
+    kinds = {fragment.text for fragment in fragments} - {None}
+    return (len(kinds) <= 1, next(iter(kinds), None))
+
+
+def _literal(pattern: Any) -> Optional[_Fragment]:
+    """
+    Creates the fragment of a Tag.
+    """
+    if isinstance(pattern, str):
+        source = re.escape(pattern)
+    elif isinstance(pattern, bytes):
+        source = re.escape(pattern.decode("latin-1"))
+    else:
+        return None
+
+    size = len(pattern)
+    unit = (size, lambda _: pattern) if size > 0 else None
+    return _Fragment(
+        source, isinstance(pattern, str), size == 0, 0, lambda m, b: pattern, unit
+    )
+
+
+def _class(charclass: CharClass, quantifier: str) -> Optional[_Fragment]:
+    """
+    Creates the fragment of one element, or of a run of elements, of a class,
+    capturing the match.
+    """
+    members = charclass.members
+    if all(isinstance(member, str) and len(member) == 1 for member in members):
+        (text, characters) = (True, sorted(members))
+    elif all(isinstance(member, int) and 0 <= member < 256 for member in members):
+        (text, characters) = (False, [chr(member) for member in sorted(members)])
+    else:
+        return None
+
+    if not characters:
+        source = "(?s:.)" if charclass.negated else "(?!)"
+    else:
+        escaped = "".join(re.escape(character) for character in characters)
+        source = f"[{'^' if charclass.negated else ''}{escaped}]"
+
+    unit = (1, lambda value: value) if quantifier == "" else None
+    return _Fragment(
+        f"({source}{quantifier})",
+        text if members else None,
+        quantifier == "*+",
+        1,
+        lambda m, b: m.group(b + 1),
+        unit,
+    )
+
+
+def _text(fragment: Optional[_Fragment]) -> Optional[_Fragment]:
+    """
+    Keeps the fragment of a Parser only matching text, since the Parser
+    compares slices of bytes (rather than bytes) to the members of its class.
+    """
+    return fragment if fragment is None or fragment.text is not False else None
+
+
+def _kept(keep: Keep) -> set[int]:
+    """
+    Gets the indices of the values kept by the projection of a Sequence.
+    """
+    if isinstance(keep, int):
+        return {keep}
+    if isinstance(keep, tuple):
+        return set().union(*(_kept(part) for part in keep))
+    return set()
+
+
+def _sequence(node: Sequence, fragments: list[_Fragment]) -> Optional[_Fragment]:
+    """
+    Creates the fragment of a Sequence, yielding the projection of the values
+    of its parsers.
+    """
+    (compatible, text) = _kind(*fragments)
+    if not compatible:
+        return None
+
+    bases = []
+    groups = 0
+    for fragment in fragments:
+        bases.append(groups)
+        groups += fragment.groups
+
+    kept = set(range(len(fragments))) if node.keep is None else _kept(node.keep)
+    build: Optional[Callable[[re.Match, int], Any]] = None
+    if all(fragments[index].build is not None for index in kept):
+        builds = [
+            (fragment.build if index in kept else None, base)
+            for (index, (fragment, base)) in enumerate(zip(fragments, bases))
+        ]
+        project = _projector(node.keep)
+
+        def build(match: re.Match, base: int) -> Any:
+            return project(
+                [
+                    None if part is None else part(match, base + offset)
+                    for (part, offset) in builds
+                ]
+            )
+
+    return _Fragment(
+        "".join(fragment.source for fragment in fragments),
+        text,
+        all(fragment.nullable for fragment in fragments),
+        groups,
+        build,
+    )
+
+
+def _alt(fragments: list[_Fragment]) -> Optional[_Fragment]:
+    """
+    Creates the fragment of an Alt, committing to its first matching
+    alternative, each of which is captured to know which one matched.
+    """
+    (compatible, text) = _kind(*fragments)
+    if not compatible or not fragments:
+        return None
+
+    bases = []
+    groups = 0
+    for fragment in fragments:
+        bases.append(groups)
+        groups += 1 + fragment.groups
+
+    build: Optional[Callable[[re.Match, int], Any]] = None
+    if all(fragment.build is not None for fragment in fragments):
+        builds = [(fragment.build, base) for (fragment, base) in zip(fragments, bases)]
+
+        def build(match: re.Match, base: int) -> Any:
+            for part, offset in builds:
+                if match.start(base + offset + 1) >= 0:
+                    return part(match, base + offset + 1)  # type: ignore
+            raise AssertionError("no alternative matched")  # pragma: no cover
+
+    alternatives = "|".join(f"({fragment.source})" for fragment in fragments)
+    return _Fragment(
+        f"(?>{alternatives})",
+        text,
+        any(fragment.nullable for fragment in fragments),
+        groups,
+        build,
+    )
+
+
+def _optional(fragment: _Fragment) -> Optional[_Fragment]:
+    """
+    Creates the fragment of an Opt, capturing its child to know if it matched.
+    """
+    if fragment.nullable:
+        return None
+
+    build: Optional[Callable[[re.Match, int], Any]] = None
+    if fragment.build is not None:
+        part = fragment.build
+
+        def build(match: re.Match, base: int) -> Any:
+            if match.start(base + 1) < 0:
+                return None
+            return part(match, base + 1)
+
+    return _Fragment(
+        f"({fragment.source})?+", fragment.text, True, 1 + fragment.groups, build
+    )
+
+
+def _repeat(fragment: _Fragment, least: int, count: bool) -> Optional[_Fragment]:
+    """
+    Creates the fragment of a repetition of a Parser (at least `least` times)
+    yielding the list of its values, or their count.
+    """
+    if fragment.nullable:
+        return None
+
+    build: Optional[Callable[[re.Match, int], Any]] = None
+    if fragment.unit is not None:
+        (size, value) = fragment.unit
+
+        def build(match: re.Match, base: int) -> Any:
+            run = match.group(base + 1)
+            if count:
+                return len(run) // size
+            return [value(run[i : i + size]) for i in range(0, len(run), size)]
+
+    quantifier = "++" if least else "*+"
+    return _Fragment(
+        f"((?:{fragment.source}){quantifier})",
+        fragment.text,
+        not least,
+        1 + fragment.groups,
+        build,
+    )
+
+
+def _separated(fragments: list[_Fragment], least: int) -> Optional[_Fragment]:
+    """
+    Creates the fragment of a list of a Parser (at least `least` times) with
+    separators, which may only be recognized.
+    """
+    (separator, element) = fragments
+    (compatible, text) = _kind(separator, element)
+    if not compatible or (separator.nullable and element.nullable):
+        return None
+
+    # a separator is only consumed when followed by an element
+    rest = f"(?>{separator.source}{element.source})*+"
+    source = f"{element.source}{rest}"
+    return _Fragment(
+        source if least else f"(?:{source})?+",
+        text,
+        element.nullable or not least,
+        separator.groups + 2 * element.groups,
+        None,
+    )
+
+
+def _fragment(
+    parser: Parser, seen: dict[int, Optional[_Fragment]]
+) -> Optional[_Fragment]:
+    """
+    Gets the fragment of a Parser, or None if it is not a regular grammar.
+    """
+    key = id(parser)
+    if key not in seen:
+        seen[key] = None
+        seen[key] = _lower(parser, seen)
+
+    return seen[key]
+
+
+def _lower(  # pylint: disable=too-many-return-statements, too-many-branches
+    parser: Parser, seen: dict[int, Optional[_Fragment]]
+) -> Optional[_Fragment]:
+    """
+    Creates the fragment of a Parser from those of its children.
+    """
+    if not isinstance(parser, Node):
+        return None
+
+    children: list[Optional[_Fragment]] = [
+        _fragment(child, seen) for child in parser.children
+    ]
+    if any(child is None for child in children):
+        return None
+    fragments: list[_Fragment] = children  # type: ignore
+
+    match parser:
+        case Tag(pattern=pattern) | FusedTag(pattern=pattern):
+            return _literal(pattern)
+        case Char(character=character) if len(character) == 1:
+            return _literal(character)
+        case OneOf(characters=characters):
+            return _text(_class(CharClass.of(characters), ""))
+        case NoneOf(characters=characters):
+            return _text(_class(CharClass.of(characters).negate(), ""))
+        case Satisfy(cond=CharClass() as cond):
+            return _text(_class(cond, ""))
+        case IsA(items=CharClass() | str() | bytes() as items):
+            return _class(CharClass.of(items), "++")
+        case IsNot(items=CharClass() | str() | bytes() as items):
+            return _class(CharClass.of(items).negate(), "++")
+        case TakeWhile(cond=CharClass() as cond):
+            return _class(cond, "*+")
+        case TakeTill(cond=CharClass() as cond):
+            return _class(cond.negate(), "*+")
+        case IgnoringKind(
+            child=IsA(items=CharClass() | str() as items),
+            kind=ErrorKind.IS_A,
+            value="",
+        ):
+            fragment = _class(CharClass.of(items), "*+")
+            return fragment if fragment is None or fragment.text else None
+        case MinOne(child=child, kind=_):
+            run = _class_run(child)
+            return None if run is None else _class(run, "++")
+        case WithKind():
+            return fragments[0]
+        case Sequence():
+            return _sequence(parser, fragments)
+        case Alt():
+            return _alt(fragments)
+        case Opt():
+            return _optional(fragments[0])
+        case Many1Count():
+            return _repeat(fragments[0], 1, True)
+        case Many0Count():
+            return _repeat(fragments[0], 0, True)
+        case Many0():
+            return _repeat(fragments[0], 0, False)
+        case SeparatedList1():
+            return _separated(fragments, 1)
+        case SeparatedList0():
+            return _separated(fragments, 0)
+        case Many1():
+            return _repeat(fragments[0], 1, False)
+        case Recognize():
+            (fragment,) = fragments
+            return dataclasses.replace(
+                fragment,
+                source=f"({fragment.source})",
+                groups=1 + fragment.groups,
+                build=lambda m, b: m.group(b + 1),
+                unit=None,
+            )
+        case Value(value=value):
+            (fragment,) = fragments
+            unit = None
+            if fragment.unit is not None:
+                unit = (fragment.unit[0], lambda _: value)
+            return dataclasses.replace(fragment, build=lambda m, b: value, unit=unit)
+        case Success(value=value):
+            return _Fragment("", None, True, 0, lambda m, b: value)
+
+    return None
+
+
+class Regular(Wrapper[S, Y]):
+    """
+    Node matching a regular grammar with a single compiled regular expression,
+    rebuilding the value its child would have yielded from the match.
+
+    Alternatives commit to the first one which matches and repetitions never
+    give elements back, as with Parsers. When the expression does not match,
+    or the input is neither a str nor bytes, the child itself is applied so
+    that the Error is exactly the one it returns.
+    """
+
+    __slots__ = ("pattern", "_build", "_buffers")
+
+    def __init__(self, child: Parser[S, Y]):
+        super().__init__(child)
+        fragment = _fragment(child, {})
+        if not _ATOMIC or fragment is None or fragment.build is None:
+            raise ValueError(f"not a regular grammar: {child!r}")
+
+        self._build = fragment.build
+        self.pattern: re.Pattern[Any]
+        if fragment.text is False:
+            self.pattern = re.compile(fragment.source.encode("latin-1"))
+            self._buffers: tuple[type, ...] = (bytes,)
+        else:
+            self.pattern = re.compile(fragment.source)
+            self._buffers = (str,)
+
+    def parse(self, sequence: S) -> Outcome[S, Y]:
+        buffer: Any = sequence
+        start = 0
+        if isinstance(sequence, Cursor):
+            (buffer, start) = (sequence.buffer, sequence.position)
+
+        if isinstance(buffer, self._buffers):
+            match = self.pattern.match(buffer, start)
+            if match is not None:
+                value = self._build(match, 0)
+                return (sequence[match.end() - start :], value)  # type: ignore
+
+        return self._parse(sequence)
+
+
+# Nodes combining several parsers, which are worth compiling when regular.
+_COMPOSITE = (Alt, Many0, Many0Count, Many1, Opt, Recognize, Sequence, Value)
+
+
+def _compile(
+    parser: Parser, seen: dict[int, Parser], fragments: dict[int, Optional[_Fragment]]
+) -> Parser:
+    """
+    Compiles the maximal regular sub-grammars of a Parser, top-down.
+    """
+    if not isinstance(parser, Node):
+        return parser
+
+    key = id(parser)
+    if key not in seen:
+        seen[key] = parser
+        fragment = _fragment(parser, fragments)
+        if isinstance(parser, _COMPOSITE) and fragment and fragment.build:
+            seen[key] = Regular(parser)
+        else:
+            seen[key] = parser.map_children(lambda c: _compile(c, seen, fragments))
+
+    return seen[key]
+
+
+def compile_regular(parser: Parser[S, Y]) -> Parser[S, Y]:
+    """
+    Replaces each maximal regular sub-grammar of a grammar with a Regular node,
+    matching it with a single compiled regular expression.
+
+    Regular sub-grammars are made of `tag`, `char`, `one_of`, `none_of`, the
+    character class parsers (`is_a`, `digit1`, `space0`, ... over a CharClass),
+    and of `alt`, sequences, `optional`, `recognize`, `value`, and repetitions
+    of fixed-size parsers (`many0(one_of(...))`). Anything else, such as
+    `map_res`, is kept as it is, while its children are compiled. The grammar
+    is returned as is before Python 3.11, whose `re` lacks possessive
+    quantifiers.
+    """
+    if not _ATOMIC:  # pragma: no cover
+        return parser
+
+    return _compile(parser, {}, {})
@@ -1,7 +1,23 @@
 """
 Combinators applying their child parser multiple times.
 """
+from __future__ import annotations
 __all__ = [
+    "Count",
+    "Fill",
+    "FoldMany0",
+    "FoldManyBounded",
+    "LengthCount",
+    "LengthData",
+    "LengthValue",
+    "Many0",
+    "Many0Count",
+    "Many1",
+    "Many1Count",
+    "ManyBounded",
+    "ManyTill",
+    "SeparatedList0",
+    "SeparatedList1",
     "count",
     "fill",
     "fold_many0",
@@ -20,11 +36,11 @@ __all__ = [
     "separated_list1",
 ]
 # pylint: disable=invalid-name
-from typing import MutableSequence, Callable, Sequence, TypeVar, Optional
-from chew.types import Parser, Result, S
-from chew.error import Error, ErrorKind
-from chew.generic import take, _min_one, I
-from chew.primitive import eof
+from typing import Any, MutableSequence, Callable, Generic, Sequence, TypeVar, Optional
+from chew.types import Node, Parser, S, first_of
+from chew.error import Error, ErrorKind, Incomplete, Outcome, Wrapper, returning
+from chew.generic import I, MinOne
+from chew.primitive import eof, take as ptake
 
 # Generic Yielded Element
 #
@@ -37,70 +53,128 @@ Y = TypeVar("Y")
 A = TypeVar("A")
 
 
-def count(parser: Parser[S, Y], times: int) -> Parser[S, Sequence[Y]]:
+class Count(Wrapper[S, Sequence[Y]]):
     """
-    Repeat a Parser parser "times" times, collecting the results into a list.
+    Node applying its child a fixed number of times.
     """
 
-    def _count(sequence: S) -> Result[S, Sequence[Y]]:
+    __slots__ = ("times",)
+    __match_args__ = ("child", "times")
+
+    def __init__(self, child: Parser[S, Y], times: int):
+        super().__init__(child)
+        self.times = times
+
+    def parse(self, sequence: S) -> Outcome[S, Sequence[Y]]:
+        parse = self._parse
         values: list[Y] = []
         current = sequence
 
-        for _ in range(times):
-            (current, value) = parser(current)
+        for _ in range(self.times):
+            result = parse(current)
+            if isinstance(result, Error):
+                return result
+
+            (current, value) = result
             values.append(value)
 
         return (current, values)
 
-    return _count
+
+def count(parser: Parser[S, Y], times: int) -> Parser[S, Sequence[Y]]:
+    """
+    Repeat a Parser parser "times" times, collecting the results into a list.
+    """
+    return Count(parser, times)
 
 
-def fill(parser: Parser[S, Y], buffer: MutableSequence[Y]) -> Parser[S, None]:
+class Fill(Wrapper[S, None], Generic[S, Y]):
     """
-    Fill the given buffer with the results of running the parser.
+    Node filling a buffer with the values of its child.
     """
 
-    def _fill(sequence: S) -> Result[S, None]:
+    __slots__ = ("buffer",)
+    __match_args__ = ("child", "buffer")
+
+    def __init__(self, child: Parser[S, Y], buffer: MutableSequence[Y]):
+        super().__init__(child)
+        self.buffer = buffer
+
+    def parse(self, sequence: S) -> Outcome[S, None]:
+        parse = self._parse
+        buffer = self.buffer
         current = sequence
         for i, _ in enumerate(buffer):
-            (current, value) = parser(current)
+            result = parse(current)
+            if isinstance(result, Error):
+                return result
+
+            (current, value) = result
             buffer[i] = value
 
         return (current, None)
 
-    return _fill
 
-
-def fold_many0(
-    parser: Parser[S, Y], constructor: Callable[[], A], gather: Callable[[A, Y], A]
-) -> Parser[S, A]:
+def fill(parser: Parser[S, Y], buffer: MutableSequence[Y]) -> Parser[S, None]:
     """
-    Repeats the parser, calling `gather` to gather the results.
+    Fill the given buffer with the results of running the parser.
+    """
+    return Fill(parser, buffer)
 
-    Constructs an accumulator A using the passed constructor `constr`. For each
-    yielded element, calls `gather` to modify the accumulator.
 
-    Returns on an exhausted sequence to prevent an infinite loop with parsers
-    that accept empty inputs.
+class FoldMany0(Wrapper[S, A], Generic[S, Y, A]):
+    """
+    Node gathering the values of its child, applied until it fails or the
+    input is exhausted, into an accumulator.
     """
 
-    def _fold_many0(sequence: S) -> Result[S, A]:
-        accumulator: A = constructor()
+    __slots__ = ("constructor", "gather")
+    __match_args__ = ("child", "constructor", "gather")
+
+    def __init__(
+        self,
+        child: Parser[S, Y],
+        constructor: Callable[[], A],
+        gather: Callable[[A, Y], A],
+    ):
+        super().__init__(child)
+        self.constructor = constructor
+        self.gather = gather
+
+    def parse(self, sequence: S) -> Outcome[S, A]:
+        (parse, gather) = (self._parse, self.gather)
+        accumulator: A = self.constructor()
         current = sequence
 
         while True:
             if eof(current):
                 break
 
-            try:
-                (current, value) = parser(current)
-                accumulator = gather(accumulator, value)
-            except Error:
+            result = parse(current)
+            if isinstance(result, Error):
+                if isinstance(result, Incomplete):
+                    return result
                 break
 
+            (current, value) = result
+            accumulator = gather(accumulator, value)
+
         return (current, accumulator)
 
-    return _fold_many0
+
+def fold_many0(
+    parser: Parser[S, Y], constructor: Callable[[], A], gather: Callable[[A, Y], A]
+) -> Parser[S, A]:
+    """
+    Repeats the parser, calling `gather` to gather the results.
+
+    Constructs an accumulator A using the passed constructor `constr`. For each
+    yielded element, calls `gather` to modify the accumulator.
+
+    Returns on an exhausted sequence to prevent an infinite loop with parsers
+    that accept empty inputs.
+    """
+    return FoldMany0(parser, constructor, gather)
 
 
 def fold_many1(
@@ -115,7 +189,53 @@ def fold_many1(
     Returns on an exhausted sequence to prevent an infinite loop with parsers
     that accept empty inputs.
     """
-    return _min_one(fold_many0(parser, constructor, gather), ErrorKind.MANY1)
+    return MinOne(FoldMany0(parser, constructor, gather), ErrorKind.MANY1)
+
+
+class FoldManyBounded(Wrapper[S, A], Generic[S, Y, A]):
+    """
+    Node gathering between `lower` and `upper` values of its child into an
+    accumulator.
+    """
+
+    __slots__ = ("lower", "upper", "constructor", "gather")
+    __match_args__ = ("lower", "upper", "child", "constructor", "gather")
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        lower: int,
+        upper: int,
+        child: Parser[S, Y],
+        constructor: Callable[[], A],
+        gather: Callable[[A, Y], A],
+    ):
+        self.lower = lower
+        self.upper = upper
+        super().__init__(child)
+        self.constructor = constructor
+        self.gather = gather
+
+    def parse(self, sequence: S) -> Outcome[S, A]:
+        (parse, gather) = (self._parse, self.gather)
+        accumulator: A = self.constructor()
+        current = sequence
+        runs = 0
+
+        while runs < self.upper:
+            result = parse(current)
+            if isinstance(result, Error):
+                if isinstance(result, Incomplete):
+                    return result
+                break
+
+            (current, value) = result
+            accumulator = gather(accumulator, value)
+            runs += 1
+
+        if runs < self.lower:
+            return Error(sequence, ErrorKind.FOLD_MANY_BOUNDED)
+
+        return (current, accumulator)
 
 
 def fold_many_bounded(
@@ -128,26 +248,45 @@ def fold_many_bounded(
     """
     Repeats the parser, calling `gather` to gather the results.
     """
+    return FoldManyBounded(lower, upper, parser, constructor, gather)
+
+
+class LengthCount(Wrapper[S, Sequence[Y]]):
+    """
+    Node applying its child as many times as the number yielded by `number`.
+    """
+
+    __slots__ = ("number", "_number_parse")
+    __match_args__ = ("number", "child")
+    _child_params = ("number", "child")
 
-    def _fold_many_bounded(sequence: S) -> Result[S, A]:
-        accumulator: A = constructor()
+    def __init__(self, number: Parser[S, int], child: Parser[S, Y]):
+        self.number = number
+        super().__init__(child)
+        self._number_parse = returning(number)
+
+    def parse(self, sequence: S) -> Outcome[S, Sequence[Y]]:
+        results: list[Y] = []
         current = sequence
-        runs = 0
 
-        while runs < upper:
-            try:
-                (current, value) = parser(current)
-                accumulator = gather(accumulator, value)
-                runs += 1
-            except Error:
-                break
+        number = self._number_parse(current)
+        if isinstance(number, Error):
+            return number
 
-        if runs < lower:
-            raise Error(sequence, ErrorKind.FOLD_MANY_BOUNDED)
+        (current, times) = number
+        # SAFETY: the number parser MUST return an integer of some sort!
+        assert isinstance(times, int)
 
-        return (current, accumulator)
+        parse = self._parse
+        for _ in range(times):
+            repeated = parse(current)
+            if isinstance(repeated, Error):
+                return repeated
 
-    return _fold_many_bounded
+            (current, result) = repeated
+            results.append(result)
+
+        return (current, results)
 
 
 def length_count(
@@ -157,22 +296,38 @@ def length_count(
     Gets a number from the first parser, then applies the second parser that
     many times.
     """
+    return LengthCount(num_parser, repeat)
 
-    def _length_count(sequence: S) -> Result[S, Sequence[Y]]:
-        results: list[Y] = []
+
+class LengthData(Node[S, S]):
+    """
+    Node taking as many elements as the number yielded by `number`.
+    """
+
+    __slots__ = ("number", "_number_parse")
+    __match_args__ = ("number",)
+    _child_params = ("number",)
+
+    def __init__(self, number: Parser[S, int]):
+        self.number = number
+        self._number_parse = returning(number)
+
+    def parse(self, sequence: S) -> Outcome[S, S]:
         current = sequence
 
-        (current, times) = num_parser(current)
+        number = self._number_parse(current)
+        if isinstance(number, Error):
+            return number
+
+        (current, times) = number
         # SAFETY: the number parser MUST return an integer of some sort!
         assert isinstance(times, int)
 
-        for _ in range(times):
-            (current, result) = repeat(current)
-            results.append(result)
-
-        return (current, results)
+        divided = ptake(current, times)
+        if divided is None:
+            return Error(current, ErrorKind.EOF)
 
-    return _length_count
+        return divided
 
 
 def length_data(num_parser: Parser[S, int]) -> Parser[S, S]:
@@ -180,18 +335,38 @@ def length_data(num_parser: Parser[S, int]) -> Parser[S, S]:
     Gets a number from the parser and returns a subslice of the input of that
     size.
     """
+    return LengthData(num_parser)
+
+
+class LengthValue(Wrapper[S, Y]):
+    """
+    Node applying its child on a subslice as long as the number yielded by
+    `number`.
+    """
+
+    __slots__ = ("number", "_data_parse")
+    __match_args__ = ("number", "child")
+    _child_params = ("number", "child")
+
+    def __init__(self, number: Parser[S, int], child: Parser[S, Y]):
+        self.number = number
+        super().__init__(child)
+        self._data_parse = LengthData(number).parse
 
-    def _length_data(sequence: S) -> Result[S, S]:
+    def parse(self, sequence: S) -> Outcome[S, Y]:
         current = sequence
 
-        (current, times) = num_parser(current)
-        # SAFETY: the number parser MUST return an integer of some sort!
-        assert isinstance(times, int)
+        data = self._data_parse(current)
+        if isinstance(data, Error):
+            return data
 
-        taker: Parser[S, S] = take(times)
-        return taker(current)
+        (current, subslice) = data
+        applied = self._parse(subslice)
+        if isinstance(applied, Error):
+            return applied
 
-    return _length_data
+        (_, result) = applied
+        return (current, result)
 
 
 def length_value(
@@ -201,16 +376,39 @@ def length_value(
     Gets a number from the first parser, takes a subslice of the input of that
     size, then applies the second parser on that subslice.
     """
+    return LengthValue(num_parser, slice_parser)
+
+
+class Many0(Wrapper[S, Sequence[Y]]):
+    """
+    Node collecting the values of its child, applied until it fails or the
+    input is exhausted, into a list.
+    """
 
-    def _length_value(sequence: S) -> Result[S, Y]:
+    __slots__ = ()
+
+    def __init__(self, child: Parser[S, Y]):
+        super().__init__(child)
+
+    def parse(self, sequence: S) -> Outcome[S, Sequence[Y]]:
+        parse = self._parse
+        values: list[Y] = []
         current = sequence
 
-        (current, subslice) = length_data(num_parser)(current)
-        (_, result) = slice_parser(subslice)
+        while True:
+            if eof(current):
+                break
+
+            result = parse(current)
+            if isinstance(result, Error):
+                if isinstance(result, Incomplete):
+                    return result
+                break
 
-        return (current, result)
+            (current, value) = result
+            values.append(value)
 
-    return _length_value
+        return (current, values)
 
 
 def many0(parser: Parser[S, Y]) -> Parser[S, Sequence[Y]]:
@@ -220,57 +418,77 @@ def many0(parser: Parser[S, Y]) -> Parser[S, Sequence[Y]]:
     Returns on an exhausted sequence to prevent an infinite loop with parsers
     that accept empty inputs.
     """
-
-    def lappend(acc: list[Y], item: Y) -> list[Y]:
-        acc.append(item)
-        return acc
-
-    return fold_many0(parser, list, lappend)  # type: ignore
+    return Many0(parser)
 
 
-def many0_count(parser: Parser[S, Y]) -> Parser[S, int]:
+class Many0Count(Wrapper[S, int], Generic[S, Y]):
     """
-    Repeats the embedded parser, counting the number of successes before a
-    failure.
+    Node counting the successes of its child, applied until it fails or the
+    input is exhausted.
     """
 
-    def _many0_count(sequence: S) -> Result[S, int]:
+    __slots__ = ()
+
+    def __init__(self, child: Parser[S, Y]):
+        super().__init__(child)
+
+    def parse(self, sequence: S) -> Outcome[S, int]:
+        parse = self._parse
         consecutive = 0
         current = sequence
         while True:
             if eof(current):
                 break
-            try:
-                (current, _) = parser(current)
-                consecutive += 1
-            except Error:
+
+            result = parse(current)
+            if isinstance(result, Error):
+                if isinstance(result, Incomplete):
+                    return result
                 break
 
+            (current, _) = result
+            consecutive += 1
+
         return (current, consecutive)
 
-    return _many0_count
 
+def many0_count(parser: Parser[S, Y]) -> Parser[S, int]:
+    """
+    Repeats the embedded parser, counting the number of successes before a
+    failure.
+    """
+    return Many0Count(parser)
 
-def many1(parser: Parser[S, Y]) -> Parser[S, Sequence[Y]]:
+
+class Many1(Wrapper[S, Sequence[Y]]):
     """
-    Runs the embedded Parser, raising an Error if the embedded Parser does not
-    exit with a success at least once.
+    Node collecting the values of its child, applied at least once, into a
+    list.
     """
 
-    def _many1(sequence: S) -> Result[S, Sequence[Y]]:
+    __slots__ = ()
+
+    def __init__(self, child: Parser[S, Y]):
+        super().__init__(child)
+
+    def parse(self, sequence: S) -> Outcome[S, Sequence[Y]]:
+        parse = self._parse
         once = False
-        result = []
+        values = []
         current = sequence
         last_raised: Optional[Error] = None
 
         while True:
-            try:
-                (current, value) = parser(current)
-                result.append(value)
-                once = True
-            except Error as error:
-                last_raised = error
+            result = parse(current)
+            if isinstance(result, Error):
+                if isinstance(result, Incomplete):
+                    return result
+                last_raised = result
                 break
+
+            (current, value) = result
+            values.append(value)
+            once = True
             if eof(current):
                 break
 
@@ -278,120 +496,204 @@ def many1(parser: Parser[S, Y]) -> Parser[S, Sequence[Y]]:
             kind = ErrorKind.MANY1
             if last_raised is not None:
                 kind = last_raised.kind
-            raise Error(sequence, kind)
+            return Error(sequence, kind)
 
-        return (current, result)
+        return (current, values)
 
-    return _many1
+    def first(self) -> Optional[frozenset[Any]]:
+        return first_of(self.child)
 
 
-def many1_count(parser: Parser[S, Y]) -> Parser[S, int]:
+def many1(parser: Parser[S, Y]) -> Parser[S, Sequence[Y]]:
     """
-    Runs the Parser as many time as possible, counting the results.
+    Runs the embedded Parser, raising an Error if the embedded Parser does not
+    exit with a success at least once.
     """
+    return Many1(parser)
 
-    def _many1_count(sequence: S) -> Result[S, int]:
-        result = many0_count(parser)(sequence)
+
+class Many1Count(Many0Count[S, Y]):
+    """
+    Node counting the successes of its child, applied at least once.
+    """
+
+    __slots__ = ()
+
+    def parse(self, sequence: S) -> Outcome[S, int]:
+        result = super().parse(sequence)
+        if isinstance(result, Error):
+            return result  # pragma: no cover
 
         (_, icount) = result
         if icount < 1:
-            raise Error(sequence, ErrorKind.MANY1_COUNT)
+            return Error(sequence, ErrorKind.MANY1_COUNT)
 
         return result
 
-    return _many1_count
 
+def many1_count(parser: Parser[S, Y]) -> Parser[S, int]:
+    """
+    Runs the Parser as many time as possible, counting the results.
+    """
+    return Many1Count(parser)
 
-def many_bounded(
-    lower: int, upper: int, parser: Parser[S, Y]
-) -> Parser[S, Sequence[Y]]:
+
+class ManyBounded(Wrapper[S, Sequence[Y]]):
     """
-    Repeats the parser within the given bounds.
+    Node collecting between `lower` and `upper` values of its child into a
+    list.
     """
 
-    def _many_bounded(sequence: S) -> Result[S, Sequence[Y]]:
-        result = []
+    __slots__ = ("lower", "upper")
+    __match_args__ = ("lower", "upper", "child")
+
+    def __init__(self, lower: int, upper: int, child: Parser[S, Y]):
+        self.lower = lower
+        self.upper = upper
+        super().__init__(child)
+
+    def parse(self, sequence: S) -> Outcome[S, Sequence[Y]]:
+        parse = self._parse
+        values = []
         matches = 0
         current = sequence
         while True:
-            try:
-                if eof(current):
-                    break
-                (current, value) = parser(current)
-                result.append(value)
-                matches += 1
-            except Error:
+            if eof(current):
                 break
-            if matches == upper:
+
+            result = parse(current)
+            if isinstance(result, Error):
+                if isinstance(result, Incomplete):
+                    return result
                 break
 
-        if matches < lower:
-            raise Error(sequence, ErrorKind.MANY_BOUNDED)
+            (current, value) = result
+            values.append(value)
+            matches += 1
+            if matches == self.upper:
+                break
 
-        return (current, result)
+        if matches < self.lower:
+            return Error(sequence, ErrorKind.MANY_BOUNDED)
 
-    return _many_bounded
+        return (current, values)
 
 
-def many_till(
-    applied: Parser[S, Y], marker: Parser[S, A]
-) -> Parser[S, tuple[Sequence[Y], A]]:
+def many_bounded(
+    lower: int, upper: int, parser: Parser[S, Y]
+) -> Parser[S, Sequence[Y]]:
     """
-    Applies the parser `applied` until the `marker` parser yields a result.
+    Repeats the parser within the given bounds.
+    """
+    return ManyBounded(lower, upper, parser)
+
+
+class ManyTill(Wrapper[S, tuple[Sequence[Y], A]]):
+    """
+    Node collecting the values of its child until `marker` succeeds.
     """
 
-    def _many_till(sequence: S) -> Result[S, tuple[Sequence[Y], A]]:
+    __slots__ = ("marker", "_marker_parse")
+    __match_args__ = ("child", "marker")
+    _child_params = ("child", "marker")
+
+    def __init__(self, child: Parser[S, Y], marker: Parser[S, A]):
+        super().__init__(child)
+        self.marker = marker
+        self._marker_parse = returning(marker)
+
+    def parse(self, sequence: S) -> Outcome[S, tuple[Sequence[Y], A]]:
+        (parse, marker_parse) = (self._parse, self._marker_parse)
         current = sequence
         results = []
         while True:
-            try:
-                (current, trailing) = marker(current)
+            marked = marker_parse(current)
+            if not isinstance(marked, Error):
+                (current, trailing) = marked
                 break
-            except Error:
-                pass
+            if isinstance(marked, Incomplete):
+                return marked
 
-            (current, value) = applied(current)
+            result = parse(current)
+            if isinstance(result, Error):
+                return result
+
+            (current, value) = result
             results.append(value)
 
         return (current, (results, trailing))
 
-    return _many_till
 
+def many_till(
+    applied: Parser[S, Y], marker: Parser[S, A]
+) -> Parser[S, tuple[Sequence[Y], A]]:
+    """
+    Applies the parser `applied` until the `marker` parser yields a result.
+    """
+    return ManyTill(applied, marker)
 
-def separated_list0(
-    separator: Parser[S, A], element: Parser[S, Y]
-) -> Parser[S, Sequence[Y]]:
+
+class SeparatedList0(Wrapper[S, Sequence[Y]], Generic[S, A, Y]):
     """
-    Alternated between two parsers to produce a list of elements.
+    Node collecting the values of its child, separated by `separator`, into a
+    list.
     """
 
-    def _separated_list0(sequence: S) -> Result[S, Sequence[Y]]:
+    __slots__ = ("separator", "_separator_parse")
+    __match_args__ = ("separator", "child")
+    _child_params = ("separator", "child")
+
+    def __init__(self, separator: Parser[S, A], child: Parser[S, Y]):
+        self.separator = separator
+        super().__init__(child)
+        self._separator_parse = returning(separator)
+
+    def parse(self, sequence: S) -> Outcome[S, Sequence[Y]]:
+        (parse, separator_parse) = (self._parse, self._separator_parse)
         current = sequence
         results = []
         lag = current
         while True:
-            try:
-                (current, value) = element(current)
-                results.append(value)
+            result = parse(current)
+            if isinstance(result, Error):
+                if isinstance(result, Incomplete):
+                    return result
+                break
 
-                lag = current
-                (current, _) = separator(current)
-            except Error:
+            (current, value) = result
+            results.append(value)
+
+            lag = current
+            separated = separator_parse(current)
+            if isinstance(separated, Error):
+                if isinstance(separated, Incomplete):
+                    return separated
                 break
 
-        return (lag, results)
+            (current, _) = separated
 
-    return _separated_list0
+        return (lag, results)
 
 
-def separated_list1(
+def separated_list0(
     separator: Parser[S, A], element: Parser[S, Y]
 ) -> Parser[S, Sequence[Y]]:
     """
     Alternated between two parsers to produce a list of elements.
     """
+    return SeparatedList0(separator, element)
+
+
+class SeparatedList1(SeparatedList0[S, A, Y]):
+    """
+    Node collecting at least one value of its child, separated by
+    `separator`, into a list.
+    """
+
+    __slots__ = ()
 
-    def _separated_list1(sequence: S) -> Result[S, Sequence[Y]]:
+    def parse(self, sequence: S) -> Outcome[S, Sequence[Y]]:
+        (parse, separator_parse) = (self._parse, self._separator_parse)
         current = sequence
         results = []
         lag = current
@@ -400,20 +702,37 @@ def separated_list1(
         underlying = None
 
         while True:
-            try:
-                (current, value) = element(current)
-                results.append(value)
-                run_once = True
-
-                lag = current
-                (current, _) = separator(current)
-            except Error as error:
-                underlying = error
+            result = parse(current)
+            if isinstance(result, Error):
+                if isinstance(result, Incomplete):
+                    return result
+                underlying = result
                 break
 
+            (current, value) = result
+            results.append(value)
+            run_once = True
+
+            lag = current
+            separated = separator_parse(current)
+            if isinstance(separated, Error):
+                if isinstance(separated, Incomplete):
+                    return separated
+                underlying = separated
+                break
+
+            (current, _) = separated
+
         if (not run_once) and (underlying is not None):
-            raise Error(sequence, underlying.kind)
+            return Error(sequence, underlying.kind)
 
         return (lag, results)
 
-    return _separated_list1
+
+def separated_list1(
+    separator: Parser[S, A], element: Parser[S, Y]
+) -> Parser[S, Sequence[Y]]:
+    """
+    Alternated between two parsers to produce a list of elements.
+    """
+    return SeparatedList1(separator, element)
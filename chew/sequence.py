@@ -1,11 +1,23 @@
 """
 Combinators applying parsers in sequence.
 """
-# pylint: disable=invalid-name, unbalanced-tuple-unpacking
-__all__ = ["multiple", "delimited", "pair", "preceded", "separated_pair", "terminated"]
-
-from typing import Iterable, Sequence, TypeVar
-from chew.types import Parser, Result, S
+# pylint: disable=invalid-name
+from __future__ import annotations
+__all__ = [
+    "Sequence",
+    "multiple",
+    "delimited",
+    "pair",
+    "preceded",
+    "separated_pair",
+    "terminated",
+]
+
+from typing import Any, Callable, Iterable, Optional, TypeVar
+import dataclasses
+import operator
+from chew.error import Error, Outcome, returning
+from chew.types import Node, Parser, S, first_of
 
 # Generic Yielded Element
 #
@@ -18,21 +30,80 @@ Y = TypeVar("Y")
 A = TypeVar("A")
 
 
-def multiple(parsers: Iterable[Parser[S, A]]) -> Parser[S, Sequence[A]]:
+@dataclasses.dataclass(frozen=True)
+class _Const:
     """
-    Matches a sequence of parsers.
+    A constant value within the projection of a Sequence.
+    """
+
+    value: Any
+
+
+# Projection of the Values yielded by a Sequence
+#
+# None for all of the values as a tuple, an index for a single value, a _Const
+# for its constant value, or a tuple of projections for a tuple of their
+# values.
+Keep = Optional[int | _Const | tuple["Keep", ...]]
+
+
+def _projector(keep: Keep) -> Callable[[list[Any]], Any]:
+    """
+    Builds a function applying a projection to the list of yielded values.
+    """
+    if keep is None:
+        return tuple
+    if isinstance(keep, int):
+        return operator.itemgetter(keep)
+    if isinstance(keep, _Const):
+        value = keep.value
+        return lambda values: value
+    if len(keep) > 1 and all(isinstance(index, int) for index in keep):
+        return operator.itemgetter(*keep)
+
+    projectors = [_projector(part) for part in keep]
+    return lambda values: tuple(project(values) for project in projectors)
+
+
+class Sequence(Node[S, Any]):
     """
+    Node applying its parsers one after another, yielding the projection of
+    their values given by `keep`.
+    """
+
+    __slots__ = ("parsers", "keep", "_parses", "_project")
+    __match_args__ = ("parsers", "keep")
+    _child_params = ("parsers",)
 
-    def _multiple(sequence: S) -> Result[S, Sequence[A]]:
+    def __init__(self, parsers: Iterable[Parser[S, Any]], keep: Keep = None):
+        self.parsers = tuple(parsers)
+        self.keep = keep
+        self._parses = [returning(parser) for parser in self.parsers]
+        self._project = _projector(keep)
+
+    def parse(self, sequence: S) -> Outcome[S, Any]:
         current = sequence
-        values: list[A] = []
-        for parser in parsers:
-            (current, value) = parser(current)
-            values.append(value)
+        values: list[Any] = []
+        append = values.append
+        for parse in self._parses:
+            result = parse(current)
+            if isinstance(result, Error):
+                return result
+
+            (current, value) = result
+            append(value)
+
+        return (current, self._project(values))
+
+    def first(self) -> Optional[frozenset[Any]]:
+        return first_of(self.parsers[0]) if self.parsers else None
 
-        return (current, tuple(values))
 
-    return _multiple
+def multiple(parsers: Iterable[Parser[S, A]]) -> Parser[S, tuple[A, ...]]:
+    """
+    Matches a sequence of parsers.
+    """
+    return Sequence(parsers)
 
 
 def delimited(
@@ -43,19 +114,14 @@ def delimited(
     from the second parser, and finally matches an object from the third parser
     and discards it.
     """
+    return Sequence([left, middle, right], 1)
 
-    def _delimited(sequence: S) -> Result[S, Y]:
-        (current, values) = multiple([left, middle, right])(sequence)
-        return (current, values[1])  # type: ignore
-
-    return _delimited
 
-
-def pair(left: Parser[S, Y], right: Parser[S, Y]) -> Parser[S, Sequence[Y]]:
+def pair(left: Parser[S, Y], right: Parser[S, Y]) -> Parser[S, tuple[Y, ...]]:
     """
     Gets an object from the first parser, then another from the second.
     """
-    return multiple([left, right])
+    return Sequence([left, right])
 
 
 def preceded(left: Parser[S, A], right: Parser[S, Y]) -> Parser[S, Y]:
@@ -63,29 +129,17 @@ def preceded(left: Parser[S, A], right: Parser[S, Y]) -> Parser[S, Y]:
     Matches an object from the first parser and disacards it, then gets an
     object from the second parser.
     """
-
-    def _preceeded(sequence: S) -> Result[S, Y]:
-        (current, values) = multiple([left, right])(sequence)
-        return (current, values[1])  # type: ignore
-
-    return _preceeded
+    return Sequence([left, right], 1)
 
 
 def separated_pair(
     left: Parser[S, A], middle: Parser[S, Y], right: Parser[S, A]
-) -> Parser[S, Sequence[Y]]:
+) -> Parser[S, tuple[Y, ...]]:
     """
     Gets an object from the first parser, then matches an object from the middle
     parser and discards it, then gets an object from the right parser.
     """
-
-    def _separated_pair(sequence: S) -> Result[S, Sequence[Y]]:
-        (current, values) = multiple([left, middle, right])(sequence)
-        (lvalue, _, rvalue) = values
-
-        return (current, (lvalue, rvalue))  # type: ignore
-
-    return _separated_pair
+    return Sequence([left, middle, right], (0, 2))
 
 
 def terminated(left: Parser[S, Y], right: Parser[S, A]) -> Parser[S, Y]:
@@ -93,9 +147,4 @@ def terminated(left: Parser[S, Y], right: Parser[S, A]) -> Parser[S, Y]:
     Gets an object from the left parser, then gets an object from the right
     parser and discards it.
     """
-
-    def _terminated(sequence: S) -> Result[S, Y]:
-        (current, values) = multiple([left, right])(sequence)
-        return (current, values[0])  # type: ignore
-
-    return _terminated
+    return Sequence([left, right], 0)
@@ -0,0 +1,452 @@
+"""
+Streaming counterparts of the parsers, for input which may be followed by more.
+
+Where a parser of the `generic`, `string` and `repeat` modules would fail, or
+stop, at the end of the input, its streaming counterpart returns an Incomplete
+failure telling how many more elements it needs (if known), so that it can be
+applied again once more input has been received; `tag("HTTP/")` fails on
+"HTT" with `Incomplete(remaining='HTT', needed=2)`.
+
+The combinators (`alt`, `optional`, the repeat combinators, ...) pass an
+Incomplete failure on rather than trying an alternative.
+"""
+# pylint: disable=duplicate-code
+from __future__ import annotations
+__all__ = [
+    "Greedy",
+    "Needs",
+    "StreamingTag",
+    "StreamingTake",
+    "StreamingTakeUntil",
+    "alpha0",
+    "alpha1",
+    "alphanum0",
+    "alphanum1",
+    "char",
+    "crlf",
+    "digit0",
+    "digit1",
+    "fold_many0",
+    "fold_many1",
+    "hex_digit0",
+    "hex_digit1",
+    "is_a",
+    "is_not",
+    "line_ending",
+    "many0",
+    "many0_count",
+    "many1",
+    "many1_count",
+    "multispace0",
+    "multispace1",
+    "newline",
+    "none_of",
+    "not_line_ending",
+    "oct_digit0",
+    "oct_digit1",
+    "one_of",
+    "satisfy",
+    "separated_list0",
+    "separated_list1",
+    "space0",
+    "space1",
+    "tab",
+    "tag",
+    "take",
+    "take_till",
+    "take_till1",
+    "take_until",
+    "take_while",
+    "take_while1",
+]
+from typing import Any, Callable, Optional, Sequence, TypeVar
+import operator
+from chew import generic, repeat, string
+from chew.branch import Alt
+from chew.charclass import CharClass
+from chew.error import Error, ErrorKind, Incomplete, Outcome, WithKind, Wrapper
+from chew.generic import I
+from chew.primitive import eof, find, take as ptake
+from chew.types import END, Matcher, Node, Parser, S, StringParser, first_of
+
+# Generic Yielded Element
+#
+# Yielded element from a Parser that we care about.
+Y = TypeVar("Y")
+
+# Arbitrary
+#
+# Aribtrary Held Value.
+A = TypeVar("A")
+
+
+def _ending(first: Optional[frozenset[Any]]) -> Optional[frozenset[Any]]:
+    """
+    Adds the end of the input to the known first elements of a Node which
+    needs more of an exhausted input.
+    """
+    return None if first is None else first | {END}
+
+
+class Needs(Wrapper[S, Y]):
+    """
+    Node needing `needed` elements of the input before applying its child,
+    such as one for the parsers of a single element.
+    """
+
+    __slots__ = ("needed",)
+    __match_args__ = ("child", "needed")
+
+    def __init__(self, child: Parser[S, Y], needed: int = 1):
+        super().__init__(child)
+        self.needed = needed
+
+    def parse(self, sequence: S) -> Outcome[S, Y]:
+        if len(sequence) < self.needed:
+            return Incomplete(sequence, self.needed - len(sequence))
+
+        return self._parse(sequence)
+
+    def first(self) -> Optional[frozenset[Any]]:
+        return _ending(first_of(self.child))
+
+
+class Greedy(Wrapper[S, Y]):
+    """
+    Node applying a child which consumes as much of the input as it can, such
+    as a run of elements or a repetition, which could go on in more input.
+
+    It needs more input if its child fails on an exhausted input, or consumes
+    all of the input.
+    """
+
+    __slots__ = ("needed",)
+    __match_args__ = ("child", "needed")
+
+    def __init__(self, child: Parser[S, Y], needed: Optional[int] = 1):
+        super().__init__(child)
+        self.needed = needed
+
+    def parse(self, sequence: S) -> Outcome[S, Y]:
+        result = self._parse(sequence)
+        if isinstance(result, Error):
+            if eof(sequence) and not isinstance(result, Incomplete):
+                return Incomplete(sequence, self.needed)
+            return result
+
+        if eof(result[0]):
+            return Incomplete(sequence, self.needed)
+
+        return result
+
+    def first(self) -> Optional[frozenset[Any]]:
+        return _ending(first_of(self.child))
+
+
+class StreamingTake(Node[S, S]):
+    """
+    Node taking a fixed number of elements, once there are enough of them.
+    """
+
+    __slots__ = ("count",)
+    __match_args__ = ("count",)
+
+    def __init__(self, count: int):
+        self.count = count
+
+    def parse(self, sequence: S) -> Outcome[S, S]:
+        divided = ptake(sequence, self.count)
+        if divided is None:
+            return Incomplete(sequence, self.count - len(sequence))
+
+        return divided
+
+
+def take(count: int) -> Parser[S, S]:
+    """
+    Take count elements from the stream.
+
+    Needs more input if the stream has fewer elements.
+    """
+    return StreamingTake[S](count)
+
+
+class StreamingTag(Node[S, S]):
+    """
+    Node matching & consuming a fixed sequence of elements, needing more input
+    when the input is a strict prefix of it.
+    """
+
+    __slots__ = ("pattern", "_tag")
+    __match_args__ = ("pattern",)
+
+    def __init__(self, pattern: S):
+        self.pattern = pattern
+        self._tag = generic.Tag(pattern)
+
+    def parse(self, sequence: S) -> Outcome[S, S]:
+        result = self._tag.parse(sequence)
+        if isinstance(result, Error) and len(sequence) < len(self.pattern):
+            if all(map(operator.eq, self.pattern, sequence)):
+                return Incomplete(sequence, len(self.pattern) - len(sequence))
+
+        return result
+
+    def first(self) -> Optional[frozenset[Any]]:
+        return _ending(self._tag.first())
+
+
+def tag(to_match: S) -> Parser[S, S]:
+    """
+    Matches & Consumes a sequence of elements.
+
+    Needs more input if the input is a strict prefix of the sequence.
+    """
+    return StreamingTag(to_match)
+
+
+class StreamingTakeUntil(Node[S, S]):
+    """
+    Node taking elements up to the first occurrence of a pattern, needing more
+    input until the pattern is found.
+    """
+
+    __slots__ = ("pattern",)
+    __match_args__ = ("pattern",)
+
+    def __init__(self, pattern: S):
+        self.pattern = pattern
+
+    def parse(self, sequence: S) -> Outcome[S, S]:
+        index = find(sequence, self.pattern)
+        if index < 0:
+            return Incomplete(sequence, None)
+
+        # SAFETY: a found index is always within the bounds of the sequence
+        result = ptake(sequence, index)
+        assert result is not None
+
+        return result
+
+
+def take_until(to_match: S) -> Parser[S, S]:
+    """
+    Returns the input slice up to the first occurrence of the pattern.
+
+    Needs more input until the pattern is found.
+    """
+    return StreamingTakeUntil(to_match)
+
+
+def take_while(cond: Matcher) -> Parser[S, S]:
+    """
+    Returns the longest input slice that matches the condition.
+    """
+    return Greedy[S, S](generic.take_while(cond))
+
+
+def take_while1(cond: Matcher) -> Parser[S, S]:
+    """
+    Returns the longest (at least 1) input slice that matches the condition.
+    """
+    return Greedy[S, S](generic.take_while1(cond))
+
+
+def take_till(cond: Matcher) -> Parser[S, S]:
+    """
+    Take from the state until the condition is true.
+    """
+    return Greedy[S, S](generic.take_till(cond))
+
+
+def take_till1(cond: Matcher) -> Parser[S, S]:
+    """
+    Returns the longest (minimum of 1) input slice until the condition is true.
+    """
+    return Greedy[S, S](generic.take_till1(cond))
+
+
+def is_a(items: S | CharClass) -> Parser[S, S]:
+    """
+    Returns the longest slice whose elements are in the sequence of items (or
+    in the CharClass).
+    """
+    return Greedy[S, S](generic.is_a(items))
+
+
+def is_not(items: S | CharClass) -> Parser[S, S]:
+    """
+    Returns the longest slice whose elements do not contain the sequence of
+    items (or the CharClass).
+    """
+    return Greedy[S, S](generic.is_not(items))
+
+
+def char(character: str) -> StringParser:
+    """
+    Matches a single character.
+    """
+    return Needs(string.char(character))
+
+
+def satisfy(cond: Matcher) -> StringParser:
+    """
+    Recognizes one character and check that it satisfies a predicate.
+    """
+    return Needs(string.satisfy(cond))
+
+
+def one_of(characters: Sequence[str] | CharClass) -> StringParser:
+    """
+    Recognizes one of the provided characters.
+    """
+    return Needs(string.one_of(characters))
+
+
+def none_of(characters: Sequence[str] | CharClass) -> StringParser:
+    """
+    Recognizes a character that is not in the provided characters.
+    """
+    return Needs(string.none_of(characters))
+
+
+# Recognizes zero or more uppercase alphabetic characters.
+alpha0: StringParser = Greedy(string.alpha0)
+
+# Recognizes one or more alphabetic characters.
+alpha1: StringParser = Greedy(string.alpha1)
+
+# Recognizes zero or more alphanumeric characters.
+alphanum0: StringParser = Greedy(string.alphanum0)
+
+# Recognizes one or more alphanumeric characters.
+alphanum1: StringParser = Greedy(string.alphanum1)
+
+# Matches an "\r\n".
+crlf: StringParser = WithKind(StreamingTag("\r\n"), ErrorKind.CRLF)
+
+# Recognizes zero or more ASCII numerical characters (0 - 9).
+digit0: StringParser = Greedy(string.digit0)
+
+# Recognizes one or more ASCII numerical characters (0 - 9).
+digit1: StringParser = Greedy(string.digit1)
+
+# Recognizes zero or more ASCII hexidecimal characters (0-9, A-F, a-f).
+hex_digit0: StringParser = Greedy(string.hex_digit0)
+
+# Recognizes one or more ASCII hexidecimal characters (0-9, A-F, a-f).
+hex_digit1: StringParser = Greedy(string.hex_digit1)
+
+# Recognizes an end of line (both '\n' and '\r\n').
+line_ending: StringParser = WithKind(
+    Alt([Needs(string.Char("\n")), StreamingTag("\r\n")]), ErrorKind.CRLF
+)
+
+# Recognizes zero or more spaces, tabs, carriage returns, and line feeds.
+multispace0: StringParser = Greedy(string.multispace0)
+
+# Recognizes one or more spaces, tabs, carriage returns, and line feeds.
+multispace1: StringParser = Greedy(string.multispace1)
+
+# Matches a newline character '\n'.
+newline: StringParser = Needs(string.newline)
+
+# Recognizes a string of any character except '\r\n' or '\n'.
+not_line_ending: StringParser = Greedy(string.not_line_ending)
+
+# Recognizes zero or more octal characters (0-7).
+oct_digit0: StringParser = Greedy(string.oct_digit0)
+
+# Recognizes one or more octal characters (0-7).
+oct_digit1: StringParser = Greedy(string.oct_digit1)
+
+# Recognizes zero or more spaces and tabs.
+space0: StringParser = Greedy(string.space0)
+
+# Recognizes one or more spaces and tabs.
+space1: StringParser = Greedy(string.space1)
+
+# Matches a tab character.
+tab: StringParser = Needs(string.tab)
+
+
+def many0(parser: Parser[S, Y]) -> Parser[S, Sequence[Y]]:
+    """
+    Repeats the parser, calling the results into a Sequence.
+
+    Needs more input if the repetitions reach the end of the input.
+    """
+    return Greedy(repeat.many0(parser), None)
+
+
+def many1(parser: Parser[S, Y]) -> Parser[S, Sequence[Y]]:
+    """
+    Runs the embedded Parser, raising an Error if the embedded Parser does not
+    exit with a success at least once.
+
+    Needs more input if the repetitions reach the end of the input.
+    """
+    return Greedy(repeat.many1(parser), None)
+
+
+def many0_count(parser: Parser[S, Y]) -> Parser[S, int]:
+    """
+    Repeats the embedded parser, counting the number of successes before a
+    failure.
+
+    Needs more input if the repetitions reach the end of the input.
+    """
+    return Greedy(repeat.many0_count(parser), None)
+
+
+def many1_count(parser: Parser[S, Y]) -> Parser[S, int]:
+    """
+    Runs the Parser as many time as possible, counting the results.
+
+    Needs more input if the repetitions reach the end of the input.
+    """
+    return Greedy(repeat.many1_count(parser), None)
+
+
+def fold_many0(
+    parser: Parser[S, Y], constructor: Callable[[], A], gather: Callable[[A, Y], A]
+) -> Parser[S, A]:
+    """
+    Repeats the parser, calling `gather` to gather the results.
+
+    Needs more input if the repetitions reach the end of the input.
+    """
+    return Greedy(repeat.fold_many0(parser, constructor, gather), None)
+
+
+def fold_many1(
+    parser: Parser[S, Y], constructor: Callable[[], I], gather: Callable[[I, Y], I]
+) -> Parser[S, I]:
+    """
+    Repeats the parser at least once, calling `gather` to gather the results.
+
+    Needs more input if the repetitions reach the end of the input.
+    """
+    return Greedy(repeat.fold_many1(parser, constructor, gather), None)
+
+
+def separated_list0(
+    separator: Parser[S, A], element: Parser[S, Y]
+) -> Parser[S, Sequence[Y]]:
+    """
+    Alternated between two parsers to produce a list of elements.
+
+    Needs more input if the list reaches the end of the input.
+    """
+    return Greedy(repeat.separated_list0(separator, element), None)
+
+
+def separated_list1(
+    separator: Parser[S, A], element: Parser[S, Y]
+) -> Parser[S, Sequence[Y]]:
+    """
+    Alternated between two parsers to produce a list of at least one element.
+
+    Needs more input if the list reaches the end of the input.
+    """
+    return Greedy(repeat.separated_list1(separator, element), None)
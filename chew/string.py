@@ -1,7 +1,13 @@
 """
 Parsers that operate on strings.
 """
+from __future__ import annotations
 __all__ = [
+    "Char",
+    "NoneOf",
+    "OneOf",
+    "Satisfy",
+    "TagNoCase",
     "satisfy",
     "char",
     "alpha0",
@@ -27,248 +33,242 @@ __all__ = [
     "tab",
     "tag_no_case",
 ]
-from typing import Sequence
+from typing import Any, Optional, Sequence
 import string as stdstring
 from chew.types import (
+    Node,
     StringParser,
-    Result,
     Matcher,
-    Parser,
 )
-from chew.error import Error, ErrorKind, map_kind, ignore_kind
-from chew.branch import alt
-from chew.generic import tag, is_a, take, take_while, _min_one
+from chew.error import (
+    Error,
+    ErrorKind,
+    IgnoringKind,
+    Outcome,
+    WithKind,
+)
+from chew.branch import Alt
+from chew.charclass import CharClass
+from chew.generic import IsA, MinOne, Tag, TakeTill, TakeWhile
+from chew.primitive import take as ptake
+
+
+# Classes of the characters recognized by the parsers below.
+_ALPHABETIC = CharClass(stdstring.ascii_letters)
+_DIGITS = CharClass(stdstring.digits)
+_HEX_DIGITS = CharClass(stdstring.hexdigits)
+_OCT_DIGITS = CharClass(stdstring.octdigits)
+_SPACES = CharClass(" \t")
+_MULTISPACES = CharClass(" \t\n\r")
+_LINE_ENDINGS = CharClass("\r\n")
 
 
 def is_alphabetic(character: str) -> bool:
     """
     Returns True if the given character is an ASCII letter.
     """
-    return character in stdstring.ascii_letters
+    return character in _ALPHABETIC
 
 
-def tag_no_case(to_match: str) -> StringParser:
+class TagNoCase(Node[str, str]):
     """
-    Recognizes a Case-Insensitive Pattern.
+    Node matching a case-insensitive pattern.
     """
 
-    def _tag_no_case(sequence: str) -> Result[str, str]:
-        taker: Parser[str, str] = take(len(to_match))
-        with map_kind(ErrorKind.TAG):
-            (current, raw_compare) = taker(sequence)
+    __slots__ = ("pattern", "_lowered")
+    __match_args__ = ("pattern",)
 
-        if to_match.lower() != raw_compare.lower():
-            raise Error(sequence, ErrorKind.TAG)
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self._lowered = pattern.lower()
 
-        return (current, raw_compare)
+    def parse(self, sequence: str) -> Outcome[str, str]:
+        divided = ptake(sequence, len(self.pattern))
+        if divided is None:
+            return Error(sequence, ErrorKind.TAG)
 
-    return _tag_no_case
+        (_, raw_compare) = divided
+        if isinstance(raw_compare, memoryview):
+            # views have no case, so the (pattern-sized) slice is copied
+            raw_compare = bytes(raw_compare)
+        if self._lowered != raw_compare.lower():
+            return Error(sequence, ErrorKind.TAG)
 
+        return divided
 
-def char(character: str) -> StringParser:
+
+def tag_no_case(to_match: str) -> StringParser:
     """
-    Matches a single character.
+    Recognizes a Case-Insensitive Pattern.
     """
+    return TagNoCase(to_match)
 
-    def _char(sequence: str) -> Result[str, str]:
-        taker: Parser[str, str] = take(1)
-        with map_kind(ErrorKind.CHAR):
-            result = taker(sequence)
-        (_, nchar) = result
 
-        if nchar != character:
-            raise Error(sequence, ErrorKind.CHAR)
+class Char(Node[str, str]):
+    """
+    Node matching a single character.
+    """
 
-        return result
+    __slots__ = ("character",)
+    __match_args__ = ("character",)
 
-    return _char
+    def __init__(self, character: str):
+        self.character = character
 
+    def parse(self, sequence: str) -> Outcome[str, str]:
+        divided = ptake(sequence, 1)
+        if divided is None or divided[1] != self.character:
+            return Error(sequence, ErrorKind.CHAR)
 
-def satisfy(cond: Matcher) -> StringParser:
-    """
-    Recognizes one character and check that it satisfies a predicate.
-    """
-
-    def _satisfy(sequence: str) -> Result:
-        taker: Parser[str, str] = take(1)
-        with map_kind(ErrorKind.SATISFY):
-            (current, item) = taker(sequence)
-        if cond(item):
-            return (current, item)
-        raise Error(sequence, ErrorKind.SATISFY)
+        return divided
 
-    return _satisfy
+    def first(self) -> Optional[frozenset[Any]]:
+        return frozenset(self.character) if len(self.character) == 1 else None
 
 
-def one_of(characters: Sequence[str]) -> StringParser:
+def char(character: str) -> StringParser:
     """
-    Recognizes one of the provided characters.
+    Matches a single character.
     """
-
-    def _one_of(sequence: str) -> Result[str, str]:
-        with map_kind(ErrorKind.ONE_OF):
-            return satisfy(lambda c: c in characters)(sequence)
-
-    return _one_of
+    return Char(character)
 
 
-def none_of(characters: Sequence[str]) -> StringParser:
+class Satisfy(Node[str, str]):
     """
-    Recognizes a character that is not in the provided characters.
+    Node matching a single character satisfying a predicate.
     """
 
-    def _none_of(sequence: str) -> Result[str, str]:
-        with map_kind(ErrorKind.NONE_OF):
-            return satisfy(lambda c: c not in characters)(sequence)
+    __slots__ = ("cond",)
+    __match_args__ = ("cond",)
 
-    return _none_of
+    def __init__(self, cond: Matcher):
+        self.cond = cond
 
+    def parse(self, sequence: str) -> Outcome[str, str]:
+        divided = ptake(sequence, 1)
+        if divided is None or not self.cond(divided[1]):
+            return Error(sequence, ErrorKind.SATISFY)
 
-def alpha0(sequence: str) -> Result[str, str]:
-    """
-    Recognizes zero or more uppercase alphabetic characters.
-    """
-    return take_while(is_alphabetic)(sequence)  # type: ignore
+        return divided
 
 
-def alpha1(sequence: str) -> Result[str, str]:
+def satisfy(cond: Matcher) -> StringParser:
     """
-    Recognizes one or more alphabetic characters.
+    Recognizes one character and check that it satisfies a predicate.
     """
-    return _min_one(alpha0, ErrorKind.ALPHA)(sequence)
+    return Satisfy(cond)
 
 
-def alphanum0(sequence: str) -> Result[str, str]:
+class OneOf(Node[str, str]):
     """
-    Recognizes zero or more alphanumeric characters.
+    Node matching a single character found in `characters`.
     """
 
-    # SAFETY: element type constraint will be enforced on calling our return
-    # value
-    return take_while(str.isalnum)(sequence)  # type: ignore
+    __slots__ = ("characters", "_class")
+    __match_args__ = ("characters",)
 
+    def __init__(self, characters: Sequence[str] | CharClass):
+        self.characters = characters
+        self._class = CharClass.of(characters)
 
-def alphanum1(sequence: str) -> Result[str, str]:
-    """
-    Recognizes one or more alphanumeric characters.
-    """
+    def parse(self, sequence: str) -> Outcome[str, str]:
+        divided = ptake(sequence, 1)
+        if divided is None or divided[1] not in self._class:
+            return Error(sequence, ErrorKind.ONE_OF)
 
-    return _min_one(alphanum0, ErrorKind.ALPHA_NUMERIC)(sequence)
+        return divided
 
+    def first(self) -> Optional[frozenset[Any]]:
+        return self._class.elements
 
-def crlf(sequence: str) -> Result[str, str]:
-    """
-    Matches an "\\r\\n".
-    """
-    with map_kind(ErrorKind.CRLF):
-        return tag("\r\n")(sequence)
 
-
-def digit0(sequence: str) -> Result[str, str]:
+def one_of(characters: Sequence[str] | CharClass) -> StringParser:
     """
-    Recognizes zero or more ASCII numerical characters (0 - 9).
+    Recognizes one of the provided characters.
     """
-    with ignore_kind(ErrorKind.IS_A):
-        return is_a(stdstring.digits)(sequence)
-    return (sequence, "")
+    return OneOf(characters)
 
 
-def digit1(sequence: str) -> Result[str, str]:
+class NoneOf(Node[str, str]):
     """
-    Recognizes one or more ASCII numerical characters (0 - 9).
+    Node matching a single character not found in `characters`.
     """
 
-    return _min_one(digit0, ErrorKind.DIGIT)(sequence)
+    __slots__ = ("characters", "_class")
+    __match_args__ = ("characters",)
 
+    def __init__(self, characters: Sequence[str] | CharClass):
+        self.characters = characters
+        self._class = CharClass.of(characters)
 
-def hex_digit0(sequence: str) -> Result[str, str]:
-    """
-    Recognizes zero or more ASCII hexidecimal characters (0-9, A-F, a-f).
-    """
-    with ignore_kind(ErrorKind.IS_A):
-        return is_a(stdstring.hexdigits)(sequence)
-    return (sequence, "")
+    def parse(self, sequence: str) -> Outcome[str, str]:
+        divided = ptake(sequence, 1)
+        if divided is None or divided[1] in self._class:
+            return Error(sequence, ErrorKind.NONE_OF)
+
+        return divided
 
 
-def hex_digit1(sequence: str) -> Result[str, str]:
+def none_of(characters: Sequence[str] | CharClass) -> StringParser:
     """
-    Recognizes one or more ASCII hexidecimal characters (0-9, A-F, a-f).
+    Recognizes a character that is not in the provided characters.
     """
-    return _min_one(hex_digit0, ErrorKind.HEX_DIGIT)(sequence)
+    return NoneOf(characters)
 
 
-def line_ending(sequence: str) -> Result[str, str]:
-    """
-    Recognizes an end of line (both '\\n' and '\\r\\n').
-    """
-    with map_kind(ErrorKind.CRLF):
-        return alt([char("\n"), tag("\r\n")])(sequence)
+# Recognizes zero or more uppercase alphabetic characters.
+alpha0: StringParser = TakeWhile[str](_ALPHABETIC)
 
+# Recognizes one or more alphabetic characters.
+alpha1: StringParser = MinOne(alpha0, ErrorKind.ALPHA)
 
-def multispace0(sequence: str) -> Result[str, str]:
-    """
-    Recognizes zero or more spaces, tabs, carriage returns, and line feeds.
-    """
-    with ignore_kind(ErrorKind.IS_A):
-        return is_a(" \t\n\r")(sequence)
-    return (sequence, "")
+# Recognizes zero or more alphanumeric characters.
+alphanum0: StringParser = TakeWhile[str](str.isalnum)
 
+# Recognizes one or more alphanumeric characters.
+alphanum1: StringParser = MinOne(alphanum0, ErrorKind.ALPHA_NUMERIC)
 
-def multispace1(sequence: str) -> Result[str, str]:
-    """
-    Recognizes one or more spaces, tabs, carriage returns, and line feeds.
-    """
-    return _min_one(multispace0, ErrorKind.MULTI_SPACE)(sequence)
+# Matches an "\r\n".
+crlf: StringParser = WithKind(Tag("\r\n"), ErrorKind.CRLF)
 
+# Recognizes zero or more ASCII numerical characters (0 - 9).
+digit0: StringParser = IgnoringKind(IsA[str](_DIGITS), ErrorKind.IS_A, "")
 
-def newline(sequence: str) -> Result[str, str]:
-    """
-    Matches a newline character '\\n'.
-    """
-    return char("\n")(sequence)
+# Recognizes one or more ASCII numerical characters (0 - 9).
+digit1: StringParser = MinOne(digit0, ErrorKind.DIGIT)
 
+# Recognizes zero or more ASCII hexidecimal characters (0-9, A-F, a-f).
+hex_digit0: StringParser = IgnoringKind(IsA[str](_HEX_DIGITS), ErrorKind.IS_A, "")
 
-def not_line_ending(sequence: str) -> Result[str, str]:
-    """
-    Recognizes a string of any character except '\\r\\n' or '\\n'.
-    """
-    return take_while(lambda el: el not in "\r\n")(sequence)  # type: ignore
+# Recognizes one or more ASCII hexidecimal characters (0-9, A-F, a-f).
+hex_digit1: StringParser = MinOne(hex_digit0, ErrorKind.HEX_DIGIT)
 
+# Recognizes an end of line (both '\n' and '\r\n').
+line_ending: StringParser = WithKind(Alt([Char("\n"), Tag("\r\n")]), ErrorKind.CRLF)
 
-def oct_digit0(sequence: str) -> Result[str, str]:
-    """
-    Recognizes zero or more octal characters (0-7).
-    """
-    with ignore_kind(ErrorKind.IS_A):
-        return is_a(stdstring.octdigits)(sequence)
-    return (sequence, "")
+# Recognizes zero or more spaces, tabs, carriage returns, and line feeds.
+multispace0: StringParser = IgnoringKind(IsA[str](_MULTISPACES), ErrorKind.IS_A, "")
 
+# Recognizes one or more spaces, tabs, carriage returns, and line feeds.
+multispace1: StringParser = MinOne(multispace0, ErrorKind.MULTI_SPACE)
 
-def oct_digit1(sequence: str) -> Result[str, str]:
-    """
-    Recognizes one or more octal characters (0-7).
-    """
-    return _min_one(oct_digit0, ErrorKind.OCT_DIGIT)(sequence)
+# Matches a newline character '\n'.
+newline: StringParser = Char("\n")
 
+# Recognizes a string of any character except '\r\n' or '\n'.
+not_line_ending: StringParser = TakeTill[str](_LINE_ENDINGS)
 
-def space0(sequence: str) -> Result[str, str]:
-    """
-    Recognizes zero or more spaces and tabs.
-    """
-    with ignore_kind(ErrorKind.IS_A):
-        return is_a(" \t")(sequence)
-    return (sequence, "")
+# Recognizes zero or more octal characters (0-7).
+oct_digit0: StringParser = IgnoringKind(IsA[str](_OCT_DIGITS), ErrorKind.IS_A, "")
 
+# Recognizes one or more octal characters (0-7).
+oct_digit1: StringParser = MinOne(oct_digit0, ErrorKind.OCT_DIGIT)
 
-def space1(sequence: str) -> Result[str, str]:
-    """
-    Recognizes one or more spaces and tabs.
-    """
-    return _min_one(space0, ErrorKind.SPACE)(sequence)
+# Recognizes zero or more spaces and tabs.
+space0: StringParser = IgnoringKind(IsA[str](_SPACES), ErrorKind.IS_A, "")
 
+# Recognizes one or more spaces and tabs.
+space1: StringParser = MinOne(space0, ErrorKind.SPACE)
 
-def tab(sequence: str) -> Result[str, str]:
-    """
-    Matches a tab character.
-    """
-    return char("\t")(sequence)
+# Matches a tab character.
+tab: StringParser = Char("\t")
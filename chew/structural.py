@@ -0,0 +1,268 @@
+"""
+Structural indexes of delimiter-separated bytes, and Parsers jumping through
+them.
+"""
+from __future__ import annotations
+__all__ = [
+    "Field",
+    "Fields",
+    "StructuralIndex",
+    "field",
+    "fields",
+    "structural_index",
+]
+import array
+import bisect
+import importlib
+import re
+from typing import Any, Optional, Sequence
+from chew.cursor import Cursor
+from chew.error import Outcome
+from chew.types import Node, Parser
+
+
+def _numpy() -> Optional[Any]:
+    """
+    Imports NumPy, or gets None if it is not installed.
+    """
+    try:
+        return importlib.import_module("numpy")
+    except ImportError:
+        return None
+
+
+# NumPy, when installed, to index buffers with bulk operations
+_NUMPY = _numpy()
+
+
+def _vectorized(
+    numpy: Any,
+    buffer: Any,
+    structural: bytes,
+    quote: Optional[bytes],
+    escape: Optional[bytes],
+) -> Sequence[int]:
+    """
+    Finds the offsets of the structural bytes of a buffer with whole-buffer
+    NumPy operations, in place of a loop over its bytes.
+    """
+    data = numpy.frombuffer(buffer, dtype=numpy.uint8)
+    wanted = numpy.isin(data, numpy.frombuffer(structural, dtype=numpy.uint8))
+    escaped = None
+    if escape is not None:
+        positions = numpy.arange(len(data))
+        # the last position at or before each position which isn't an escape
+        last = numpy.maximum.accumulate(
+            numpy.where(data == escape[0], -1, positions)
+        )
+        # a byte is escaped by an odd run of escapes right before it
+        escaped = numpy.zeros(len(data), dtype=bool)
+        escaped[1:] = (positions[:-1] - last[:-1]) % 2 == 1
+        wanted &= ~escaped
+
+    if quote is not None:
+        quotes = data == quote[0]
+        if escaped is not None:
+            quotes &= ~escaped
+        # bytes after an odd number of quotes are quoted
+        wanted &= numpy.cumsum(quotes) % 2 == 0
+
+    offsets = numpy.flatnonzero(wanted).astype(numpy.int64)
+    return array.array("q", offsets.tobytes())
+
+
+def _scanned(
+    buffer: Any,
+    structural: bytes,
+    quote: Optional[bytes],
+    escape: Optional[bytes],
+) -> Sequence[int]:
+    """
+    Finds the offsets of the structural bytes of a buffer with a search per
+    offset, skipping over quoted and escaped bytes with a regular expression.
+    """
+    if quote is None and escape is None and hasattr(buffer, "find"):
+        offsets: list[int] = []
+        for byte in structural:
+            delimiter = bytes([byte])
+            found = buffer.find(delimiter)
+            while found >= 0:
+                offsets.append(found)
+                found = buffer.find(delimiter, found + 1)
+        # the offsets of each byte are sorted, so they are merged in linear time
+        offsets.sort()
+        return offsets
+
+    skipped: list[bytes] = []
+    if escape is not None:
+        skipped.append(re.escape(escape) + b".")
+    if quote is not None:
+        quoted = b"[^" + re.escape(quote) + b"]"
+        if escape is not None:
+            quoted = b"(?:[^" + re.escape(quote + escape) + b"]|" + skipped[0] + b")"
+        skipped.append(re.escape(quote) + quoted + b"*" + re.escape(quote) + b"?")
+
+    delimiters = b"".join(re.escape(bytes([byte])) for byte in structural)
+    pattern = re.compile(b"|".join([*skipped, b"([" + delimiters + b"])"]), re.DOTALL)
+    return [found.start() for found in pattern.finditer(buffer) if found.lastindex]
+
+
+class StructuralIndex:
+    """
+    The sorted offsets of the structural bytes (such as delimiters and line
+    endings) of a buffer, outside of quoted strings and escapes, computed with
+    a single pass over the buffer.
+
+    A quoted string extends from a quote to the next one, so that a doubled
+    quote (as in CSV) closes and reopens it. An escape makes the byte after it
+    ordinary, whether or not it is quoted.
+    """
+
+    __slots__ = ("buffer", "structural", "quote", "escape", "offsets")
+
+    def __init__(
+        self,
+        buffer: Any,
+        structural: bytes,
+        quote: Optional[bytes] = None,
+        escape: Optional[bytes] = None,
+    ):
+        if not structural:
+            raise ValueError("no structural bytes to index")
+        for special in (quote, escape):
+            if special is not None and len(special) != 1:
+                raise ValueError(f"{special!r} is not a single byte")
+            if special is not None and special in structural:
+                raise ValueError(f"{special!r} can't also be a structural byte")
+
+        self.buffer = buffer
+        self.structural = structural
+        self.quote = quote
+        self.escape = escape
+        if _NUMPY is not None:
+            self.offsets = _vectorized(_NUMPY, buffer, structural, quote, escape)
+        else:
+            self.offsets = _scanned(buffer, structural, quote, escape)
+
+    def find(self, position: int) -> int:
+        """
+        Finds the offset of the first structural byte at or after a position,
+        or the length of the buffer if there is none.
+        """
+        index = bisect.bisect_left(self.offsets, position)
+        if index == len(self.offsets):
+            return len(self.buffer)
+        return self.offsets[index]
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __reduce__(self):
+        return (
+            StructuralIndex,
+            (self.buffer, self.structural, self.quote, self.escape),
+        )
+
+    def __repr__(self) -> str:
+        return f"StructuralIndex({self.structural!r}, {self.quote!r}, {self.escape!r})"
+
+
+def structural_index(
+    buffer: Any,
+    structural: bytes = b",\n",
+    quote: Optional[bytes] = None,
+    escape: Optional[bytes] = None,
+) -> StructuralIndex:
+    """
+    Indexes the structural bytes of a bytes-like buffer, outside of strings
+    quoted by `quote` and bytes escaped by `escape`, for the Parsers of fields
+    (`field` and `fields`) to jump from one to the next rather than scanning
+    for them.
+
+    With NumPy installed, the buffer is indexed with whole-buffer operations;
+    otherwise with a search per structural byte.
+    """
+    return StructuralIndex(buffer, structural, quote, escape)
+
+
+def _locate(index: StructuralIndex, sequence: Any) -> int:
+    """
+    Gets the position of an input in the buffer of an index, of which it must
+    be a Cursor.
+    """
+    if not (isinstance(sequence, Cursor) and sequence.buffer is index.buffer):
+        raise ValueError("the input is not a Cursor over the indexed buffer")
+    return sequence.position
+
+
+class Field(Node[Cursor, Any]):
+    """
+    Node taking the bytes up to the next structural byte of its index.
+    """
+
+    __slots__ = ("index",)
+    __match_args__ = ("index",)
+
+    def __init__(self, index: StructuralIndex):
+        self.index = index
+
+    def parse(self, sequence: Cursor) -> Outcome[Cursor, Any]:
+        position = _locate(self.index, sequence)
+        end = self.index.find(position)
+        return (Cursor(sequence.buffer, end), sequence.buffer[position:end])
+
+
+def field(index: StructuralIndex) -> Parser[Cursor, Any]:
+    """
+    Takes the (possibly empty) field of a Cursor over an indexed buffer, up to
+    the next structural byte, as `take_till` would without scanning for it.
+
+    Quoted fields are taken with their quotes, and escaped bytes with their
+    escapes.
+    """
+    return Field(index)
+
+
+class Fields(Node[Cursor, list[Any]]):
+    """
+    Node taking the fields of its index separated by `separator`, up to the
+    next other structural byte.
+    """
+
+    __slots__ = ("index", "separator")
+    __match_args__ = ("index", "separator")
+
+    def __init__(self, index: StructuralIndex, separator: bytes):
+        self.index = index
+        self.separator = separator
+
+    def parse(self, sequence: Cursor) -> Outcome[Cursor, list[Any]]:
+        position = _locate(self.index, sequence)
+        (buffer, offsets) = (sequence.buffer, self.index.offsets)
+        separator = self.separator[0]
+        values = []
+        index = bisect.bisect_left(offsets, position)
+        while index < len(offsets):
+            end = offsets[index]
+            values.append(buffer[position:end])
+            if buffer[end] != separator:
+                return (Cursor(buffer, end), values)
+            (position, index) = (end + 1, index + 1)
+
+        values.append(buffer[position:])
+        return (Cursor(buffer, len(buffer)), values)
+
+
+def fields(index: StructuralIndex, separator: bytes = b",") -> Parser[Cursor, list]:
+    """
+    Takes the fields of a record of a Cursor over an indexed buffer, separated
+    by `separator`, up to the next other structural byte (such as a newline)
+    or the end of the buffer, as `separated_list0` of `field` would:
+
+        index = structural_index(data, b",\\n", quote=b'"')
+        rows = many0(terminated(fields(index, b","), tag(b"\\n")))
+        (_, table) = rows(Cursor(data))
+
+    Yields at least one field, which may be empty.
+    """
+    return Fields(index, separator)
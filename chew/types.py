@@ -10,22 +10,35 @@ __all__ = [
     "Result",
     "Parser",
     "Matcher",
+    "Node",
+    "END",
+    "first_of",
 ]
 
 from typing import (
+    TYPE_CHECKING,
+    Any,
     Callable,
+    Generic,
+    Optional,
     Sequence,
     TypeAlias,
     TypeVar,
 )
+from chew.cursor import Cursor
+
+if TYPE_CHECKING:  # pragma: no cover
+    from chew.error import Outcome
 
 # Elements of an arbitrary ParseSequence
 V = TypeVar("V")
 
 # Underlying Parser Sequence to iterate over.
 #
-# May be a str, bytes, or an arbitrary sequence of elements (V).
-Parseable: TypeAlias = str | bytes | Sequence[V]
+# May be a str, bytes, bytearray, memoryview, or an arbitrary sequence of
+# elements (V), or a Cursor over any of those. Slices of a memoryview are views
+# of the same memory, so parsing one never copies the input.
+Parseable: TypeAlias = str | bytes | bytearray | memoryview | Cursor | Sequence[V]
 
 # Potential Yielded Elements of the Parse Sequence
 Element: TypeAlias = str | int | V
@@ -55,3 +68,125 @@ Parser = Callable[[S], Result[S, Y]]
 
 # Sub-Type of a Parser that operates on Strings
 StringParser = Parser[str, str]
+
+
+class _End:
+    """
+    Marker for the end of the input.
+    """
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "END"
+
+
+# Marker for the end of the input among the first elements of a Node (see
+# `Node.first`), for streaming Nodes that need more of an exhausted input.
+END = _End()
+
+
+class Node(Generic[S, Y]):
+    """
+    A Parser as an introspectable object rather than an opaque closure.
+
+    Calling a Node follows the Parser contract, raising an Error on failure,
+    while `parse` returns the Error instead (see `chew.error.returning`). The
+    constructor parameters of a Node are listed, in order, by `__match_args__`
+    so that grammars can be inspected, pattern-matched, rebuilt, and pickled.
+    """
+
+    __slots__ = ()
+
+    # constructor parameters, in order, exposed as attributes of the Node
+    __match_args__: tuple[str, ...] = ()
+
+    # constructor parameters holding a child Parser, or a sequence of them
+    _child_params: tuple[str, ...] = ()
+
+    def parse(self, sequence: S) -> Outcome[S, Y]:
+        """
+        Applies the Node, returning the Error on failure instead of raising it.
+        """
+        raise NotImplementedError
+
+    def first(self) -> Optional[frozenset[Any]]:
+        """
+        The elements the input must start with for the Node to succeed, or None
+        if they are unknown or the Node may succeed without consuming any input.
+
+        The elements include END if the Node needs more of an exhausted input.
+        """
+        return None
+
+    def __call__(self, sequence: S) -> Result[S, Y]:
+        result = self.parse(sequence)
+        # SAFETY: anything but a Result is the Error describing the failure
+        if not isinstance(result, tuple):
+            raise result
+
+        return result
+
+    @property
+    def params(self) -> dict[str, Any]:
+        """
+        The constructor parameters of the Node by name.
+        """
+        return {name: getattr(self, name) for name in self.__match_args__}
+
+    @property
+    def children(self) -> tuple[Parser, ...]:
+        """
+        The Parsers directly wrapped by the Node.
+        """
+        children: list[Parser] = []
+        for name in self._child_params:
+            child = getattr(self, name)
+            if isinstance(child, (tuple, list)):
+                children.extend(child)
+            else:
+                children.append(child)
+
+        return tuple(children)
+
+    def map_children(self, func: Callable[[Parser], Parser]) -> Node[S, Y]:
+        """
+        Creates a new Node with each child Parser replaced by `func(child)`, or
+        returns the Node itself if no child was replaced.
+        """
+        changes: dict[str, Any] = {}
+        for name in self._child_params:
+            child = getattr(self, name)
+            if isinstance(child, (tuple, list)):
+                elements = tuple(func(element) for element in child)
+                if any(new is not old for new, old in zip(elements, child)):
+                    changes[name] = elements
+            else:
+                replaced = func(child)
+                if replaced is not child:
+                    changes[name] = replaced
+
+        return self.replace(**changes) if changes else self
+
+    def replace(self, **changes: Any) -> Node[S, Y]:
+        """
+        Creates a new Node of the same type with some parameters replaced.
+        """
+        params = self.params
+        params.update(changes)
+        return self.__class__(*params.values())
+
+    def __repr__(self) -> str:
+        params = ", ".join(repr(value) for value in self.params.values())
+        return f"{self.__class__.__name__}({params})"
+
+    def __reduce__(self):
+        return (self.__class__, tuple(self.params.values()))
+
+
+def first_of(parser: Parser) -> Optional[frozenset[Any]]:
+    """
+    Gets the elements the input must start with for a Parser to succeed, or None
+    if they are unknown (see `Node.first`).
+    """
+    return parser.first() if isinstance(parser, Node) else None
@@ -0,0 +1,192 @@
+"""
+Test cases for the `binary` module.
+"""
+import importlib.util
+import pickle
+import struct
+import unittest
+from tests import assert_error
+from chew.binary import *
+from chew.cursor import Cursor
+from chew.error import Error, ErrorKind
+from chew.repeat import count, length_data, many0
+from chew.sequence import pair
+
+
+class TestFixedWidth(unittest.TestCase):
+    def test_integers(self):
+        data = bytes(range(1, 9))
+        for (parser, fmt) in [
+            (u8, "B"),
+            (i8, "b"),
+            (be_u16, ">H"),
+            (be_u32, ">I"),
+            (be_u64, ">Q"),
+            (be_i16, ">h"),
+            (le_u16, "<H"),
+            (le_u32, "<I"),
+            (le_u64, "<Q"),
+            (le_i32, "<i"),
+        ]:
+            size = struct.calcsize(fmt)
+            (expected,) = struct.unpack_from(fmt, data)
+            self.assertEqual(parser(data), (data[size:], expected))
+
+    def test_signed(self):
+        self.assertEqual(be_i8(b"\xff"), (b"", -1))
+        self.assertEqual(le_i8(b"\x80"), (b"", -128))
+        self.assertEqual(be_i32(b"\xff\xff\xff\xfe"), (b"", -2))
+        self.assertEqual(be_i64(b"\x80" + bytes(7)), (b"", -(1 << 63)))
+        self.assertEqual(le_i64(b"\xfe" + b"\xff" * 7), (b"", -2))
+        self.assertEqual(le_i16(b"\x00\x80"), (b"", -(1 << 15)))
+
+    def test_floats(self):
+        self.assertEqual(be_f32(b"\x3f\xc0\x00\x00"), (b"", 1.5))
+        self.assertEqual(le_f32(b"\x00\x00\xc0\x3f"), (b"", 1.5))
+        self.assertEqual(be_f64(struct.pack(">d", -0.25)), (b"", -0.25))
+        self.assertEqual(le_f64(struct.pack("<d", 1e300)), (b"", 1e300))
+
+    def test_cursor(self):
+        (remaining, value) = be_u16(Cursor(b"xx\x01\x02yz", 2))
+        self.assertEqual((remaining.position, value), (4, 258))
+        self.assertEqual(be_u8(remaining), (b"z", ord("y")))
+
+    def test_buffers(self):
+        for data in [bytearray(b"\x00\x02!"), memoryview(b"\x00\x02!")]:
+            (remaining, value) = be_u16(data)
+            self.assertEqual((remaining, value), (b"!", 2))
+        (_, value) = le_u32(Cursor(memoryview(b"\x01\x00\x00\x00")))
+        self.assertEqual(value, 1)
+
+    def test_byte_values(self):
+        self.assertEqual(be_u16([1, 2, 3]), ([3], 258))
+
+    def test_eof(self):
+        with assert_error(self, Error(b"\x01\x02\x03", ErrorKind.EOF)):
+            be_u32(b"\x01\x02\x03")
+        with assert_error(self, Error(b"", ErrorKind.EOF)):
+            u8(b"")
+
+    def test_unpack(self):
+        header = unpack("<HHI")
+        data = b"\x01\x00\x02\x00\x03\x00\x00\x00!"
+        self.assertEqual(header(data), (b"!", (1, 2, 3)))
+        self.assertEqual(unpack("4s")(b"abcdef"), (b"ef", b"abcd"))
+        self.assertEqual(unpack(">xH")(b"\xff\x00\x01"), (b"", 1))
+
+    def test_length_prefixed(self):
+        frame = pair(be_u8, length_data(be_u16))
+        self.assertEqual(frame(b"\x07\x00\x03abcd"), (b"d", (7, b"abc")))
+
+    def test_pickle(self):
+        parser = pickle.loads(pickle.dumps(be_u32))
+        self.assertEqual(parser(b"\x00\x00\x00\x01"), (b"", 1))
+
+
+class TestVarint(unittest.TestCase):
+    def test_uleb128(self):
+        self.assertEqual(uleb128(b"\x00"), (b"", 0))
+        self.assertEqual(uleb128(b"\x7f!"), (b"!", 127))
+        self.assertEqual(uleb128(b"\x80\x01"), (b"", 128))
+        self.assertEqual(uleb128(b"\xe5\x8e\x26"), (b"", 624485))
+
+    def test_uleb128_unbounded(self):
+        data = b"\xff" * 20 + b"\x01"
+        self.assertEqual(uleb128(data), (b"", (1 << 141) - 1))
+
+    def test_sleb128(self):
+        self.assertEqual(sleb128(b"\x02"), (b"", 2))
+        self.assertEqual(sleb128(b"\x7e"), (b"", -2))
+        self.assertEqual(sleb128(b"\xff\x00"), (b"", 127))
+        self.assertEqual(sleb128(b"\x81\x7f"), (b"", -127))
+        self.assertEqual(sleb128(b"\xc0\xbb\x78"), (b"", -123456))
+
+    def test_varint(self):
+        self.assertEqual(varint(b"\x96\x01"), (b"", 150))
+        self.assertEqual(varint(b"\xff" * 9 + b"\x01"), (b"", (1 << 64) - 1))
+        # negative int64 fields are 10 bytes long, with bits past 64 dropped
+        self.assertEqual(varint(b"\xff" * 9 + b"\x7f"), (b"", (1 << 64) - 1))
+
+    def test_varint_too_wide(self):
+        data = b"\x80" * 10 + b"\x01"
+        with assert_error(self, Error(data, ErrorKind.VARINT)):
+            varint(data)
+
+    def test_varint_eof(self):
+        with assert_error(self, Error(b"\x96", ErrorKind.EOF)):
+            varint(b"\x96")
+        with assert_error(self, Error(b"", ErrorKind.EOF)):
+            uleb128(b"")
+
+    def test_zigzag_varint(self):
+        values = [zigzag_varint(bytes([byte]))[1] for byte in range(5)]
+        self.assertEqual(values, [0, -1, 1, -2, 2])
+        self.assertEqual(zigzag_varint(b"\xfe\xff\xff\xff\x0f"), (b"", 2147483647))
+        self.assertEqual(zigzag_varint(b"\xff\xff\xff\xff\x0f"), (b"", -2147483648))
+
+    def test_varint_cursor(self):
+        data = Cursor(memoryview(b"\x03\x96\x01\x02"))
+        (remaining, values) = many0(varint)(data)
+        self.assertEqual((remaining.position, values), (4, [3, 150, 2]))
+
+    def test_varint_byte_values(self):
+        self.assertEqual(varint([0x96, 0x01, 0x05]), ([0x05], 150))
+
+
+class TestRecords(unittest.TestCase):
+    DATA = b"".join(struct.pack("<IHh", index, index * 2, -index) for index in range(4))
+
+    def test_records_all(self):
+        (remaining, values) = records("<IHh")(self.DATA + b"!")
+        self.assertEqual(remaining, b"!")
+        self.assertEqual(values, [(index, index * 2, -index) for index in range(4)])
+
+    def test_records_count(self):
+        (remaining, values) = records("<IHh", 3)(Cursor(self.DATA))
+        (_, expected) = count(unpack("<IHh"), 3)(self.DATA)
+        self.assertEqual((remaining.position, values), (24, expected))
+
+    def test_records_single_field(self):
+        self.assertEqual(records(">H")(b"\x00\x01\x00\x02\x03"), (b"\x03", [1, 2]))
+
+    def test_records_none(self):
+        self.assertEqual(records("<I")(b"abc"), (b"abc", []))
+        self.assertEqual(records("<I", 0)(b""), (b"", []))
+
+    def test_records_eof(self):
+        with assert_error(self, Error(self.DATA, ErrorKind.EOF)):
+            records("<IHh", 5)(self.DATA)
+
+    def test_records_buffers(self):
+        data = bytearray(self.DATA)
+        (remaining, values) = records("<IHh", 2)(Cursor(memoryview(data), 8))
+        self.assertEqual((remaining.position, values), (24, [(1, 2, -1), (2, 4, -2)]))
+        self.assertEqual(records("<H")(list(self.DATA[:5])), ([0], [0, 0]))
+
+    def test_records_empty_layout(self):
+        with self.assertRaises(ValueError):
+            records("")
+
+    def test_records_pickle(self):
+        parser = pickle.loads(pickle.dumps(records("<IHh", 1)))
+        self.assertEqual(parser(self.DATA)[1], [(0, 0, 0)])
+
+
+@unittest.skipIf(importlib.util.find_spec("numpy") is None, "requires NumPy")
+class TestRecordsNumpy(unittest.TestCase):
+    DTYPE = [("time", "<u4"), ("size", "<u2"), ("delta", "<i2")]
+
+    def test_records_dtype(self):
+        (remaining, array) = records(self.DTYPE)(TestRecords.DATA + b"!")
+        self.assertEqual(remaining, b"!")
+        self.assertEqual(array["time"].tolist(), [0, 1, 2, 3])
+        self.assertEqual(array["delta"].tolist(), [0, -1, -2, -3])
+
+    def test_records_dtype_count(self):
+        data = Cursor(memoryview(TestRecords.DATA), 8)
+        (remaining, array) = records(self.DTYPE, 2)(data)
+        self.assertEqual((remaining.position, array["size"].tolist()), (24, [2, 4]))
+
+    def test_records_dtype_eof(self):
+        with assert_error(self, Error(b"", ErrorKind.EOF)):
+            records(self.DTYPE, 1)(b"")
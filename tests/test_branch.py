@@ -2,9 +2,14 @@
 Test cases for the `branch` module.
 """
 
+import string
 import unittest
 from tests import assert_error
-from chew.string import alpha1, digit1
+from chew.combine import optional
+from chew.cursor import Cursor
+from chew.generic import tag
+from chew.sequence import preceded
+from chew.string import alpha1, alphanum1, char, digit1, one_of
 from chew.error import Error, ErrorKind
 from chew.branch import alt
 
@@ -19,3 +24,53 @@ class TestBranch(unittest.TestCase):
     def test_alt_both_fail(self):
         with assert_error(self, Error(" ", ErrorKind.DIGIT)):
             alt((alpha1, digit1))(" ")
+
+
+class TestDispatch(unittest.TestCase):
+    def test_alt_keywords(self):
+        keywords = alt([tag("select"), tag("set"), tag("show"), tag("insert")])
+        self.assertEqual(keywords("set x"), (" x", "set"))
+        self.assertEqual(keywords("insert"), ("", "insert"))
+
+    def test_alt_ordered_choice(self):
+        self.assertEqual(alt([tag("ab"), tag("a")])("ac"), ("c", "a"))
+        self.assertEqual(alt([tag("a"), tag("ab")])("ab"), ("b", "a"))
+
+    def test_alt_unknown_first_in_order(self):
+        parser = alt([char("x"), alphanum1, char("y")])
+        self.assertEqual(parser("yz"), ("", "yz"))
+
+    def test_alt_nullable_first_in_order(self):
+        parser = alt([char("x"), optional(digit1), char("y")])
+        self.assertEqual(parser("y"), ("y", None))
+
+    def test_alt_error_of_last(self):
+        with assert_error(self, Error("x!", ErrorKind.TAG)):
+            alt([digit1, one_of("yz"), tag("a")])("x!")
+
+        with assert_error(self, Error("x", ErrorKind.DIGIT)):
+            alt([tag("a"), tag("b"), digit1])("x")
+
+    def test_alt_empty_input(self):
+        with assert_error(self, Error("", ErrorKind.CHAR)):
+            alt([tag("a"), char("b")])("")
+
+    def test_alt_bytes(self):
+        methods = alt([tag(b"GET"), tag(b"PUT"), tag(b"POST")])
+        self.assertEqual(methods(b"POST /"), (b" /", b"POST"))
+
+    def test_alt_cursor(self):
+        (remaining, value) = alt([tag("a"), tag("b")])(Cursor("xb", 1))
+        self.assertEqual((remaining, value), ("", "b"))
+
+    def test_alt_unhashable_elements(self):
+        parser = alt([tag([1]), tag([[2]])])
+        self.assertEqual(parser([[2], 3]), ([3], [[2]]))
+
+    def test_alt_first(self):
+        self.assertEqual(digit1.first(), frozenset(string.digits))
+        self.assertEqual(alt([tag("ab"), char("c")]).first(), frozenset("ac"))
+        self.assertEqual(preceded(one_of("+-"), digit1).first(), frozenset("+-"))
+        self.assertEqual(alpha1.first(), frozenset(string.ascii_letters))
+        self.assertIsNone(alt([tag("a"), alphanum1]).first())
+        self.assertIsNone(optional(tag("a")).first())
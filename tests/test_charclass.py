@@ -0,0 +1,96 @@
+"""
+Test cases for the `charclass` module.
+"""
+import pickle
+import string as stdstring
+import unittest
+from chew.charclass import CharClass
+from chew.cursor import Cursor
+from chew.generic import is_a, is_not, take_till, take_while
+from chew.string import digit1, none_of, one_of, satisfy
+
+
+class TestCharClass(unittest.TestCase):
+    def test_contains(self):
+        digits = CharClass(stdstring.digits)
+        self.assertIn("7", digits)
+        self.assertNotIn("a", digits)
+        self.assertNotIn("12", digits)
+
+    def test_negate(self):
+        not_digits = ~CharClass(stdstring.digits)
+        self.assertIn("a", not_digits)
+        self.assertNotIn("7", not_digits)
+        self.assertEqual(~not_digits, CharClass(stdstring.digits))
+
+    def test_range(self):
+        self.assertEqual(CharClass.range("a", "f"), CharClass("abcdef"))
+        self.assertEqual(CharClass.range(0x30, 0x39), CharClass(b"0123456789"))
+
+    def test_union(self):
+        hexdigits = CharClass(stdstring.digits) | CharClass.range("a", "f")
+        self.assertEqual(hexdigits, CharClass("0123456789abcdef"))
+        self.assertEqual(CharClass("ab") | ~CharClass("bc"), ~CharClass("c"))
+        self.assertEqual(~CharClass("ab") | ~CharClass("bc"), ~CharClass("b"))
+
+    def test_run(self):
+        digits = CharClass(stdstring.digits)
+        self.assertEqual(digits.run("123abc"), 3)
+        self.assertEqual(digits.run(""), 0)
+        self.assertEqual((~digits).run("abc123"), 3)
+        self.assertEqual(digits.run(Cursor("ab12c", 2)), 2)
+
+    def test_run_bytes(self):
+        digits = CharClass(b"0123456789")
+        self.assertEqual(digits.run(b"123abc"), 3)
+        self.assertEqual(digits.run(bytearray(b"12")), 2)
+        self.assertEqual(digits.run(memoryview(b"1a")), 1)
+        self.assertEqual(digits.run(Cursor(b"a1", 1)), 1)
+
+    def test_run_sequence(self):
+        self.assertEqual(CharClass([1, 2]).run([1, 2, 1, 3, 1]), 3)
+        self.assertEqual(CharClass("ab").run(["a", "b", "c"]), 2)
+
+    def test_run_special_characters(self):
+        self.assertEqual(CharClass("-]^\\").run("^-]\\x"), 4)
+        self.assertEqual(CharClass(b"-]^\\").run(b"^-]\\x"), 4)
+
+    def test_run_empty(self):
+        self.assertEqual(CharClass().run("abc"), 0)
+        self.assertEqual((~CharClass()).run("a\nc"), 3)
+
+    def test_pickle(self):
+        spaces = ~CharClass(" \t")
+        self.assertEqual(pickle.loads(pickle.dumps(spaces)), spaces)
+
+    def test_repr(self):
+        self.assertEqual(repr(~CharClass("ba")), "CharClass('ab', negated=True)")
+
+
+class TestCharClassParsers(unittest.TestCase):
+    def test_is_a(self):
+        self.assertEqual(is_a(CharClass.range("0", "9"))("12ab"), ("ab", "12"))
+
+    def test_is_a_unhashable_items(self):
+        self.assertEqual(is_a([[1], [2]])([[1], [2], [3]]), ([[3]], [[1], [2]]))
+
+    def test_is_not(self):
+        self.assertEqual(is_not(CharClass(";,"))("ab;c"), (";c", "ab"))
+
+    def test_is_a_bytes(self):
+        self.assertEqual(is_a(b"0123456789")(b"12ab"), (b"ab", b"12"))
+
+    def test_take_while(self):
+        self.assertEqual(take_while(CharClass("ab"))("abc"), ("c", "ab"))
+        self.assertEqual(take_till(CharClass("c"))("abc"), ("c", "ab"))
+
+    def test_one_of(self):
+        self.assertEqual(one_of(CharClass.range("a", "c"))("bd"), ("d", "b"))
+        self.assertEqual(none_of(CharClass.range("a", "c"))("db"), ("b", "d"))
+
+    def test_satisfy(self):
+        self.assertEqual(satisfy(CharClass("xyz"))("yes"), ("es", "y"))
+
+    def test_digit1_cursor(self):
+        (remaining, value) = digit1(Cursor("a123b", 1))
+        self.assertEqual((remaining, value), ("b", "123"))
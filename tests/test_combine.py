@@ -147,9 +147,22 @@ class TestCombine(unittest.TestCase):
         with assert_error(self, Error(";", ErrorKind.CHAR)):
             recognize(separated_pair(alpha1, char(","), alpha1))("abcd;")
 
+    def test_recognize_memoryview(self):
+        data = b"ab,cd;"
+        (remaining, value) = recognize(separated_pair(take(2), tag(b","), take(2)))(
+            memoryview(data)
+        )
+        self.assertEqual((value.obj, bytes(value)), (data, b"ab,cd"))
+        self.assertEqual((remaining.obj, bytes(remaining)), (data, b";"))
+
     def test_rest(self):
         self.assertEqual(rest("abc"), ("", "abc"))
 
+    def test_rest_memoryview(self):
+        data = bytearray(b"abc")
+        (_, value) = rest(memoryview(data)[1:])
+        self.assertEqual((value.obj, bytes(value)), (data, b"bc"))
+
     def test_rest_on_exhausted(self):
         self.assertEqual(rest(""), ("", ""))
 
@@ -185,3 +198,13 @@ class TestCombine(unittest.TestCase):
     def test_verify_parser_fail(self):
         with assert_error(self, Error("123abcd;", ErrorKind.ALPHA)):
             verify(alpha1, lambda v: len(v) == 4)("123abcd;")
+
+    def test_map_parser_children(self):
+        parser = map_parser(take(4), alpha1)
+        self.assertEqual(parser.children, (parser.child, alpha1))
+
+    def test_eof_node(self):
+        self.assertEqual(repr(eof), "Eof()")
+
+    def test_optional_node(self):
+        self.assertIsInstance(optional(alpha1), Opt)
@@ -0,0 +1,95 @@
+"""
+Test cases for the `cursor` module.
+"""
+import unittest
+from tests import assert_error
+from chew.cursor import Cursor
+from chew.error import Error, ErrorKind
+from chew.generic import tag, take, take_until, take_until_any, take_while
+from chew.string import alpha1, digit1, char
+from chew.branch import alt
+from chew.combine import recognize, rest
+from chew.repeat import many0, separated_list0
+from chew.sequence import delimited, separated_pair
+
+
+class TestCursor(unittest.TestCase):
+    def test_len(self):
+        self.assertEqual(len(Cursor("abcdef", 2)), 4)
+
+    def test_index(self):
+        cursor = Cursor("abcdef", 2)
+        self.assertEqual((cursor[0], cursor[-1]), ("c", "f"))
+
+    def test_index_out_of_range(self):
+        with self.assertRaises(IndexError):
+            Cursor("abc", 3)[0]  # pylint: disable=expression-not-assigned
+
+    def test_open_slice_advances(self):
+        cursor = Cursor("abcdef")[2:]
+        self.assertIsInstance(cursor, Cursor)
+        self.assertEqual(cursor.position, 2)
+
+    def test_bounded_slice_materializes(self):
+        self.assertEqual(Cursor("abcdef", 1)[:3], "bcd")
+
+    def test_nested_cursor(self):
+        cursor = Cursor(Cursor("abcdef", 2), 1)
+        self.assertEqual((cursor.position, cursor), (3, "def"))
+
+    def test_bytes(self):
+        self.assertEqual(Cursor(b"abc", 1)[0], ord("b"))
+
+    def test_iter(self):
+        self.assertEqual(list(Cursor("abc", 1)), ["b", "c"])
+
+    def test_equality(self):
+        self.assertEqual(Cursor("xabc", 1), Cursor("abc"))
+
+    def test_take(self):
+        (remaining, value) = take(3)(Cursor("abcdef"))
+        self.assertEqual((remaining.position, value), (3, "abc"))
+
+    def test_tag_fail(self):
+        with assert_error(self, Error("def", ErrorKind.TAG)):
+            tag("abc")(Cursor("abcdef", 3))
+
+    def test_take_while(self):
+        self.assertEqual(take_while(str.isalpha)(Cursor("ab12")), ("12", "ab"))
+
+    def test_take_while_on_exhausted(self):
+        self.assertEqual(take_while(str.isalpha)(Cursor("ab", 2)), ("", ""))
+
+    def test_take_until(self):
+        self.assertEqual(take_until(";")(Cursor("abc;def")), (";def", "abc"))
+
+    def test_take_until_after_position(self):
+        self.assertEqual(take_until(";")(Cursor("a;bc;d", 2)), (";d", "bc"))
+
+    def test_take_until_any(self):
+        parser = take_until_any(["\n", ";"])
+        self.assertEqual(parser(Cursor("a;bc\nd", 2)), ("\nd", "bc"))
+
+    def test_many0(self):
+        (remaining, values) = many0(alt([alpha1, digit1]))(Cursor("ab12cd;"))
+        self.assertEqual((remaining.position, values), (6, ["ab", "12", "cd"]))
+
+    def test_separated_list0(self):
+        parser = separated_list0(char(","), digit1)
+        self.assertEqual(parser(Cursor("1,22,333;")), (";", ["1", "22", "333"]))
+
+    def test_delimited(self):
+        parser = delimited(char("("), alpha1, char(")"))
+        self.assertEqual(parser(Cursor("(abc)def")), ("def", "abc"))
+
+    def test_recognize(self):
+        parser = recognize(separated_pair(alpha1, char(","), alpha1))
+        self.assertEqual(parser(Cursor("abcd,efgh;")), (";", "abcd,efgh"))
+
+    def test_rest(self):
+        self.assertEqual(rest(Cursor("abcdef", 4)), ("", "ef"))
+
+    def test_rest_on_exhausted(self):
+        (_, value) = rest(Cursor("abc", 3))
+        self.assertEqual(value, "")
+        self.assertNotIsInstance(value, Cursor)
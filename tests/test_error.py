@@ -2,15 +2,66 @@
 Test Cases for the `error` module.
 """
 
+import pickle
 import unittest
 from tests import assert_error
+from chew.cursor import Cursor
 from chew.error import *
+from chew.generic import tag
 
 
 class TestError(unittest.TestCase):
     def test_error_int_conversion(self):
         self.assertEqual(Error("", ErrorKind.TAG).as_int(), ErrorKind.TAG.value)
 
+    def test_error_on_cursor(self):
+        error = Error(Cursor("ab\ncd\nef", 7), ErrorKind.TAG)
+        self.assertEqual((error.offset, error.line, error.column), (7, 2, 1))
+
+    def test_error_on_cursor_remaining(self):
+        error = Error(Cursor("abcdef", 2), ErrorKind.TAG)
+        self.assertEqual(error.remaining, "cdef")
+        self.assertIsInstance(error.remaining, Cursor)
+
+    def test_error_on_plain_input(self):
+        error = Error("abc", ErrorKind.TAG)
+        self.assertEqual(error.remaining, "abc")
+        self.assertEqual((error.offset, error.line, error.column), (None, None, None))
+
+    def test_error_on_bytes_cursor(self):
+        error = Error(Cursor(b"a\nbcd", 4), ErrorKind.TAG)
+        self.assertEqual((error.line, error.column), (1, 2))
+
+    def test_error_on_list_cursor(self):
+        error = Error(Cursor(["a", "\n", "b"], 3), ErrorKind.TAG)
+        self.assertEqual((error.line, error.column), (1, 1))
+
+    def test_error_at(self):
+        error = Error.at("abcdef", 3, ErrorKind.EOF)
+        self.assertEqual(error, Error(Cursor("abcdef", 3), ErrorKind.EOF))
+
+    def test_error_map_kind_keeps_offset(self):
+        error = Error(Cursor("abcdef", 3), ErrorKind.EOF).map_kind(ErrorKind.TAG)
+        self.assertEqual((error.offset, error.kind), (3, ErrorKind.TAG))
+
+    def test_error_map_kind_keeps_subclass(self):
+        class Custom(Error):
+            pass
+
+        error = Custom("abc", ErrorKind.EOF).map_kind(ErrorKind.TAG)
+        self.assertEqual((type(error), error.offset), (Custom, None))
+
+    def test_error_does_not_hold_args(self):
+        self.assertEqual(Error("abc", ErrorKind.TAG).args, ())
+
+    def test_error_str(self):
+        error = Error("abc", ErrorKind.TAG)
+        self.assertEqual(str(error), "('abc', <ErrorKind.TAG: 0>)")
+
+    def test_error_pickle(self):
+        error = Error(Cursor("abcdef", 3), ErrorKind.TAG)
+        self.assertEqual(pickle.loads(pickle.dumps(error)), error)
+
     def test_map_exception(self):
         with assert_error(self, Error("", ErrorKind.EOF)):
             with map_exception(ValueError, "", ErrorKind.EOF):
@@ -29,3 +80,52 @@ class TestError(unittest.TestCase):
         with assert_error(self, Error("", ErrorKind.ALPHA)):
             with ignore_kind(ErrorKind.EOF):
                 raise Error("", ErrorKind.ALPHA)
+
+    def test_raising(self):
+        parser = raising(lambda sequence: Error(sequence, ErrorKind.FAIL))
+        with assert_error(self, Error("abc", ErrorKind.FAIL)):
+            parser("abc")
+
+    def test_raising_on_success(self):
+        parser = raising(lambda sequence: (sequence[1:], sequence[0]))
+        self.assertEqual(parser("abc"), ("bc", "a"))
+
+    def test_returning(self):
+        parser = raising(lambda sequence: Error(sequence, ErrorKind.FAIL))
+        self.assertEqual(returning(parser)("abc"), Error("abc", ErrorKind.FAIL))
+
+    def test_returning_on_plain_function(self):
+        def parser(sequence):
+            raise Error(sequence, ErrorKind.TAG)
+
+        self.assertEqual(returning(parser)("abc"), Error("abc", ErrorKind.TAG))
+
+    def test_returning_on_object_with_parse(self):
+        class Grammar:
+            def parse(self, text):  # pragma: no cover
+                return text
+
+            def __call__(self, sequence):
+                return (sequence[1:], sequence[0])
+
+        self.assertEqual(returning(Grammar())("abc"), ("bc", "a"))
+
+    def test_with_kind(self):
+        self.assertEqual(with_kind(tag("ab"), ErrorKind.CHAR)("abc"), ("c", "ab"))
+
+    def test_with_kind_on_failure(self):
+        with assert_error(self, Error("xyz", ErrorKind.CHAR)):
+            with_kind(tag("ab"), ErrorKind.CHAR)("xyz")
+
+    def test_ignoring_kind(self):
+        parser = ignoring_kind(tag("ab"), ErrorKind.TAG, "")
+        self.assertEqual(parser("xyz"), ("xyz", ""))
+
+    def test_ignoring_kind_on_success(self):
+        parser = ignoring_kind(tag("ab"), ErrorKind.TAG, "")
+        self.assertEqual(parser("abc"), ("c", "ab"))
+
+    def test_ignoring_kind_no_match(self):
+        parser = ignoring_kind(with_kind(tag("ab"), ErrorKind.CHAR), ErrorKind.TAG, "")
+        with assert_error(self, Error("xyz", ErrorKind.CHAR)):
+            parser("xyz")
@@ -1,10 +1,14 @@
 """
 Test cases for the `generic` module.
 """
+import pickle
 import unittest
 import string as stdstring
 from tests import assert_error
-from chew.error import Error, ErrorKind
+from chew.branch import alt
+from chew.cursor import Cursor
+from chew.charclass import CharClass
+from chew.error import Error, ErrorKind, IgnoringKind
 from chew.generic import *
 from chew.string import is_alphabetic
 
@@ -75,6 +79,39 @@ class TestGeneric(unittest.TestCase):
     def test_take_until_on_one_match(self):
         self.assertEqual(take_until("eof")("1eof2eof"), ("eof2eof", "1"))
 
+    def test_take_until_on_bytes(self):
+        self.assertEqual(take_until(b"\r\n")(b"abc\r\n"), (b"\r\n", b"abc"))
+
+    def test_take_until_on_list(self):
+        self.assertEqual(take_until([3, 4])([1, 3, 3, 4]), ([3, 4], [1, 3]))
+
+    def test_take_until_at_start(self):
+        self.assertEqual(take_until("eof")("eof1"), ("eof1", ""))
+
+    def test_take_until_any(self):
+        parser = take_until_any(["\r\n", "\n", ";"])
+        self.assertEqual(parser("abc;def\n"), (";def\n", "abc"))
+
+    def test_take_until_any_earliest(self):
+        parser = take_until_any(["\r\n", "\n", ";"])
+        self.assertEqual(parser("abc\r\ndef;"), ("\r\ndef;", "abc"))
+
+    def test_take_until_any_on_bytes(self):
+        parser = take_until_any([b"\r\n", b";"])
+        self.assertEqual(parser(b"ab\r\n;"), (b"\r\n;", b"ab"))
+
+    def test_take_until_any_on_list(self):
+        parser = take_until_any([[2, 3], [4]])
+        self.assertEqual(parser([1, 2, 4, 2, 3]), ([4, 2, 3], [1, 2]))
+
+    def test_take_until_any_no_match(self):
+        with assert_error(self, Error("hello", ErrorKind.TAKE_UNTIL)):
+            take_until_any([";", "\n"])("hello")
+
+    def test_take_until_any_on_exhausted(self):
+        with assert_error(self, Error("", ErrorKind.TAKE_UNTIL)):
+            take_until_any([";", "\n"])("")
+
     def test_take_until1(self):
         self.assertEqual(take_until1("eof")("hello, worldeof"), ("eof", "hello, world"))
 
@@ -108,6 +145,13 @@ class TestGeneric(unittest.TestCase):
     def test_take_while_on_exhausted(self):
         self.assertEqual(take_while(is_alphabetic)(""), ("", ""))
 
+    def test_take_while_long_run(self):
+        data = "a" * 100_000 + "1"
+        self.assertEqual(take_while(is_alphabetic)(data), ("1", data[:-1]))
+
+    def test_take_while_on_bytes(self):
+        self.assertEqual(take_while(lambda b: b == 0x61)(b"aab"), (b"b", b"aa"))
+
     def test_take_while1(self):
         self.assertEqual(
             take_while1(is_alphabetic)("latin123"),
@@ -144,6 +188,10 @@ class TestGeneric(unittest.TestCase):
         with assert_error(self, Error("ed", ErrorKind.TAKE_WHILE_BOUNDED)):
             short_alpha("ed")
 
+    def test_take_while_bounded_on_short_input(self):
+        short_alpha = take_while_bounded(1, 6, is_alphabetic)
+        self.assertEqual(short_alpha("ab"), ("", "ab"))
+
     def test_take_while_bounded_no_match(self):
         short_alpha = take_while_bounded(3, 6, is_alphabetic)
         with assert_error(self, Error("12345", ErrorKind.TAKE_WHILE_BOUNDED)):
@@ -182,3 +230,149 @@ class TestGeneric(unittest.TestCase):
     def test_is_not_on_exhausted(self):
         with assert_error(self, Error("", ErrorKind.IS_NOT)):
             is_not(" \t\r\n")("")
+
+    def test_tag_node(self):
+        parser = tag("abc")
+        self.assertIsInstance(parser, Tag)
+        self.assertEqual((parser.pattern, parser.params), ("abc", {"pattern": "abc"}))
+
+    def test_node_repr(self):
+        parser = take_while_bounded(1, 3, str.isdigit)
+        self.assertEqual(repr(parser), f"TakeWhileBounded(1, 3, {str.isdigit!r})")
+
+    def test_node_replace(self):
+        parser = tag("abc").replace(pattern="def")
+        self.assertEqual(parser("defg"), ("g", "def"))
+
+    def test_node_pickle(self):
+        parser = pickle.loads(pickle.dumps(is_a(stdstring.hexdigits)))
+        self.assertEqual(parser("BEEF;"), (";", "BEEF"))
+
+    def test_node_match(self):
+        # pylint: disable=match-class-positional-attributes
+        match take_while1(str.isdigit):
+            case MinOne(TakeWhile(cond), ErrorKind.TAKE_WHILE):
+                self.assertIs(cond, str.isdigit)
+            case _:  # pragma: no cover
+                self.fail("take_while1 is not a MinOne over a TakeWhile")
+
+    def test_node_parse_returns_error(self):
+        self.assertEqual(tag("abc").parse("abd"), Error("abd", ErrorKind.TAG))
+
+    def test_min_one_class_run(self):
+        parser = MinOne(take_till(CharClass(";")), ErrorKind.TAKE_TILL)
+        self.assertEqual(parser(Cursor("ab;c")), (";c", "ab"))
+        with assert_error(self, Error(";c", ErrorKind.TAKE_TILL)):
+            parser(";c")
+
+    def test_min_one_ignoring_kind_value(self):
+        digits = IgnoringKind(IsA("0123456789"), ErrorKind.IS_A, "0")
+        self.assertEqual(MinOne(digits, ErrorKind.DIGIT)("x"), ("x", "0"))
+
+
+class TestBuffers(unittest.TestCase):
+    def assert_view(self, value, expected, underlying):
+        self.assertIsInstance(value, memoryview)
+        self.assertIs(value.obj, underlying)
+        self.assertEqual(bytes(value), expected)
+
+    def test_take_memoryview(self):
+        data = b"abcd"
+        (remaining, value) = take(2)(memoryview(data))
+        self.assert_view(value, b"ab", data)
+        self.assert_view(remaining, b"cd", data)
+
+    def test_take_while_memoryview(self):
+        data = bytearray(b"abc;d")
+        (remaining, value) = take_while(lambda byte: byte != ord(";"))(memoryview(data))
+        self.assert_view(value, b"abc", data)
+        self.assert_view(remaining, b";d", data)
+
+    def test_take_till_cursor_memoryview(self):
+        data = b"ab;c"
+        (remaining, value) = take_till(CharClass(b";"))(Cursor(memoryview(data), 1))
+        self.assert_view(value, b"b", data)
+        self.assertEqual((remaining.position, remaining), (2, b";c"))
+
+    def test_take_until_memoryview(self):
+        data = b"key: value\r\n"
+        (remaining, value) = take_until(b"\r\n")(Cursor(memoryview(data)))
+        self.assert_view(value, b"key: value", data)
+        self.assertEqual(remaining, b"\r\n")
+
+    def test_tag_buffers(self):
+        for data in [b"GET /", bytearray(b"GET /"), memoryview(b"GET /")]:
+            for pattern in [b"GET", bytearray(b"GET"), memoryview(b"GET")]:
+                (remaining, value) = tag(pattern)(data)
+                self.assertEqual((remaining, value), (b" /", b"GET"))
+                self.assertIs(value, pattern)
+
+    def test_tag_buffers_mismatch(self):
+        for data in [b"GEX", bytearray(b"GE"), Cursor(memoryview(b"xGET"), 2)]:
+            with assert_error(self, Error(data, ErrorKind.TAG)):
+                tag(b"GET")(data)
+
+    def test_tag_elements(self):
+        self.assertEqual(tag([1, 2])([1, 2, 3]), ([3], [1, 2]))
+        self.assertEqual(tag(b"ab")([97, 98]), ([], b"ab"))
+        with assert_error(self, Error("", ErrorKind.TAG)):
+            tag("")("")
+
+    def test_is_a_memoryview(self):
+        data = b"aabx"
+        (remaining, value) = is_a(b"ab")(memoryview(data))
+        self.assert_view(value, b"aab", data)
+        self.assert_view(remaining, b"x", data)
+
+
+class TestTags(unittest.TestCase):
+    KEYWORDS = ["in", "insert", "int", "into", "is", "select", "set", "sel"]
+
+    def test_tags_longest(self):
+        keywords = tags(self.KEYWORDS)
+        self.assertEqual(keywords("insert x"), (" x", "insert"))
+        self.assertEqual(keywords("inside"), ("side", "in"))
+        self.assertEqual(keywords("selects"), ("s", "select"))
+
+    def test_tags_ordered(self):
+        keywords = tags(self.KEYWORDS, longest=False)
+        ordered = alt([tag(keyword) for keyword in self.KEYWORDS])
+        for data in ["insert x", "into", "selects", "setup", "is"]:
+            self.assertEqual(keywords(data), ordered(data))
+
+    def test_tags_fail(self):
+        with assert_error(self, Error("update", ErrorKind.TAG)):
+            tags(self.KEYWORDS)("update")
+
+    def test_tags_on_exhausted(self):
+        with assert_error(self, Error("se", ErrorKind.TAG)):
+            tags(self.KEYWORDS)("se")
+
+        with assert_error(self, Error("", ErrorKind.TAG)):
+            tags(self.KEYWORDS)("")
+
+    def test_tags_empty_keyword(self):
+        self.assertEqual(tags(["", "ab"])("abc"), ("c", "ab"))
+        self.assertEqual(tags(["", "ab"])("xyz"), ("xyz", ""))
+
+    def test_tags_case_insensitive(self):
+        headers = tags(["Content-Type", "Content-Length", "Host"], True)
+        self.assertEqual(headers("HOST: a"), (": a", "HOST"))
+        self.assertEqual(headers("content-length: 1"), (": 1", "content-length"))
+
+    def test_tags_bytes(self):
+        methods = tags([b"GET", b"POST", b"PUT"])
+        self.assertEqual(methods(b"PUT /"), (b" /", b"PUT"))
+        self.assertEqual(methods(bytearray(b"GET /")), (bytearray(b" /"), b"GET"))
+        self.assertEqual(tags([b"get"], True)(b"GeT /"), (b" /", b"GeT"))
+
+    def test_tags_sequence(self):
+        self.assertEqual(tags([[1], [1, 2]])([1, 2, 3]), ([3], [1, 2]))
+
+    def test_tags_cursor(self):
+        (remaining, value) = tags(["ab", "abc"])(Cursor("xabcd", 1))
+        self.assertEqual((remaining, value), ("d", "abc"))
+
+    def test_tags_first(self):
+        self.assertEqual(tags(["ab", "cd"]).first(), frozenset("ac"))
+        self.assertIsNone(tags(["ab", "cd"], True).first())
@@ -0,0 +1,204 @@
+"""
+Test cases for the `memo` module.
+"""
+import pickle
+import unittest
+from tests import assert_error
+from chew.branch import alt
+from chew.cursor import Cursor
+from chew.error import Error, ErrorKind
+from chew.memo import Memo, MemoTable, left_recursive, memo, memoize
+from chew.repeat import many0
+from chew.sequence import multiple, pair, separated_pair
+from chew.string import alpha1, char, digit1
+
+
+class TestMemo(unittest.TestCase):
+    def setUp(self):
+        self.calls = 0
+        self.rule = self.nested
+
+    def nested(self, sequence):
+        """
+        Parses `x` nested in parentheses each followed by `a` or `b`, which
+        takes exponential time without memoization.
+        """
+        self.calls += 1
+        return alt(
+            [
+                multiple([char("("), self.parse, char(")"), char("a")]),
+                multiple([char("("), self.parse, char(")"), char("b")]),
+                char("x"),
+            ]
+        )(sequence)
+
+    def parse(self, sequence):
+        return self.rule(sequence)
+
+    def test_memo_linear(self):
+        data = "(" * 12 + "x" + ")b" * 12
+        expected = self.parse(data)
+        self.assertEqual(self.calls, (1 << 13) - 1)
+
+        self.calls = 0
+        self.rule = memo(self.nested)
+        self.assertEqual(self.parse(data), expected)
+        self.assertEqual(self.calls, 13)
+        self.assertEqual((self.rule.table.hits, self.rule.table.misses), (12, 13))
+
+    def test_memo_cursor(self):
+        self.rule = memo(self.nested)
+        (remaining, _) = self.parse(Cursor("((x)b)a;"))
+        self.assertEqual((remaining, self.calls), (";", 3))
+
+    def test_memo_error(self):
+        parser = memo(digit1)
+        for _ in range(2):
+            with assert_error(self, Error("a", ErrorKind.DIGIT)):
+                parser("a")
+        self.assertEqual((parser.table.hits, parser.table.misses), (1, 1))
+
+    def test_memo_distinct_inputs(self):
+        parser = memo(alpha1)
+        self.assertEqual(parser("abc"), ("", "abc"))
+        self.assertEqual(parser("xyz"), ("", "xyz"))
+        self.assertEqual(parser(Cursor("xyz")), ("", "xyz"))
+
+    def test_memo_size(self):
+        parser = memo(digit1, size=4)
+        many0(pair(parser, char(",")))("1," * 10)
+        self.assertEqual(len(parser.table), 4)
+
+    def test_memo_window(self):
+        parser = memo(digit1, window=4)
+        many0(pair(parser, char(",")))(Cursor("1," * 10))
+        self.assertLessEqual(len(parser.table), 3)
+
+    def test_memo_window_after_hit(self):
+        parser = memo(digit1, window=3)
+        data = "1," * 3
+        for position in [0, 2, 0, 4]:
+            parser(Cursor(data, position))
+        # the hit at 0 made it the most recently used, but it is still dropped
+        self.assertEqual((parser.table.hits, len(parser.table)), (1, 2))
+
+    def test_memo_clear(self):
+        parser = memo(digit1)
+        parser("1")
+        parser.table.clear()
+        self.assertEqual((len(parser.table), parser.table.misses), (0, 0))
+
+    def test_memo_pickle(self):
+        parser = memo(digit1)
+        parser("1")
+        parser = pickle.loads(pickle.dumps(parser))
+        self.assertEqual((parser("12a"), len(parser.table)), (("a", "12"), 1))
+
+    def test_memoize(self):
+        grammar = alt([pair(digit1, char("a")), pair(digit1, char("b"))])
+        memoized = memoize(grammar)
+        self.assertIsInstance(memoized, Memo)
+        self.assertEqual(memoized("12b"), grammar("12b"))
+
+        tables = {id(child.table) for child in memoized.child.children}
+        self.assertEqual(tables, {id(memoized.table)})
+
+        leaf = char("a")
+        self.assertIs(memoize(leaf), leaf)
+
+    def test_memo_table_repr(self):
+        self.assertEqual(repr(MemoTable(8, 2)), "MemoTable(8, 2)")
+
+
+class TestLeftRecursive(unittest.TestCase):
+    def setUp(self):
+        self.calls = 0
+        # the rules of a cycle, referring to each other through this list
+        self.rules = []
+
+        def expr(sequence):
+            self.calls += 1
+            return self.expr(sequence)
+
+        # expr := expr "-" digit1 | digit1
+        self.expr = left_recursive(
+            alt([separated_pair(expr, char("-"), digit1), digit1])
+        )
+
+    def test_left_recursive_associativity(self):
+        self.assertEqual(self.expr("1-2-3;"), (";", (("1", "2"), "3")))
+
+    def test_left_recursive_seed(self):
+        self.assertEqual(self.expr("12-"), ("-", "12"))
+
+    def test_left_recursive_error(self):
+        with assert_error(self, Error("x", ErrorKind.DIGIT)):
+            self.expr("x")
+
+    def test_left_recursive_no_seed(self):
+        def rule(sequence):
+            return parser(sequence)
+
+        parser = left_recursive(pair(rule, char("a")))
+        with assert_error(self, Error("aa", ErrorKind.LEFT_RECURSION)):
+            parser("aa")
+
+    def test_left_recursive_cursor(self):
+        (remaining, value) = self.expr(Cursor("x1-2", 1))
+        self.assertEqual((remaining, value), ("", ("1", "2")))
+
+    def test_left_recursive_linear(self):
+        count = 10000
+        (remaining, value) = self.expr("-".join(["1"] * count))
+        # one reference per growth, and one more once it stops growing
+        self.assertEqual((remaining, self.calls), ("", count + 1))
+        for _ in range(count - 1):
+            (value, last) = value
+            self.assertEqual(last, "1")
+        self.assertEqual(value, "1")
+
+    def test_left_recursive_memoized(self):
+        self.expr("1-2")
+        self.expr("1-2")
+        self.assertEqual(self.expr.table.hits, 1)
+
+    def test_left_recursive_indirect(self):
+        # a := b "x" | "a"; b := a "y" | "b"
+        def a(sequence):
+            return self.rules[0](sequence)
+
+        def b(sequence):
+            return self.rules[1](sequence)
+
+        self.rules = [
+            left_recursive(alt([pair(b, char("x")), char("a")])),
+            alt([pair(a, char("y")), char("b")]),
+        ]
+        self.assertEqual(a("ayx!"), ("!", (("a", "y"), "x")))
+        self.assertEqual(b("ayxy!"), ("!", (((("a", "y"), "x")), "y")))
+        self.assertEqual(a("bx"), ("", ("b", "x")))
+
+    def test_left_recursive_nested(self):
+        # both rules of the cycle grow, and share no table
+        def a(sequence):
+            return self.rules[0](sequence)
+
+        def b(sequence):
+            return self.rules[1](sequence)
+
+        self.rules = [
+            left_recursive(alt([pair(b, char("x")), char("a")])),
+            left_recursive(alt([pair(a, char("y")), char("b")])),
+        ]
+        self.assertEqual(a("ayxyx!"), ("!", (((("a", "y"), "x"), "y"), "x")))
+        self.assertEqual(b("ayxy"), ("", (((("a", "y"), "x")), "y")))
+
+    def test_left_recursive_memoize(self):
+        # memoized rules within a growing rule keep no partial outcome
+        def expr(sequence):
+            return rule(sequence)
+
+        rule = left_recursive(
+            memoize(alt([separated_pair(expr, char("+"), digit1), digit1]))
+        )
+        self.assertEqual(rule("1+2+3"), ("", (("1", "2"), "3")))
@@ -0,0 +1,94 @@
+"""
+Test cases for the `optimize` module.
+"""
+import pickle
+import unittest
+from tests import assert_error
+from chew.combine import Success, conditional, optional, success
+from chew.error import Error, ErrorKind
+from chew.generic import Tag, tag
+from chew.optimize import *
+from chew.repeat import many0
+from chew.sequence import Sequence, delimited, pair, preceded, separated_pair
+from chew.sequence import terminated
+from chew.string import alpha1, char, digit1
+
+
+class TestOptimize(unittest.TestCase):
+    def test_flatten_nested(self):
+        parser = optimize(pair(pair(alpha1, digit1), pair(alpha1, digit1)))
+        self.assertEqual(parser.parsers, (alpha1, digit1, alpha1, digit1))
+        self.assertEqual(parser("ab12cd34;"), (";", (("ab", "12"), ("cd", "34"))))
+
+    def test_flatten_projection(self):
+        grammar = preceded(alpha1, terminated(digit1, alpha1))
+        parser = optimize(grammar)
+        self.assertEqual((len(parser.parsers), parser.keep), (3, 1))
+        self.assertEqual(parser("ab12cd;"), grammar("ab12cd;"))
+
+    def test_flatten_error(self):
+        grammar = separated_pair(alpha1, preceded(char(" "), char("=")), digit1)
+        with assert_error(self, Error("x", ErrorKind.DIGIT)):
+            optimize(grammar)("a =x")
+
+    def test_fuse_literals(self):
+        parser = optimize(delimited(pair(tag("<"), char("!")), alpha1, tag(">")))
+        (fused, _, _) = parser.parsers
+        self.assertIsInstance(fused, FusedTag)
+        self.assertEqual((fused.pattern, parser("<!a>b")), ("<!", ("b", "a")))
+
+    def test_fuse_kept_literals(self):
+        parser = optimize(pair(tag("ab"), char("c")))
+        self.assertIsInstance(parser.parsers[0], FusedTag)
+        self.assertEqual(parser("abcd"), ("d", ("ab", "c")))
+
+    def test_fused_literals_error(self):
+        parser = optimize(preceded(pair(tag("ab"), char("c")), alpha1))
+        with assert_error(self, Error("dxy", ErrorKind.CHAR)):
+            parser("abdxy")
+
+    def test_fuse_bytes(self):
+        parser = optimize(preceded(tag(b"\x00"), tag(b"\x01\x02")))
+        self.assertEqual(parser.parsers[0].pattern, b"\x00\x01\x02")
+        self.assertEqual(parser(b"\x00\x01\x02\x03"), (b"\x03", b"\x01\x02"))
+
+    def test_inline_success(self):
+        parser = optimize(pair(alpha1, success(1)))
+        self.assertEqual(parser.parsers, (alpha1,))
+        self.assertEqual(parser("ab;"), (";", ("ab", 1)))
+
+    def test_only_constants(self):
+        parser = optimize(pair(success(1), success(2)))
+        self.assertIsInstance(parser, Success)
+        self.assertEqual(parser("ab"), ("ab", (1, 2)))
+
+    def test_inline_conditional(self):
+        self.assertIs(optimize(conditional(True, alpha1)), alpha1)
+        self.assertEqual(optimize(conditional(False, alpha1))("ab"), ("ab", None))
+
+    def test_nested_in_other_nodes(self):
+        parser = optimize(many0(preceded(char(","), optional(digit1))))
+        self.assertEqual(parser(",1,,2;"), (";", ["1", None, "2"]))
+
+    def test_shared_nodes(self):
+        shared = preceded(char("-"), digit1)
+        parser = optimize(pair(many0(shared), optional(shared)))
+        (repeated, last) = parser.parsers
+        self.assertIs(repeated.child, last.child)
+
+    def test_non_nodes_kept(self):
+        def parse(sequence):
+            return (sequence[1:], sequence[0])
+
+        parser = optimize(pair(tag("a"), parse))
+        self.assertEqual(parser("abc"), ("c", ("a", "b")))
+
+    def test_pickle(self):
+        parser = pickle.loads(pickle.dumps(optimize(pair(tag("a"), char("b")))))
+        self.assertEqual(parser("abc"), ("c", ("a", "b")))
+
+    def test_untouched(self):
+        parser = tag("abc")
+        self.assertIs(optimize(parser), parser)
+        self.assertIsInstance(optimize(Sequence([parser])), Sequence)
+        self.assertIsInstance(optimize(Sequence([parser], 0)), Tag)
@@ -0,0 +1,130 @@
+"""
+Test cases for the `precedence` module.
+"""
+import operator
+import pickle
+import unittest
+from tests import assert_error
+from chew.branch import alt
+from chew.combine import map_res, noerr_value, optional
+from chew.cursor import Cursor
+from chew.error import Error, ErrorKind
+from chew.generic import tag
+from chew.optimize import optimize
+from chew.precedence import Precedence, precedence
+from chew.sequence import delimited
+from chew.string import char, digit1, space0
+
+ARITHMETIC = precedence(
+    digit1,
+    prefix_ops=[(char("-"), 5)],
+    infix_ops=[
+        (char("+"), 1, 2),
+        (char("-"), 1, 2),
+        (char("*"), 3, 4),
+        (char("/"), 3, 4),
+        (char("^"), 8, 7),
+    ],
+    postfix_ops=[(char("!"), 9), (char("?"), 3)],
+)
+
+
+class TestPrecedence(unittest.TestCase):
+    def test_precedence_atom(self):
+        self.assertEqual(ARITHMETIC("12;"), (";", "12"))
+
+    def test_precedence_left_associative(self):
+        self.assertEqual(ARITHMETIC("1-2-3"), ("", (("1", "-", "2"), "-", "3")))
+
+    def test_precedence_right_associative(self):
+        self.assertEqual(ARITHMETIC("1^2^3"), ("", ("1", "^", ("2", "^", "3"))))
+
+    def test_precedence_levels(self):
+        self.assertEqual(
+            ARITHMETIC("1+2*3-4"),
+            ("", (("1", "+", ("2", "*", "3")), "-", "4")),
+        )
+
+    def test_precedence_prefix(self):
+        self.assertEqual(ARITHMETIC("--1*2"), ("", (("-", ("-", "1")), "*", "2")))
+        self.assertEqual(ARITHMETIC("-1^2"), ("", ("-", ("1", "^", "2"))))
+
+    def test_precedence_postfix(self):
+        self.assertEqual(ARITHMETIC("-1!"), ("", ("-", ("1", "!"))))
+        self.assertEqual(ARITHMETIC("-1?"), ("", (("-", "1"), "?")))
+        self.assertEqual(ARITHMETIC("1+2?"), ("", ("1", "+", ("2", "?"))))
+        self.assertEqual(ARITHMETIC("1*2?"), ("", (("1", "*", "2"), "?")))
+
+    def test_precedence_trailing_input(self):
+        self.assertEqual(ARITHMETIC("1+2)"), (")", ("1", "+", "2")))
+
+    def test_precedence_missing_operand(self):
+        with assert_error(self, Error("", ErrorKind.DIGIT)):
+            ARITHMETIC("1+")
+
+        with assert_error(self, Error("x", ErrorKind.DIGIT)):
+            ARITHMETIC("-x")
+
+    def test_precedence_fold(self):
+        operators = {"+": operator.add, "*": operator.mul, "-": operator.sub}
+
+        def fold(*parts):
+            if len(parts) == 2:
+                return -parts[1]
+            (left, op, right) = parts
+            return operators[op](left, right)
+
+        parser = precedence(
+            map_res(digit1, int),
+            prefix_ops=[(char("-"), 5)],
+            infix_ops=[(char("+"), 1, 2), (char("-"), 1, 2), (char("*"), 3, 4)],
+            fold=fold,
+        )
+        self.assertEqual(parser("2+3*-4-1"), ("", -11))
+
+    def test_precedence_operator_values(self):
+        parser = precedence(
+            map_res(digit1, int),
+            infix_ops=[
+                (noerr_value(operator.add, tag("plus")), 1, 2),
+                (noerr_value(operator.pow, tag("pow")), 4, 3),
+            ],
+            fold=lambda left, op, right: op(left, right),
+        )
+        self.assertEqual(parser("1plus2pow3pow2"), ("", 513))
+
+    def test_precedence_zero_width_operators(self):
+        parser = precedence(
+            digit1,
+            prefix_ops=[(optional(char("-")), 5)],
+            infix_ops=[(space0, 1, 2)],
+            postfix_ops=[(optional(char("!")), 9)],
+        )
+        self.assertEqual(parser("1;"), (";", "1"))
+        self.assertEqual(parser("-1! 2"), ("", (("-", ("1", "!")), " ", "2")))
+
+    def test_precedence_cursor(self):
+        (remaining, result) = ARITHMETIC(Cursor("x1*2", 1))
+        self.assertEqual((remaining, result), ("", ("1", "*", "2")))
+
+    def test_precedence_recursive_atom(self):
+        def expression(sequence):
+            return parser(sequence)
+
+        parser = precedence(
+            alt([digit1, delimited(char("("), expression, char(")"))]),
+            infix_ops=[(char("+"), 1, 2), (char("*"), 3, 4)],
+        )
+        self.assertEqual(parser("(1+2)*3"), ("", (("1", "+", "2"), "*", "3")))
+
+    def test_precedence_first(self):
+        self.assertEqual(ARITHMETIC.first(), frozenset("-0123456789"))
+
+    def test_precedence_children(self):
+        self.assertEqual(len(ARITHMETIC.children), 9)
+        self.assertIs(optimize(ARITHMETIC), ARITHMETIC)
+
+    def test_precedence_pickle(self):
+        parser = pickle.loads(pickle.dumps(ARITHMETIC))
+        self.assertIsInstance(parser, Precedence)
+        self.assertEqual(parser("1+2*3"), ARITHMETIC("1+2*3"))
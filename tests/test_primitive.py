@@ -2,7 +2,9 @@
 Sparse test cases for the `primitives` module.
 """
 
+import mmap
 import unittest
+from chew.cursor import Cursor
 from chew.primitive import *
 
 TEST_STRING = "Hello World!\nI love Snails!\nThat is All."
@@ -18,6 +20,38 @@ class TestPrimitive(unittest.TestCase):
     def test_next_item_on_exhausted(self):
         self.assertEqual(next_item(""), None)
 
+    def test_find(self):
+        self.assertEqual(find("abcabc", "ca"), 2)
+
+    def test_find_no_match(self):
+        self.assertEqual(find("abcabc", "x"), -1)
+
+    def test_find_on_list(self):
+        self.assertEqual(find([1, 2, 1, 3], [1, 3]), 2)
+
+    def test_find_on_memoryview(self):
+        view = memoryview(b"abcabc")
+        self.assertEqual(find(view, b"ca"), 2)
+        self.assertEqual(find(Cursor(view, 3), bytearray(b"c")), 2)
+        self.assertEqual(find(view[1:], b"x"), -1)
+
+    def test_starts_with(self):
+        self.assertTrue(starts_with("abc", "ab"))
+        self.assertFalse(starts_with(Cursor("abc", 1), "ab"))
+        self.assertTrue(starts_with(Cursor(b"abc", 1), memoryview(b"bc")))
+        self.assertTrue(starts_with(bytearray(b"abc"), b"abc"))
+        self.assertFalse(starts_with(b"ab", b"abc"))
+        self.assertTrue(starts_with([1, 2, 3], (1, 2)))
+        self.assertFalse(starts_with(["a"], "ab"))
+
+    def test_starts_with_on_buffers(self):
+        self.assertTrue(starts_with(Cursor(memoryview(b"abc"), 1), b"bc"))
+        self.assertFalse(starts_with(memoryview(b"abc"), b"abcd"))
+        buffer = mmap.mmap(-1, 3)
+        buffer.write(b"abc")
+        self.assertTrue(starts_with(Cursor(buffer, 2), bytearray(b"c")))
+        self.assertFalse(starts_with(Cursor(buffer, 2), b"cd"))
+
     def test_at_line(self):
         self.assertEqual(at_line(TEST_STRING, ONE_LINES), 0)
 
@@ -0,0 +1,194 @@
+"""
+Test cases for the `reader` module.
+"""
+import asyncio
+import io
+import mmap
+import os
+import socket
+import tempfile
+import unittest
+from chew import streaming
+from chew.combine import pariter
+from chew.cursor import Cursor
+from chew.error import Error, ErrorKind, Incomplete
+from chew.generic import tag, take_until
+from chew.reader import aparse, iterparse, map_file, parse_file
+from chew.sequence import pair, terminated
+from chew.string import digit0
+
+LINE = terminated(streaming.take_until(b"\n"), streaming.tag(b"\n"))
+
+
+class CountingFile(io.BytesIO):
+    """
+    A binary file counting how many times it is read.
+    """
+
+    def __init__(self, data: bytes):
+        super().__init__(data)
+        self.reads = 0
+
+    def read(self, size=-1):
+        self.reads += 1
+        return super().read(size)
+
+
+class TestIterparse(unittest.TestCase):
+    def test_iterparse_binary(self):
+        data = io.BytesIO(b"one\ntwo\nthree\n")
+        records = list(iterparse(data, LINE, chunk_size=3))
+        self.assertEqual(records, [(0, b"one"), (4, b"two"), (8, b"three")])
+
+    def test_iterparse_text(self):
+        line = terminated(streaming.not_line_ending, streaming.line_ending)
+        data = io.StringIO("é\r\nab\nc\n")
+        records = list(iterparse(data, line, chunk_size=2))
+        self.assertEqual(records, [(0, "é"), (3, "ab"), (6, "c")])
+
+    def test_iterparse_bounded(self):
+        data = io.BytesIO(b"".join(b"%09d\n" % index for index in range(1000)))
+        records = iterparse(data, LINE, chunk_size=16)
+        largest = 0
+        for (offset, record) in records:
+            self.assertEqual(int(record), offset // 10)
+            largest = max(largest, len(records.buffer))
+        self.assertLessEqual(largest, 16 + 10)
+        self.assertEqual(records.offset, 10000)
+
+    def test_iterparse_large_record(self):
+        data = CountingFile(b"x" * 100000 + b"\n")
+        [(offset, record)] = iterparse(data, LINE, chunk_size=7)
+        self.assertEqual((offset, len(record)), (0, 100000))
+        # reads grow with the buffer, so that refilling stays linear
+        self.assertLess(data.reads, 40)
+
+    def test_iterparse_needed(self):
+        record = pair(streaming.tag(b"#"), streaming.take(1000))
+        data = CountingFile(b"#" + b"x" * 1000)
+        [(_, (_, value))] = iterparse(data, record, chunk_size=4)
+        self.assertEqual((len(value), data.reads), (1000, 3))
+
+    def test_iterparse_empty(self):
+        self.assertEqual(list(iterparse(io.BytesIO(b""), LINE)), [])
+
+    def test_iterparse_truncated(self):
+        records = iterparse(io.BytesIO(b"one\ntw"), LINE, chunk_size=4)
+        self.assertEqual(next(records), (0, b"one"))
+        with self.assertRaises(Incomplete):
+            next(records)
+        self.assertEqual(records.offset, 4)
+
+    def test_iterparse_error(self):
+        record = terminated(streaming.digit1, streaming.char(";"))
+        records = iterparse(io.StringIO("12;3x"), record)
+        self.assertEqual(next(records), (0, "12"))
+        with self.assertRaises(Error) as context:
+            next(records)
+        self.assertEqual(context.exception.kind, ErrorKind.CHAR)
+
+    def test_iterparse_no_progress(self):
+        self.assertEqual(list(iterparse(io.StringIO("x"), digit0)), [])
+
+
+class TestAparse(unittest.IsolatedAsyncioTestCase):
+    async def collect(self, records):
+        return [record async for record in records]
+
+    async def test_aparse_stream_reader(self):
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"one\ntwo\nthr")
+        reader.feed_data(b"ee\n")
+        reader.feed_eof()
+        records = await self.collect(aparse(reader, LINE, chunk_size=2))
+        self.assertEqual(records, [(0, b"one"), (4, b"two"), (8, b"three")])
+
+    async def test_aparse_resumes(self):
+        reader = asyncio.StreamReader()
+        records = aparse(reader, LINE)
+        reader.feed_data(b"one\ntw")
+        self.assertEqual(await anext(records), (0, b"one"))
+
+        pending = asyncio.ensure_future(anext(records))
+        await asyncio.sleep(0)
+        self.assertFalse(pending.done())
+        reader.feed_data(b"o\n")
+        self.assertEqual(await pending, (4, b"two"))
+
+        reader.feed_eof()
+        self.assertEqual(await self.collect(records), [])
+
+    async def test_aparse_async_iterable(self):
+        async def chunks():
+            for chunk in ["1", "2;3", "", "4;"]:
+                yield chunk
+
+        record = terminated(streaming.digit1, streaming.char(";"))
+        records = await self.collect(aparse(chunks(), record))
+        self.assertEqual(records, [(0, "12"), (3, "34")])
+
+    async def test_aparse_socket(self):
+        (receiving, sending) = socket.socketpair()
+        with sending:
+            (reader, writer) = await asyncio.open_connection(sock=receiving)
+            sending.sendall(b"".join(b"%d\n" % index for index in range(3)))
+            sending.shutdown(socket.SHUT_WR)
+            records = await self.collect(aparse(reader, LINE))
+            writer.close()
+
+        self.assertEqual(records, [(0, b"0"), (2, b"1"), (4, b"2")])
+
+    async def test_aparse_truncated(self):
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"one\ntw")
+        reader.feed_eof()
+        with self.assertRaises(Incomplete):
+            await self.collect(aparse(reader, LINE))
+
+    async def test_aparse_no_progress(self):
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"x")
+        self.assertEqual(await self.collect(aparse(reader, digit0)), [])
+
+
+class TestParseFile(unittest.TestCase):
+    def write(self, data: bytes) -> str:
+        (handle, path) = tempfile.mkstemp()
+        with os.fdopen(handle, "wb") as file:
+            file.write(data)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_map_file(self):
+        cursor = map_file(self.write(b"one\ntwo\n"))
+        self.assertIsInstance(cursor, Cursor)
+        self.assertIsInstance(cursor.buffer.obj, mmap.mmap)
+        self.assertTrue(cursor.buffer.readonly)
+        self.assertEqual(cursor, b"one\ntwo\n")
+
+    def test_map_file_empty(self):
+        self.assertEqual(map_file(self.write(b"")), b"")
+
+    def test_parse_file(self):
+        path = self.write(b"one\ntwo\n")
+        (remaining, value) = parse_file(path, terminated(take_until(b"\n"), tag(b"\n")))
+        # neither the value nor the remaining input are copied out of the map
+        self.assertIsInstance(value, memoryview)
+        self.assertIsInstance(value.obj, mmap.mmap)
+        self.assertEqual(bytes(value), b"one")
+        self.assertIsInstance(remaining, Cursor)
+        self.assertIs(remaining.buffer.obj, value.obj)
+        self.assertEqual(remaining.position, 4)
+
+    def test_parse_file_error(self):
+        path = self.write(b"one\ntwo")
+        with self.assertRaises(Error) as context:
+            parse_file(path, pair(tag(b"one\n"), tag(b"three")))
+        self.assertEqual(context.exception.kind, ErrorKind.TAG)
+        self.assertEqual(context.exception.remaining, b"two")
+
+    def test_parse_file_records(self):
+        path = self.write(b"".join(b"%d\n" % index for index in range(100)))
+        line = terminated(take_until(b"\n"), tag(b"\n"))
+        records = list(pariter(map_file(path), line))
+        self.assertEqual(records, [b"%d" % index for index in range(100)])
@@ -0,0 +1,194 @@
+"""
+Test cases for the `regex` module.
+"""
+import pickle
+import random
+import re
+import unittest
+from tests import assert_error
+from chew.branch import alt
+from chew.charclass import CharClass
+from chew.combine import map_res, noerr_value, optional, recognize, success
+from chew.cursor import Cursor
+from chew.error import Error, ErrorKind, ignoring_kind, returning
+from chew.generic import is_a, is_not, tag, take_while
+from chew.regex import (
+    Regex,
+    Regular,
+    compile_regular,
+    regex,
+    regex_captures,
+    regex_named,
+)
+from chew.repeat import many0, many0_count, many1, many1_count, separated_list1
+from chew.sequence import delimited, pair, preceded, separated_pair, terminated
+from chew.string import (
+    alpha1,
+    char,
+    digit0,
+    digit1,
+    multispace1,
+    none_of,
+    one_of,
+    satisfy,
+    space0,
+)
+
+
+class TestRegex(unittest.TestCase):
+    def test_regex(self):
+        self.assertEqual(regex(r"[a-z_]\w*")("name = 1"), (" = 1", "name"))
+
+    def test_regex_anchored(self):
+        with assert_error(self, Error(" name", ErrorKind.REGEX)):
+            regex(r"[a-z_]\w*")(" name")
+
+    def test_regex_on_exhausted(self):
+        with assert_error(self, Error("", ErrorKind.REGEX)):
+            regex(r"\d+")("")
+
+    def test_regex_empty_match(self):
+        self.assertEqual(regex(r"\d*")("abc"), ("abc", ""))
+
+    def test_regex_flags(self):
+        self.assertEqual(regex("select", re.IGNORECASE)("SELECT *"), (" *", "SELECT"))
+
+    def test_regex_compiled(self):
+        pattern = re.compile(r"\d+")
+        self.assertEqual(regex(pattern)("12a"), ("a", "12"))
+
+    def test_regex_bytes(self):
+        self.assertEqual(regex(rb"\d+")(b"12a"), (b"a", b"12"))
+
+    def test_regex_cursor(self):
+        (remaining, value) = regex(r"\d+")(Cursor("ab12c", 2))
+        self.assertEqual((remaining, value), ("c", "12"))
+        self.assertIsInstance(remaining, Cursor)
+
+    def test_regex_cursor_anchored(self):
+        with assert_error(self, Error("b12c", ErrorKind.REGEX)):
+            regex(r"\d+")(Cursor("ab12c", 1))
+
+    def test_regex_captures(self):
+        timestamp = regex_captures(r"(\d\d):(\d\d)(?::(\d\d))?")
+        self.assertEqual(timestamp("12:34 pm"), (" pm", ("12", "34", None)))
+
+    def test_regex_named(self):
+        version = regex_named(r"(?P<major>\d+)\.(?P<minor>\d+)")
+        self.assertEqual(version("3.11"), ("", {"major": "3", "minor": "11"}))
+
+    def test_regex_in_sequence(self):
+        assignment = separated_pair(regex(r"\w+"), char("="), regex(r"\d+"))
+        self.assertEqual(assignment(Cursor("a=12;"))[1], ("a", "12"))
+
+    def test_regex_node(self):
+        parser = regex(r"\d+")
+        self.assertIsInstance(parser, Regex)
+        self.assertEqual(parser.params, {"pattern": re.compile(r"\d+")})
+
+    def test_regex_pickle(self):
+        parser = pickle.loads(pickle.dumps(regex_named(r"(?P<n>\d+)")))
+        self.assertEqual(parser("1a"), ("a", {"n": "1"}))
+
+
+class TestCompileRegular(unittest.TestCase):
+    ALPHABET = "ab:.01()xyz \n"
+
+    def assert_equivalent(self, grammar, inputs=(), compiled=True):
+        regular = compile_regular(grammar)
+        if compiled:
+            self.assertIsInstance(regular, Regular)
+
+        generator = random.Random(0)
+        samples = [
+            "".join(generator.choices(self.ALPHABET, k=generator.randrange(12)))
+            for _ in range(300)
+        ]
+        for data in [*inputs, *samples]:
+            self.assertEqual(returning(regular)(data), returning(grammar)(data))
+
+    def test_timestamp(self):
+        fraction = optional(preceded(char("."), digit1))
+        timestamp = separated_pair(digit1, char(":"), pair(digit1, fraction))
+        (_, value) = compile_regular(timestamp)("12:30.5")
+        self.assertEqual(value, ("12", ("30", "5")))
+        self.assert_equivalent(timestamp, ["1:0", "1:0.", "1:"])
+
+    def test_address(self):
+        address = recognize(separated_list1(char("."), digit1))
+        self.assert_equivalent(address, ["10.0.0.1", "1.", "1..2", ".1"])
+
+    def test_ordered_choice(self):
+        keyword = alt([tag("ab"), tag("a"), one_of("xyz"), space0])
+        self.assert_equivalent(keyword, ["ab", "aab", "x", " "])
+
+    def test_no_backtracking(self):
+        self.assert_equivalent(pair(many0(one_of("ab")), char("b")), ["ab", "b"])
+        self.assert_equivalent(pair(alt([tag("a"), tag("ab")]), char("b")), ["ab"])
+        self.assert_equivalent(pair(optional(char("a")), char("a")), ["a", "aa"])
+
+    def test_repetitions(self):
+        self.assert_equivalent(many1(tag("ab")), ["abab", "aba", ""])
+        self.assert_equivalent(many0_count(one_of("01")), ["0101x"])
+        self.assert_equivalent(many1_count(char(" ")), ["  x", "x"])
+        self.assert_equivalent(terminated(many0(none_of(":")), char(":")), ["ab:"])
+
+    def test_classes(self):
+        self.assert_equivalent(
+            delimited(char("("), is_not(")"), char(")")), ["(ab)", "()", "(a"]
+        )
+        self.assert_equivalent(pair(alpha1, preceded(multispace1, digit0)))
+        self.assert_equivalent(pair(is_a("ab"), is_a(":.")), ["ab:", "ab"])
+
+    def test_values(self):
+        self.assert_equivalent(pair(noerr_value(1, tag("x")), success(2)), ["xy"])
+        self.assert_equivalent(many0(noerr_value(1, tag("a"))), ["aaab"])
+
+    def test_bytes(self):
+        grammar = pair(tag(b"\x00\xff"), is_a(b"\x01\x02"))
+        regular = compile_regular(grammar)
+        for data in [b"\x00\xff\x01\x02\x03", b"\x00\xff", b"\x00\xfe\x01"]:
+            self.assertEqual(returning(regular)(data), returning(grammar)(data))
+
+    def test_bytes_classes_kept(self):
+        digit = CharClass(range(ord("0"), ord("9") + 1))
+        for grammar in [
+            pair(one_of(digit), tag(b"x")),
+            pair(none_of(digit), tag(b"x")),
+            pair(satisfy(digit), tag(b"x")),
+        ]:
+            self.assertNotIsInstance(compile_regular(grammar), Regular)
+            for data in [b"1x", b"ax"]:
+                self.assertEqual(
+                    returning(compile_regular(grammar))(data), returning(grammar)(data)
+                )
+
+    def test_ignoring_other_kind_kept(self):
+        grammar = pair(ignoring_kind(is_a("ab"), ErrorKind.TAG, ""), tag("x"))
+        self.assertNotIsInstance(compile_regular(grammar), Regular)
+        self.assert_equivalent(grammar, ["abx", "x"], compiled=False)
+
+    def test_cursor(self):
+        grammar = separated_pair(digit1, char("="), alpha1)
+        (remaining, value) = compile_regular(grammar)(Cursor("; 1=ab;", 2))
+        self.assertEqual((remaining, value), (";", ("1", "ab")))
+        self.assertIsInstance(remaining, Cursor)
+
+    def test_sequence_input(self):
+        grammar = pair(tag("a"), tag("c"))
+        self.assertEqual(compile_regular(grammar)(["a", "c", "d"]), (["d"], ("a", "c")))
+
+    def test_irregular_kept(self):
+        number = map_res(recognize(pair(digit1, optional(char(".")))), float)
+        grammar = pair(number, take_while(str.isalpha))
+        compiled = compile_regular(grammar)
+        self.assertNotIsInstance(compiled, Regular)
+        self.assertIsInstance(compiled.parsers[0].child, Regular)
+        self.assert_equivalent(grammar, ["1.ab", "2x"], compiled=False)
+
+    def test_nullable_repetition_kept(self):
+        self.assertNotIsInstance(compile_regular(many0(digit0)), Regular)
+
+    def test_not_regular(self):
+        with self.assertRaises(ValueError):
+            Regular(take_while(str.isalpha))
@@ -136,6 +136,14 @@ class TestRepeat(unittest.TestCase):
     def test_length_data(self):
         self.assertEqual(length_data(int_literal)("3abcefg"), ("efg", "abc"))
 
+    def test_length_data_memoryview(self):
+        data = b"\x03abcefg"
+        (remaining, value) = length_data(lambda view: (view[1:], view[0]))(
+            memoryview(data)
+        )
+        self.assertEqual((value.obj, bytes(value)), (data, b"abc"))
+        self.assertEqual((remaining.obj, bytes(remaining)), (data, b"efg"))
+
     def test_length_data_on_tiny(self):
         with assert_error(self, Error("a", ErrorKind.EOF)):
             length_data(int_literal)("3a")
@@ -309,6 +317,14 @@ class TestRepeat(unittest.TestCase):
             parser("def|abc")
 
 
+    def test_many0_node(self):
+        parser = many0(tag("abc"))
+        self.assertEqual(parser.replace(child=tag("d"))("ddd;"), (";", ["d", "d", "d"]))
+
+    def test_fold_many1_node(self):
+        parser = fold_many1(tag("abc"), list, list_append)
+        self.assertIsInstance(parser.child, FoldMany0)
+
 def list_append(acc: list[T], item: T) -> list[T]:
     acc.append(item)
     return acc
@@ -107,3 +107,13 @@ class TestSequence(unittest.TestCase):
     def test_terminated_on_no_match(self):
         with assert_error(self, Error("123", ErrorKind.TAG)):
             terminated(tag("abc"), tag("efg"))("123")
+
+    def test_delimited_node(self):
+        (left, middle, right) = (tag("("), tag("a"), tag(")"))
+        parser = delimited(left, middle, right)
+        self.assertIsInstance(parser, Sequence)
+        self.assertEqual((parser.children, parser.keep), ((left, middle, right), 1))
+
+    def test_sequence_keep_indices(self):
+        parser = Sequence([alpha1, tag(","), digit1, tag(";")], (2, 0))
+        self.assertEqual(parser("abc,123;"), ("", ("123", "abc")))
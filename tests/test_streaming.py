@@ -0,0 +1,201 @@
+"""
+Test cases for the `streaming` module.
+"""
+import pickle
+import unittest
+from tests import assert_error
+from chew import streaming
+from chew.branch import alt
+from chew.combine import negate, optional
+from chew.cursor import Cursor
+from chew.error import Error, ErrorKind, Incomplete, with_kind
+from chew.precedence import precedence
+from chew.repeat import many0
+from chew.sequence import pair, terminated
+from chew.string import char, digit1
+from chew.types import END
+
+
+class TestIncomplete(unittest.TestCase):
+    def test_incomplete_error(self):
+        incomplete = Incomplete("ab", 2)
+        self.assertIsInstance(incomplete, Error)
+        self.assertEqual(incomplete.kind, ErrorKind.INCOMPLETE)
+        self.assertEqual(incomplete, Incomplete("ab", 2))
+        self.assertNotEqual(incomplete, Incomplete("ab", 1))
+        self.assertEqual(repr(incomplete), "Incomplete(remaining='ab', needed=2)")
+
+    def test_incomplete_kind(self):
+        incomplete = Incomplete("ab", None)
+        self.assertIs(incomplete.map_kind(ErrorKind.ALPHA), incomplete)
+        with assert_error(self, Incomplete("ab", 1)):
+            with_kind(streaming.alpha1, ErrorKind.TAG)("ab")
+
+    def test_incomplete_pickle(self):
+        incomplete = pickle.loads(pickle.dumps(Incomplete(Cursor("xab", 1), 3)))
+        self.assertEqual(incomplete, Incomplete(Cursor("xab", 1), 3))
+        self.assertEqual(incomplete.offset, 1)
+
+
+class TestStreaming(unittest.TestCase):
+    def test_take(self):
+        self.assertEqual(streaming.take(2)("abc"), ("c", "ab"))
+        with assert_error(self, Incomplete("a", 1)):
+            streaming.take(2)("a")
+
+    def test_tag(self):
+        self.assertEqual(streaming.tag("HTTP/")("HTTP/1.1"), ("1.1", "HTTP/"))
+        with assert_error(self, Incomplete("HTT", 2)):
+            streaming.tag("HTTP/")("HTT")
+        with assert_error(self, Error("HTX", ErrorKind.TAG)):
+            streaming.tag("HTTP/")("HTX")
+
+    def test_tag_bytes_cursor(self):
+        with assert_error(self, Incomplete(Cursor(b"xGE", 1), 1)):
+            streaming.tag(b"GET")(Cursor(b"xGE", 1))
+
+    def test_take_until(self):
+        self.assertEqual(streaming.take_until("\r\n")("ab\r\n"), ("\r\n", "ab"))
+        with assert_error(self, Incomplete("ab\r", None)):
+            streaming.take_until("\r\n")("ab\r")
+
+    def test_take_while(self):
+        parser = streaming.take_while(str.isdigit)
+        self.assertEqual(parser("12;"), (";", "12"))
+        with assert_error(self, Incomplete("12", 1)):
+            parser("12")
+        with assert_error(self, Incomplete("", 1)):
+            streaming.take_while1(str.isdigit)("")
+        with assert_error(self, Error(";", ErrorKind.TAKE_WHILE)):
+            streaming.take_while1(str.isdigit)(";")
+
+    def test_take_till(self):
+        self.assertEqual(streaming.take_till(lambda c: c == ";")("ab;"), (";", "ab"))
+        with assert_error(self, Incomplete("ab", 1)):
+            streaming.take_till1(lambda c: c == ";")("ab")
+
+    def test_is_a(self):
+        self.assertEqual(streaming.is_a("ab")("abc"), ("c", "ab"))
+        with assert_error(self, Incomplete("ab", 1)):
+            streaming.is_a("ab")("ab")
+        with assert_error(self, Incomplete("cd", 1)):
+            streaming.is_not("ab")("cd")
+
+    def test_char(self):
+        self.assertEqual(streaming.char("a")("a"), ("", "a"))
+        with assert_error(self, Incomplete("", 1)):
+            streaming.char("a")("")
+        with assert_error(self, Error("b", ErrorKind.CHAR)):
+            streaming.char("a")("b")
+        with assert_error(self, Incomplete("", 1)):
+            streaming.one_of("ab")("")
+
+    def test_string_classes(self):
+        self.assertEqual(streaming.digit1("12;"), (";", "12"))
+        with assert_error(self, Incomplete("12", 1)):
+            streaming.digit1("12")
+        with assert_error(self, Incomplete("", 1)):
+            streaming.alpha1("")
+        with assert_error(self, Error(";", ErrorKind.DIGIT)):
+            streaming.digit1(";")
+        with assert_error(self, Incomplete(" ", 1)):
+            streaming.space0(" ")
+
+    def test_line_ending(self):
+        self.assertEqual(streaming.line_ending("\r\nx"), ("x", "\r\n"))
+        with assert_error(self, Incomplete("\r", 1)):
+            streaming.line_ending("\r")
+        with assert_error(self, Incomplete("", 1)):
+            streaming.line_ending("")
+        with assert_error(self, Error("x", ErrorKind.CRLF)):
+            streaming.line_ending("x")
+        with assert_error(self, Incomplete("ab", 1)):
+            streaming.not_line_ending("ab")
+
+    def test_many0(self):
+        parser = streaming.many0(streaming.tag("ab"))
+        self.assertEqual(parser("ababx"), ("x", ["ab", "ab"]))
+        with assert_error(self, Incomplete("abab", None)):
+            parser("abab")
+        with assert_error(self, Incomplete("a", 1)):
+            parser("aba")
+
+    def test_many1(self):
+        parser = streaming.many1(streaming.digit1)
+        with assert_error(self, Incomplete("", 1)):
+            parser("")
+        with assert_error(self, Incomplete("", None)):
+            streaming.many1(digit1)("")
+        with assert_error(self, Error("x", ErrorKind.DIGIT)):
+            parser("x")
+        self.assertEqual(streaming.many1_count(streaming.char("a"))("aab"), ("b", 2))
+
+    def test_separated_list(self):
+        parser = streaming.separated_list1(streaming.char(","), streaming.digit1)
+        self.assertEqual(parser("1,2;"), (";", ["1", "2"]))
+        with assert_error(self, Incomplete("", 1)):
+            parser("1,")
+        with assert_error(self, Incomplete("2", 1)):
+            parser("1,2")
+        with assert_error(self, Incomplete("1,2", None)):
+            streaming.separated_list0(char(","), digit1)("1,2")
+
+    def test_fold_many0(self):
+        parser = streaming.fold_many0(streaming.char("a"), int, lambda n, _: n + 1)
+        self.assertEqual(parser("aab"), ("b", 2))
+        with assert_error(self, Incomplete("aa", None)):
+            parser("aa")
+
+    def test_first(self):
+        self.assertEqual(streaming.tag("ab").first(), frozenset(["a", END]))
+        self.assertEqual(streaming.char("a").first(), frozenset(["a", END]))
+        self.assertIsNone(streaming.take(1).first())
+
+
+class TestPropagation(unittest.TestCase):
+    def test_alt(self):
+        methods = alt([streaming.tag("GET"), streaming.tag("POST")])
+        self.assertEqual(methods("POST /"), (" /", "POST"))
+        with assert_error(self, Incomplete("PO", 2)):
+            methods("PO")
+        with assert_error(self, Incomplete("", 3)):
+            methods("")
+        with assert_error(self, Error("PUT", ErrorKind.TAG)):
+            methods("PUT")
+
+    def test_alt_complete(self):
+        with assert_error(self, Error("", ErrorKind.CHAR)):
+            alt([char("a"), char("b")])("")
+
+    def test_optional(self):
+        with assert_error(self, Incomplete("ab", 1)):
+            optional(streaming.tag("abc"))("ab")
+        self.assertEqual(optional(streaming.tag("abc"))("x"), ("x", None))
+
+    def test_negate(self):
+        with assert_error(self, Incomplete("ab", 1)):
+            negate(streaming.tag("abc"))("ab")
+
+    def test_complete_repeat(self):
+        with assert_error(self, Incomplete("a", 1)):
+            many0(streaming.tag("ab"))("aba")
+
+    def test_sequence(self):
+        with assert_error(self, Incomplete("", 1)):
+            terminated(digit1, streaming.char(";"))("12")
+        with assert_error(self, Incomplete("\r", 1)):
+            pair(streaming.alpha1, streaming.line_ending)("ab\r")
+
+    def test_precedence(self):
+        parser = precedence(
+            streaming.digit1, infix_ops=[(streaming.tag("**"), 2, 1)]
+        )
+        self.assertEqual(parser("1**2;"), (";", ("1", "**", "2")))
+        with assert_error(self, Incomplete("2", 1)):
+            parser("1**2")
+        with assert_error(self, Incomplete("*", 1)):
+            parser("1*")
+
+        parser = precedence(streaming.digit1, prefix_ops=[(streaming.tag("--"), 1)])
+        with assert_error(self, Incomplete("-", 1)):
+            parser("-")
@@ -3,8 +3,8 @@ Test cases for the `string` module.
 """
 import unittest
 from tests import assert_error
+from chew.cursor import Cursor
 from chew.string import *
-from chew.types import Result
 from chew.error import Error, ErrorKind
 
 
@@ -73,6 +73,11 @@ class TestChar(unittest.TestCase):
     def test_tag_no_case_weird_capitalization(self):
         self.assertEqual(tag_no_case("hello")("HeLlO, World!"), (", World!", "HeLlO"))
 
+    def test_tag_no_case_memoryview(self):
+        for data in [memoryview(b"HeLLo!"), Cursor(memoryview(b"HeLLo!"))]:
+            (remaining, value) = tag_no_case(b"hello")(data)
+            self.assertEqual((bytes(remaining), bytes(value)), (b"!", b"HeLLo"))
+
     def test_tag_no_case_no_match(self):
         with assert_error(self, Error("Something", ErrorKind.TAG)):
             tag_no_case("hello")("Something")
@@ -272,3 +277,18 @@ class TestChar(unittest.TestCase):
     def test_tab_on_exhausted(self):
         with assert_error(self, Error("", ErrorKind.CHAR)):
             tab("")
+
+
+class TestNodes(unittest.TestCase):
+    def test_char_node(self):
+        self.assertEqual(char("a").character, "a")
+
+    def test_digit1_children(self):
+        self.assertEqual(digit1.children, (digit0,))
+
+    def test_line_ending_children(self):
+        self.assertEqual(len(line_ending.children), 1)
+        alternatives = line_ending.children[0]
+        self.assertEqual(
+            [type(child).__name__ for child in alternatives.children], ["Char", "Tag"]
+        )
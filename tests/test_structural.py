@@ -0,0 +1,145 @@
+"""
+Test cases for the `structural` module.
+"""
+import importlib
+import importlib.util
+import mmap
+import pickle
+import unittest
+from chew.charclass import CharClass
+from chew.cursor import Cursor
+from chew.generic import tag, take_till
+from chew.repeat import many0, separated_list0
+from chew.sequence import terminated
+from chew.structural import *
+from chew.structural import _scanned, _vectorized
+
+CSV = b'a,"b,c",d\n1,"x""y\nz",,\n'
+TSV = b"a\\\tb\tc\\\\\td\n\\\n\t\n"
+
+
+class TestStructuralIndex(unittest.TestCase):
+    def test_index_unquoted(self):
+        index = structural_index(b"a,b\nc,,d\n")
+        self.assertEqual(list(index.offsets), [1, 3, 5, 6, 8])
+        self.assertEqual(len(index), 5)
+
+    def test_index_quoted(self):
+        index = structural_index(CSV, b",\n", quote=b'"')
+        self.assertEqual(list(index.offsets), [1, 7, 9, 11, 20, 21, 22])
+
+    def test_index_escaped(self):
+        index = structural_index(TSV, b"\t\n", escape=b"\\")
+        self.assertEqual(list(index.offsets), [4, 8, 10, 13, 14])
+
+    def test_index_quoted_escaped(self):
+        data = b'"a\\",b",\\"c,d\n'
+        index = structural_index(data, b",\n", quote=b'"', escape=b"\\")
+        self.assertEqual(list(index.offsets), [7, 11, 13])
+
+    def test_index_unterminated_quote(self):
+        index = structural_index(b'a,"b,c\nd', b",\n", quote=b'"')
+        self.assertEqual(list(index.offsets), [1])
+
+    def test_index_buffers(self):
+        expected = list(structural_index(CSV, quote=b'"').offsets)
+        for buffer in [bytearray(CSV), memoryview(CSV)]:
+            for quote in [None, b'"']:
+                offsets = structural_index(buffer, quote=quote).offsets
+                bytes_offsets = structural_index(CSV, quote=quote).offsets
+                self.assertEqual(list(offsets), list(bytes_offsets))
+        mapped = mmap.mmap(-1, len(CSV))
+        mapped.write(CSV)
+        self.assertEqual(list(structural_index(mapped, quote=b'"').offsets), expected)
+
+    def test_index_find(self):
+        index = structural_index(b"ab,c\nd")
+        found = [index.find(position) for position in range(7)]
+        self.assertEqual(found, [2, 2, 2, 4, 4, 6, 6])
+
+    def test_index_invalid(self):
+        with self.assertRaises(ValueError):
+            structural_index(b"", b"")
+        with self.assertRaises(ValueError):
+            structural_index(b"", quote=b"''")
+        with self.assertRaises(ValueError):
+            structural_index(b"", b",\n", escape=b",")
+
+    def test_index_pickle(self):
+        index = pickle.loads(pickle.dumps(structural_index(CSV, quote=b'"')))
+        self.assertEqual(repr(index), "StructuralIndex(b',\\n', b'\"', None)")
+        self.assertEqual(list(index.offsets), [1, 7, 9, 11, 20, 21, 22])
+
+
+class TestFields(unittest.TestCase):
+    def test_field(self):
+        data = b"ab,c\n"
+        parser = field(structural_index(data))
+        (remaining, value) = parser(Cursor(data))
+        self.assertEqual((remaining.position, value), (2, b"ab"))
+        (remaining, value) = parser(remaining)
+        self.assertEqual((remaining.position, value), (2, b""))
+        (remaining, value) = parser(Cursor(data, 5))
+        self.assertEqual((remaining.position, value), (5, b""))
+
+    def test_field_view(self):
+        data = memoryview(b"ab,c")
+        (_, value) = field(structural_index(data))(Cursor(data, 3))
+        self.assertIsInstance(value, memoryview)
+        self.assertEqual(bytes(value), b"c")
+
+    def test_fields(self):
+        index = structural_index(CSV, quote=b'"')
+        rows = many0(terminated(fields(index), tag(b"\n")))
+        (remaining, table) = rows(Cursor(CSV))
+        self.assertEqual(remaining.position, len(CSV))
+        self.assertEqual(
+            table, [[b"a", b'"b,c"', b"d"], [b"1", b'"x""y\nz"', b"", b""]]
+        )
+
+    def test_fields_end_of_buffer(self):
+        data = b"a,b\nc,d"
+        (remaining, values) = fields(structural_index(data))(Cursor(data, 4))
+        self.assertEqual((remaining.position, values), (7, [b"c", b"d"]))
+        (remaining, values) = fields(structural_index(data))(remaining)
+        self.assertEqual((remaining.position, values), (7, [b""]))
+
+    def test_fields_separated_list0(self):
+        data = b"x,,yy;z,\n,w;;v"
+        scanned = separated_list0(tag(b","), take_till(CharClass(b",;\n")))
+        jumping = fields(structural_index(data, b",;\n"), b",")
+        sequence = Cursor(data)
+        while len(sequence):
+            (remaining, values) = jumping(sequence)
+            self.assertEqual((remaining, values), scanned(sequence))
+            sequence = remaining[1:]
+
+    def test_fields_escaped(self):
+        index = structural_index(TSV, b"\t\n", escape=b"\\")
+        (remaining, values) = fields(index, b"\t")(Cursor(TSV))
+        expected = [b"a\\\tb", b"c\\\\", b"d"]
+        self.assertEqual((remaining.position, values), (10, expected))
+
+    def test_fields_other_buffer(self):
+        data = b"a,b"
+        parser = fields(structural_index(bytes(bytearray(data))))
+        with self.assertRaises(ValueError):
+            parser(Cursor(data))
+        with self.assertRaises(ValueError):
+            parser(b"a,b")
+
+
+@unittest.skipIf(importlib.util.find_spec("numpy") is None, "requires NumPy")
+class TestVectorized(unittest.TestCase):
+    def test_vectorized_scanned(self):
+        numpy = importlib.import_module("numpy")
+        for (data, quote, escape) in [
+            (CSV, None, None),
+            (CSV, b'"', None),
+            (TSV, None, b"\\"),
+            (b'"a\\",b",\\"c,d\n\\\\,', b'"', b"\\"),
+            (b"", b'"', b"\\"),
+        ]:
+            vectorized = _vectorized(numpy, data, b",\t\n", quote, escape)
+            scanned = _scanned(data, b",\t\n", quote, escape)
+            self.assertEqual(list(vectorized), list(scanned))